@@ -1,8 +1,8 @@
 import asyncio
 import os
-import json
 import re
 from datetime import datetime, timedelta
+from typing import List
 from dotenv import load_dotenv
 
 # Try to import required libraries
@@ -20,6 +20,36 @@ except ImportError:
     OPENAI_AVAILABLE = False
     openai = None
 
+try:
+    from src.utils.style_index import StyleIndex
+    STYLE_INDEX_AVAILABLE = True
+except ImportError:
+    STYLE_INDEX_AVAILABLE = False
+    StyleIndex = None
+
+from src.utils.rewrite_queue import RewriteQueue
+from src.storage.segment_log import SegmentedLog
+from src.storage.snapshot_files import SnapshotManifest, SnapshotLoader
+from src.storage.retention import RetentionPolicy, RetentionEngine
+from src.storage.checkpoint import CycleCheckpoint
+from src.utils.timeutils import parse_timestamp
+from src.utils.dedup import SeenTweets
+from src.utils.serialization import TweetRecord, RewriteRecord
+
+try:
+    from src.storage.sqlite_store import SQLiteStore
+    SQLITE_STORE_AVAILABLE = True
+except ImportError:
+    SQLITE_STORE_AVAILABLE = False
+    SQLiteStore = None
+
+try:
+    from src.storage.columnar import ColumnarArchive
+    COLUMNAR_AVAILABLE = True
+except ImportError:
+    COLUMNAR_AVAILABLE = False
+    ColumnarArchive = None
+
 class AITweetMonitor:
     """Advanced AI Tweet Monitor for tracking 100+ AI Twitter accounts with real Twitter API integration."""
     
@@ -34,6 +64,7 @@ class AITweetMonitor:
         
         # OpenAI credentials
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.openai_model = os.getenv('OPENAI_REWRITE_MODEL', 'gpt-3.5-turbo')
         
         # Initialize Twitter API client
         self.twitter_client = None
@@ -105,6 +136,52 @@ class AITweetMonitor:
         self.monitored_data = []
         self.top_performing_tweets = []
         
+        # Similarity index over top performers, used to pick style references
+        self.style_index = StyleIndex() if STYLE_INDEX_AVAILABLE else None
+        
+        # Rewrite candidates ranked by opportunity, fed as tweets arrive
+        self.rewrite_budget = 15
+        self.rewrite_queue = RewriteQueue(self.calculate_engagement_score)
+        
+        # Latest-cycle JSON snapshots read by the dashboards
+        self.snapshot_manifest = SnapshotManifest('.')
+        
+        # Append-only history of every cycle, one segmented log per record type
+        self.history_dir = os.getenv('TWEET_HISTORY_DIR', os.path.join('data', 'history'))
+        self.tweet_log = SegmentedLog(os.path.join(self.history_dir, 'tweets'), time_key='timestamp', record_type=TweetRecord)
+        self.analysis_log = SegmentedLog(os.path.join(self.history_dir, 'analysis'), time_key='analysis_timestamp')
+        self.rewrite_log = SegmentedLog(os.path.join(self.history_dir, 'rewrites'), time_key='generated_at', record_type=RewriteRecord)
+        self.top_tweet_log = SegmentedLog(os.path.join(self.history_dir, 'top_tweets'), time_key='timestamp', record_type=TweetRecord)
+        
+        # Tweet ids ingested in earlier cycles, so refetched tweets are dropped
+        self.seen_tweets = SeenTweets(self.history_dir)
+        
+        # Progress of the cycle in flight, so an interrupted cycle can resume
+        self.checkpoint = CycleCheckpoint(os.path.join(self.history_dir, 'cycle_checkpoint.ndjson'))
+        
+        # Indexed SQLite store for range queries from dashboards and analyzers
+        self.store = None
+        if SQLITE_STORE_AVAILABLE:
+            try:
+                self.store = SQLiteStore(os.getenv('TWEET_DB_PATH', 'ai_monitor.db'))
+            except Exception as e:
+                self.log_status(f"⚠️ SQLite store unavailable: {str(e)}", "WARNING")
+        
+        # Date-partitioned Parquet archive for historical analytics
+        self.archive = None
+        if COLUMNAR_AVAILABLE:
+            self.archive = ColumnarArchive(os.getenv('TWEET_COLUMNAR_DIR', os.path.join('data', 'columnar')))
+        
+        # Keeps raw history for a bounded window, downsampling what ages out
+        self.retention = RetentionEngine(
+            RetentionPolicy.from_env(),
+            self.history_dir,
+            self.tweet_log,
+            other_logs=[self.analysis_log, self.rewrite_log, self.top_tweet_log],
+            store=self.store,
+            archive=self.archive
+        )
+        
     def log_status(self, message, level="INFO"):
         """Log status messages with timestamps."""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -214,8 +291,17 @@ class AITweetMonitor:
             'engagement_rate': round(engagement / random.randint(1000, 10000), 4)
         }]
     
-    async def fetch_ai_tweets(self, limit=50):
-        """Fetch tweets from monitored AI accounts using real Twitter API or simulation."""
+    async def fetch_ai_tweets(self, limit=50, checkpoint=None):
+        """Fetch tweets from monitored AI accounts using real Twitter API or simulation.
+        
+        With a checkpoint, accounts it already records are restored instead of
+        refetched, and every newly fetched account is recorded in it.
+        
+        Returns every tweet fetched this cycle, so analysis and top-tweet
+        selection see the full window; only tweets not ingested in earlier
+        cycles are queued for rewrites and kept in `monitored_data`.
+        `save_data` persists just those.
+        """
         self.log_status(f"🔄 Starting tweet fetch for {len(self.ai_accounts)} AI accounts...", "INFO")
         
         if self.twitter_enabled:
@@ -224,26 +310,43 @@ class AITweetMonitor:
             self.log_status("🎭 Using simulated data (Twitter API not available)", "INFO")
         
         tweets = []
+        duplicates = 0
         # Fetch from a subset to avoid overwhelming the system and API limits
         selected_accounts = self.ai_accounts[:limit] if limit else self.ai_accounts
         
+        accounts_done = set()
+        if checkpoint is not None and checkpoint.state['accounts_done']:
+            tweets = list(checkpoint.state['tweets'])
+            accounts_done = set(checkpoint.state['accounts_done'])
+            self.rewrite_queue.push_many(self.seen_tweets.unseen(tweets))
+            self.log_status(f"♻️ Resuming fetch: {len(accounts_done)} accounts and {len(tweets)} tweets restored from checkpoint", "INFO")
+        
         for i, account in enumerate(selected_accounts):
+            if account in accounts_done:
+                continue
             try:
                 if self.twitter_enabled:
                     # Use real Twitter API
                     tweet_data = await self.fetch_real_tweets(account, max_tweets=3)
                     if tweet_data:
-                        tweets.extend(tweet_data)
                         self.log_status(f"📱 Fetched {len(tweet_data)} real tweets from @{account}", "INFO")
                     else:
                         # Fallback to simulation if real fetch fails
                         tweet_data = await self.simulate_tweet_fetch(account)
-                        tweets.extend(tweet_data)
                         self.log_status(f"🎭 Used simulated data for @{account}", "WARNING")
                 else:
                     # Use simulated data
                     tweet_data = await self.simulate_tweet_fetch(account)
-                    tweets.extend(tweet_data)
+                
+                # Tweets already ingested stay in the cycle's analysis but are
+                # not queued or stored again
+                fresh = self.seen_tweets.unseen(tweet_data)
+                duplicates += len(tweet_data) - len(fresh)
+                
+                tweets.extend(tweet_data)
+                self.rewrite_queue.push_many(fresh)
+                if checkpoint is not None:
+                    checkpoint.record_account(account, tweet_data)
                 
                 # Progress update every 10 accounts
                 if (i + 1) % 10 == 0:
@@ -258,10 +361,29 @@ class AITweetMonitor:
                 # Continue with next account
                 continue
         
-        self.monitored_data.extend(tweets)
+        self.monitored_data.extend(self.seen_tweets.unseen(tweets))
+        self.trim_monitored_data()
+        if duplicates:
+            self.log_status(f"🔁 {duplicates} tweets were already seen in earlier cycles and will not be stored again", "INFO")
         self.log_status(f"✅ Successfully collected {len(tweets)} tweets from {len(selected_accounts)} accounts", "SUCCESS")
         return tweets
     
+    def trim_monitored_data(self):
+        """Drop in-memory tweets and queued rewrites older than the raw retention window."""
+        cutoff = self.retention.policy.raw_cutoff()
+        self.monitored_data = [t for t in self.monitored_data if parse_timestamp(t.get('timestamp')) >= cutoff]
+        self.rewrite_queue.trim(cutoff)
+    
+    def calculate_engagement_score(self, tweet):
+        """Combined engagement score (likes, retweets, replies, quotes)."""
+        return (
+            tweet.get('likes', 0) * 1.0 +
+            tweet.get('retweets', 0) * 2.0 +  # Retweets weighted higher
+            tweet.get('replies', 0) * 1.5 +
+            tweet.get('quotes', 0) * 1.5 +  # Include quotes if available
+            tweet.get('engagement', 0) * 0.5
+        )
+    
     def identify_top_performing_tweets(self, tweets, top_n=10):
         """Identify top-performing tweets based on engagement metrics."""
         if not tweets:
@@ -270,24 +392,43 @@ class AITweetMonitor:
         # Sort by engagement score (combination of likes, retweets, replies)
         scored_tweets = []
         for tweet in tweets:
-            engagement_score = (
-                tweet.get('likes', 0) * 1.0 +
-                tweet.get('retweets', 0) * 2.0 +  # Retweets weighted higher
-                tweet.get('replies', 0) * 1.5 +
-                tweet.get('quotes', 0) * 1.5 +  # Include quotes if available
-                tweet.get('engagement', 0) * 0.5
-            )
-            tweet['engagement_score'] = engagement_score
+            tweet['engagement_score'] = self.calculate_engagement_score(tweet)
             scored_tweets.append(tweet)
         
         # Get top performing tweets
         top_tweets = sorted(scored_tweets, key=lambda x: x['engagement_score'], reverse=True)[:top_n]
         self.top_performing_tweets = top_tweets
+        if self.style_index is not None:
+            self.style_index.sync(top_tweets)
         
         self.log_status(f"🏆 Identified {len(top_tweets)} top-performing tweets", "SUCCESS")
         return top_tweets
     
-    async def rewrite_tweet_with_ai(self, original_tweet, style_reference):
+    async def stream_llm_rewrite(self, original_tweet, style_reference, on_token=None):
+        """Rewrite a tweet with the OpenAI chat API, passing each token to on_token as it arrives."""
+        client = openai.AsyncOpenAI(api_key=self.openai_api_key)
+        stream = await client.chat.completions.create(
+            model=self.openai_model,
+            messages=[
+                {"role": "system", "content": "You rewrite tweets about AI to be more engaging. Keep the original meaning, stay under 280 characters and return only the rewritten tweet."},
+                {"role": "user", "content": f"Rewrite this tweet:\n{original_tweet['content']}\n\nMatch the style of this high-performing tweet:\n{style_reference['content']}"}
+            ],
+            temperature=0.7,
+            max_tokens=120,
+            stream=True
+        )
+        
+        parts = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                if on_token:
+                    on_token(delta)
+        
+        return ''.join(parts).strip()
+    
+    async def rewrite_tweet_with_ai(self, original_tweet, style_reference, on_token=None):
         """Use AI to rewrite a tweet based on top-performing tweet style."""
         if not self.openai_enabled:
             # Fallback to rule-based rewriting if no OpenAI
@@ -295,16 +436,18 @@ class AITweetMonitor:
             return self.rule_based_rewrite(original_tweet, style_reference)
         
         try:
-            # For now, simulate AI rewriting since we don't have OpenAI installed
-            # In production, this would make an actual API call
-            rewritten = self.simulate_ai_rewrite(original_tweet, style_reference)
+            rewritten = await self.stream_llm_rewrite(original_tweet, style_reference, on_token)
+            rewrite_method = 'AI-powered'
+            if not rewritten:
+                rewritten = self.simulate_ai_rewrite(original_tweet, style_reference)
+                rewrite_method = 'AI-powered (simulated)'
             
             return {
                 'original': original_tweet['content'],
                 'rewritten': rewritten,
                 'style_reference': style_reference['content'],
                 'improvement_potential': 'High',
-                'rewrite_method': 'AI-powered (simulated)' if not OPENAI_AVAILABLE else 'AI-powered'
+                'rewrite_method': rewrite_method
             }
             
         except Exception as e:
@@ -429,32 +572,77 @@ class AITweetMonitor:
             'rewrite_method': 'Rule-based'
         }
     
-    async def generate_tweet_rewrites(self, tweets, top_tweets):
-        """Generate rewritten versions of tweets based on top performers."""
+    async def stream_tweet_rewrites(self, tweets, top_tweets, on_token=None, budget=None):
+        """Yield rewrites one at a time as they complete.
+        
+        on_token, if given, is called as on_token(index, text) with each token of
+        the index-th rewrite while an LLM is generating it. budget defaults to
+        rewrite_budget.
+        """
         if not tweets or not top_tweets:
-            return []
+            return
         
-        self.log_status("✍️ Generating tweet rewrites based on top performers...", "INFO")
+        # Tweets normally arrive through fetch_ai_tweets; already queued or
+        # rewritten tweets are skipped here
+        self.rewrite_queue.push_many(tweets)
         
-        rewrites = []
-        # Select tweets that could be improved (lower engagement)
-        avg_engagement = sum(t.get('engagement_score', 0) for t in tweets) / len(tweets)
-        low_engagement_tweets = [t for t in tweets if t.get('engagement_score', 0) < avg_engagement]
+        # Spend the rewrite budget on the highest-opportunity tweets
+        candidates = self.rewrite_queue.pop_top(self.rewrite_budget if budget is None else budget)
         
-        for i, tweet in enumerate(low_engagement_tweets[:15]):  # Limit to 15 rewrites
-            # Pick a random top performer as style reference
-            import random
-            style_ref = random.choice(top_tweets)
+        # Match every candidate to its most similar top performer in one batch query
+        if self.style_index is not None:
+            self.style_index.sync(top_tweets)
+            style_refs = self.style_index.query_batch(candidates)
+        else:
+            style_refs = [None] * len(candidates)
+        
+        for i, (tweet, style_ref) in enumerate(zip(candidates, style_refs)):
+            if style_ref is None:
+                # Fall back to a random top performer as style reference
+                import random
+                style_ref = random.choice(top_tweets)
             
-            rewrite_result = await self.rewrite_tweet_with_ai(tweet, style_ref)
+            token_callback = (lambda text, index=i: on_token(index, text)) if on_token else None
+            rewrite_result = await self.rewrite_tweet_with_ai(tweet, style_ref, token_callback)
             rewrite_result['original_account'] = tweet['account']
             rewrite_result['reference_account'] = style_ref['account']
             rewrite_result['original_engagement'] = tweet.get('engagement_score', 0)
             rewrite_result['reference_engagement'] = style_ref.get('engagement_score', 0)
+            self.rewrite_queue.mark_rewritten(tweet, rewrite_result)
+            yield rewrite_result
+    
+    async def generate_tweet_rewrites(self, tweets, top_tweets, checkpoint=None):
+        """Generate rewritten versions of tweets based on top performers.
+        
+        With a checkpoint, rewrites it already records are kept and count
+        against the budget, and every new rewrite is recorded in it.
+        """
+        if not tweets or not top_tweets:
+            return []
+        
+        self.log_status("✍️ Generating tweet rewrites based on top performers...", "INFO")
+        
+        rewrites = []
+        if checkpoint is not None and checkpoint.state['rewrites']:
+            rewrites = list(checkpoint.state['rewrites'])
+            by_content = {(t['account'], t['content']): t for t in tweets}
+            for rewrite in rewrites:
+                tweet = by_content.get((rewrite.get('original_account'), rewrite.get('original')))
+                if tweet is not None:
+                    self.rewrite_queue.mark_rewritten(tweet, rewrite)
+            self.log_status(f"♻️ Resuming rewrites: {len(rewrites)} restored from checkpoint", "INFO")
+        
+        remaining = self.rewrite_budget - len(rewrites)
+        if remaining <= 0:
+            return rewrites
+        
+        async for rewrite_result in self.stream_tweet_rewrites(tweets, top_tweets, budget=remaining):
             rewrites.append(rewrite_result)
+            if checkpoint is not None:
+                checkpoint.record_rewrite(rewrite_result)
             
-            if (i + 1) % 5 == 0:
-                self.log_status(f"✍️ Generated {i + 1} tweet rewrites...", "INFO")
+            if len(rewrites) % 5 == 0:
+                self.log_status(f"✍️ Generated {len(rewrites)} tweet rewrites...", "INFO")
         
         self.log_status(f"✅ Generated {len(rewrites)} tweet rewrites", "SUCCESS")
         return rewrites
@@ -536,33 +724,111 @@ class AITweetMonitor:
             'bottom_10_percent_threshold': engagements[int(len(engagements)*0.1)] if len(engagements) > 10 else min(engagements)
         }
     
+    def append_history(self, tweets, analysis, rewrites=None, top_tweets=None):
+        """Append this cycle's records to the segmented history logs."""
+        cycle_time = analysis.get('analysis_timestamp') or datetime.now().isoformat()
+        
+        self.tweet_log.append(tweets)
+        if analysis:
+            self.analysis_log.append([analysis])
+        if rewrites:
+            self.rewrite_log.append([dict(r, generated_at=cycle_time) for r in rewrites])
+        if top_tweets:
+            self.top_tweet_log.append(top_tweets)
+    
+    def save_rewrites(self, rewrites):
+        """Persist rewrites generated outside a monitoring cycle, e.g. streamed by the dashboard.
+        
+        They are appended to the rewrite log and published ahead of the
+        current rewrite snapshot, since their tweets are already marked rewritten.
+        """
+        if not rewrites:
+            return
+        
+        generated_at = datetime.now().isoformat()
+        self.rewrite_log.append([dict(r, generated_at=generated_at) for r in rewrites])
+        
+        previous = SnapshotLoader(self.snapshot_manifest.directory).load('ai_tweet_rewrites.json', default=[])
+        generation = self.snapshot_manifest.write_snapshots(
+            {'ai_tweet_rewrites.json': list(rewrites) + (previous or [])},
+            schemas={'ai_tweet_rewrites.json': List[RewriteRecord]}
+        )
+        self.log_status(f"💾 Saved {len(rewrites)} rewrites (generation {generation})", "SUCCESS")
+    
     def save_data(self, tweets, analysis, rewrites=None, top_tweets=None):
-        """Save all collected data to JSON files."""
-        # Save tweets
-        with open('ai_tweets_data.json', 'w', encoding='utf-8') as f:
-            json.dump(tweets, f, indent=2, ensure_ascii=False)
+        """Append the cycle to the history logs and save the latest snapshot to JSON files.
         
-        # Save analysis
-        with open('ai_trends_analysis.json', 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2, ensure_ascii=False)
+        Only tweets not ingested in earlier cycles are appended to the history
+        log and the archive; the snapshots cover the whole cycle, and a quiet
+        cycle with nothing to show leaves the previous snapshots in place.
+        """
+        new_tweets = self.seen_tweets.filter_new(tweets)
+        try:
+            self.append_history(new_tweets, analysis, rewrites, top_tweets)
+        except Exception as e:
+            self.log_status(f"⚠️ Failed to append history log: {str(e)}", "WARNING")
         
-        # Save rewrites if available
-        if rewrites:
-            with open('ai_tweet_rewrites.json', 'w', encoding='utf-8') as f:
-                json.dump(rewrites, f, indent=2, ensure_ascii=False)
+        # Persisted only once the cycle's tweets are saved, so a crash before
+        # this point lets the next run fetch them again
+        try:
+            self.seen_tweets.save()
+        except Exception as e:
+            self.log_status(f"⚠️ Failed to save seen tweet ids: {str(e)}", "WARNING")
         
-        # Save top tweets if available
-        if top_tweets:
-            with open('ai_top_tweets.json', 'w', encoding='utf-8') as f:
-                json.dump(top_tweets, f, indent=2, ensure_ascii=False)
+        if self.store:
+            try:
+                # Upserting refreshes the engagement counts of tweets seen before
+                self.store.upsert_tweets(tweets)
+                if analysis:
+                    self.store.save_analysis(analysis)
+            except Exception as e:
+                self.log_status(f"⚠️ Failed to update SQLite store: {str(e)}", "WARNING")
         
-        files_saved = ['ai_tweets_data.json', 'ai_trends_analysis.json']
+        if self.archive:
+            try:
+                self.archive.export_tweets(new_tweets)
+                # Days before today no longer receive exports, so merge their parts
+                self.archive.compact('tweets')
+            except Exception as e:
+                self.log_status(f"⚠️ Failed to export columnar snapshot: {str(e)}", "WARNING")
+        
+        try:
+            report = self.retention.run()
+            if report['raw_expired'] or report['rows_pruned'] or report['partitions_dropped']:
+                self.log_status(
+                    f"🧹 Retention: expired {report['raw_expired']} raw tweets into {report['hourly_rollups']} hourly rollups, "
+                    f"pruned {report['rows_pruned']} DB rows, dropped {report['partitions_dropped']} archive days", "INFO"
+                )
+            if report['over_budget']:
+                self.log_status(f"⚠️ History uses {report['disk_usage'] // (1024 * 1024)} MB, over the disk budget", "WARNING")
+        except Exception as e:
+            self.log_status(f"⚠️ Retention pass failed: {str(e)}", "WARNING")
+        
+        # Save tweets and analysis, plus rewrites and top tweets if available;
+        # empty payloads would blank the dashboards, so they are not published
+        snapshots = {}
+        if tweets:
+            snapshots['ai_tweets_data.json'] = tweets
+        if analysis:
+            snapshots['ai_trends_analysis.json'] = analysis
         if rewrites:
-            files_saved.append('ai_tweet_rewrites.json')
+            snapshots['ai_tweet_rewrites.json'] = rewrites
         if top_tweets:
-            files_saved.append('ai_top_tweets.json')
-        
-        self.log_status(f"💾 Data saved to {', '.join(files_saved)}", "SUCCESS")
+            snapshots['ai_top_tweets.json'] = top_tweets
+        if not snapshots:
+            self.log_status("💤 Nothing fetched this cycle, keeping the previous snapshots", "INFO")
+            return
+        
+        # Files are replaced atomically and published under a new manifest
+        # generation, so dashboards never read a half-written file
+        generation = self.snapshot_manifest.write_snapshots(snapshots, schemas={
+            'ai_tweets_data.json': List[TweetRecord],
+            'ai_tweet_rewrites.json': List[RewriteRecord],
+            'ai_top_tweets.json': List[TweetRecord]
+        })
+        
+        files_saved = list(snapshots)
+        self.log_status(f"💾 Data saved to {', '.join(files_saved)} (generation {generation}, history in {self.history_dir})", "SUCCESS")
     
     def display_summary(self, analysis, rewrites=None, top_tweets=None):
         """Display comprehensive summary including rewrite insights."""
@@ -618,24 +884,30 @@ class AITweetMonitor:
         self.log_status("🚀 Starting Enhanced AI Tweet Monitor with Real Twitter API...", "INFO")
         
         try:
+            # Resume the previous cycle if it was interrupted
+            checkpoint = self.checkpoint
+            checkpoint.start()
+            
             # Fetch tweets (limit to 20 accounts for API rate limits)
-            tweets = await self.fetch_ai_tweets(limit=20)
+            tweets = await self.fetch_ai_tweets(limit=20, checkpoint=checkpoint)
             
-            # Identify top performers
+            # Identify top performers (cheap and deterministic over the
+            # checkpointed tweets, so recomputed rather than stored)
             self.log_status("🏆 Identifying top-performing tweets...", "INFO")
             top_tweets = self.identify_top_performing_tweets(tweets)
             
             # Generate rewrites if requested
             rewrites = None
             if include_rewrites:
-                rewrites = await self.generate_tweet_rewrites(tweets, top_tweets)
+                rewrites = await self.generate_tweet_rewrites(tweets, top_tweets, checkpoint=checkpoint)
             
             # Analyze trends
             self.log_status("🔍 Analyzing trends and engagement patterns...", "INFO")
             analysis = self.analyze_trends(tweets)
             
-            # Save data
+            # Save data, after which there is nothing left to resume
             self.save_data(tweets, analysis, rewrites, top_tweets)
+            checkpoint.clear()
             
             # Display summary
             self.display_summary(analysis, rewrites, top_tweets)
@@ -0,0 +1,84 @@
+"""Measure import time of the app's entry modules.
+
+Runs each module import in a fresh interpreter with `python -X importtime`
+and reports the cumulative time, the slowest imports it pulled in and which
+heavy optional dependencies got loaded. Use `--budget-ms` to fail (exit 1)
+when an entry module gets slower than the budget, e.g. in CI; a module that
+fails to import also fails the run.
+
+    python benchmark_imports.py
+    python benchmark_imports.py --budget-ms 500 src.agents.mcp_agent
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    'src.agents.mcp_agent',
+    'src.agents.fetchers.registry',
+]
+
+# Dependencies that should only be imported when a source that needs them is enabled
+HEAVY_MODULES = ['tweepy', 'praw', 'playwright', 'bs4', 'lxml', 'pandas', 'openai']
+
+
+def measure(module: str):
+    """Cumulative import time of `module` in microseconds, per-import self times and loaded heavy modules."""
+    code = (
+        f"import {module}, sys; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    imports = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((int(self_us), name.strip()))
+        if name.strip() == module:
+            total = int(cumulative_us)
+    heavy = [m for m in result.stdout.strip().split(',') if m]
+    return total, imports, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('--runs', type=int, default=3, help='imports per module; the median is reported')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports to list')
+    parser.add_argument('--budget-ms', type=float, help='fail if a module imports slower than this')
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        try:
+            runs = [measure(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"\n📦 {module}: ❌ import failed: {e}")
+            failed = True
+            continue
+        total_ms = statistics.median(run[0] for run in runs) / 1000
+        _, imports, heavy = runs[-1]
+
+        print(f"\n📦 {module}: {total_ms:.1f} ms")
+        print(f"   Heavy modules loaded: {', '.join(heavy) or 'none'}")
+        for self_us, name in sorted(imports, reverse=True)[:args.top]:
+            print(f"   {self_us / 1000:8.1f} ms  {name}")
+
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            print(f"   ❌ Over budget of {args.budget_ms:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 import os
-import json
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from src.utils.serialization import loads
 
 def check_ai_tweet_monitor_status():
     """Check the status of the Enhanced AI Tweet Monitor system."""
@@ -49,8 +49,8 @@ def check_ai_tweet_monitor_status():
     # Check recent activity
     if os.path.exists("ai_trends_analysis.json"):
         try:
-            with open("ai_trends_analysis.json", 'r', encoding='utf-8') as f:
-                analysis = json.load(f)
+            with open("ai_trends_analysis.json", 'rb') as f:
+                analysis = loads(f.read())
             
             print("📈 Latest Analysis Summary:")
             print(f"   Total Tweets: {analysis.get('total_tweets', 0)}")
@@ -75,8 +75,8 @@ def check_ai_tweet_monitor_status():
     # Check rewrite data
     if os.path.exists("ai_tweet_rewrites.json"):
         try:
-            with open("ai_tweet_rewrites.json", 'r', encoding='utf-8') as f:
-                rewrites = json.load(f)
+            with open("ai_tweet_rewrites.json", 'rb') as f:
+                rewrites = loads(f.read())
             
             print(f"\n✍️ Tweet Rewrite Summary:")
             print(f"   Total Rewrites: {len(rewrites)}")
@@ -124,8 +124,8 @@ def show_rewrite_examples():
         return
     
     try:
-        with open("ai_tweet_rewrites.json", 'r', encoding='utf-8') as f:
-            rewrites = json.load(f)
+        with open("ai_tweet_rewrites.json", 'rb') as f:
+            rewrites = loads(f.read())
         
         if not rewrites:
             print("✍️ No rewrites in data file.")
@@ -161,8 +161,8 @@ def show_top_performers():
         return
     
     try:
-        with open("ai_top_tweets.json", 'r', encoding='utf-8') as f:
-            top_tweets = json.load(f)
+        with open("ai_top_tweets.json", 'rb') as f:
+            top_tweets = loads(f.read())
         
         if not top_tweets:
             print("🏆 No top tweets in data file.")
@@ -188,8 +188,8 @@ def show_quick_stats():
         return
     
     try:
-        with open("ai_tweets_data.json", 'r', encoding='utf-8') as f:
-            tweets = json.load(f)
+        with open("ai_tweets_data.json", 'rb') as f:
+            tweets = loads(f.read())
         
         if not tweets:
             print("📊 No tweets in data file.")
@@ -1,43 +1,22 @@
-import json
-import os
 from datetime import datetime
+from src.storage.snapshot_files import SnapshotLoader, atomic_write_bytes
 
 def create_enhanced_dashboard():
     """Create an enhanced HTML dashboard for the AI Tweet Monitor with rewrite features."""
     
-    # Load data files
-    tweets_data = []
-    analysis_data = {}
-    rewrites_data = []
-    top_tweets_data = []
+    # Load data files (written atomically by the monitor, so never truncated)
+    loader = SnapshotLoader('.')
     
-    try:
-        if os.path.exists('ai_tweets_data.json'):
-            with open('ai_tweets_data.json', 'r', encoding='utf-8') as f:
-                tweets_data = json.load(f)
-    except:
-        pass
+    def load(filename, default):
+        try:
+            return loader.load(filename, default)
+        except Exception:
+            return default
     
-    try:
-        if os.path.exists('ai_trends_analysis.json'):
-            with open('ai_trends_analysis.json', 'r', encoding='utf-8') as f:
-                analysis_data = json.load(f)
-    except:
-        pass
-    
-    try:
-        if os.path.exists('ai_tweet_rewrites.json'):
-            with open('ai_tweet_rewrites.json', 'r', encoding='utf-8') as f:
-                rewrites_data = json.load(f)
-    except:
-        pass
-    
-    try:
-        if os.path.exists('ai_top_tweets.json'):
-            with open('ai_top_tweets.json', 'r', encoding='utf-8') as f:
-                top_tweets_data = json.load(f)
-    except:
-        pass
+    tweets_data = load('ai_tweets_data.json', [])
+    analysis_data = load('ai_trends_analysis.json', {})
+    rewrites_data = load('ai_tweet_rewrites.json', [])
+    top_tweets_data = load('ai_top_tweets.json', [])
     
     # Generate HTML
     html_content = f"""
@@ -508,8 +487,7 @@ def create_enhanced_dashboard():
     """
     
     # Save the dashboard
-    with open('dashboard.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    atomic_write_bytes('dashboard.html', html_content.encode('utf-8'))
     
     print("✅ Enhanced dashboard created successfully!")
     print("📊 Features included:")
@@ -3,14 +3,18 @@ from typing import List, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
 from ..models import API, APIChange
+from ..utils.serialization import loads
+from ..utils.content_hash import ContentHashStore
+from ..utils.html_parsing import strip_tags
 import openai
-from bs4 import BeautifulSoup
 import re
 
 class ContentExtractor:
     def __init__(self, db: Session, config: Dict[str, Any]):
         self.db = db
         self.config = config
+        # Hash of each tool's name and description when it was last extracted
+        self.content_hashes = ContentHashStore.shared()
         self.setup_logging()
         self.setup_openai()
 
@@ -35,7 +39,7 @@ class ContentExtractor:
         text = re.sub(r'\s+', ' ', text)
         
         # Remove HTML tags
-        text = BeautifulSoup(text, 'html.parser').get_text()
+        text = strip_tags(text)
         
         # Remove special characters
         text = re.sub(r'[^\w\s.,!?-]', '', text)
@@ -76,8 +80,7 @@ class ContentExtractor:
             
             pricing_info = response.choices[0].message.content.strip()
             # Parse the JSON response
-            import json
-            return json.loads(pricing_info)
+            return loads(pricing_info)
         except Exception as e:
             self.logger.error(f"Error extracting pricing: {str(e)}")
             return {}
@@ -129,8 +132,15 @@ class ContentExtractor:
     def process_all_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process all tools and update database."""
         processed_tools = []
+        skipped = 0
         
         for tool in tools:
+            # Unchanged tools were already extracted; skip the LLM calls
+            digest = self.content_hashes.digest(f"{tool.get('name', '')}\n{tool.get('description', '')}")
+            if tool.get('url') and self.content_hashes.get('extracted', tool['url']) == digest:
+                skipped += 1
+                continue
+            
             try:
                 processed_tool = self.process_tool(tool)
                 
@@ -163,9 +173,14 @@ class ContentExtractor:
                 
                 self.db.commit()
                 processed_tools.append(processed_tool)
+                if tool.get('url'):
+                    self.content_hashes.set('extracted', tool['url'], digest)
                 
             except Exception as e:
                 self.logger.error(f"Error processing tool {tool.get('name', 'unknown')}: {str(e)}")
                 self.db.rollback()
         
+        self.content_hashes.save()
+        if skipped:
+            self.logger.info(f"Skipped {skipped} tools unchanged since their last extraction")
         return processed_tools 
\ No newline at end of file
@@ -2,14 +2,24 @@ import logging
 from typing import List, Dict, Any
 from datetime import datetime
 import aiohttp
-from bs4 import BeautifulSoup
 import asyncio
+from ...utils.http_client import HTTPClientManager
+from ...utils.http_cache import HTTPCache
+from ...utils.content_hash import ContentHashStore
+from ...utils.text import normalize_whitespace
+from ...utils.serialization import ToolRecord
 
 class BaseFetcher:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.setup_logging()
         self.session = None
+        # Conditional-request cache; set `http_cache: False` in config to disable
+        self.http_cache = HTTPCache.shared() if self.config.get('http_cache', True) else None
+        # Page and card hashes from the last run, to skip unchanged content
+        self.content_hashes = ContentHashStore.shared()
+        # Seconds fetch() may take under EnhancedFetcherAgent; None uses the agent's default
+        self.fetch_deadline = None
 
     def setup_logging(self):
         """Setup logging for the fetcher."""
@@ -24,21 +34,29 @@ class BaseFetcher:
             self.logger.setLevel(logging.INFO)
 
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        """Get the pooled aiohttp session shared by all fetchers."""
+        self.session = await HTTPClientManager.shared().session()
         return self.session
 
     async def close(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Release this fetcher's resources.
 
-    async def fetch(self) -> List[Dict[str, Any]]:
+        The shared HTTP session outlives individual fetchers; it is closed with
+        `HTTPClientManager.shared().close()` once all fetching is done.
+        """
+        self.session = None
+        if self.http_cache:
+            self.http_cache.flush()
+
+    async def fetch(self) -> List[ToolRecord]:
         """Main fetch method to be implemented by each fetcher."""
         raise NotImplementedError("Each fetcher must implement the fetch method")
 
-    def parse_tool(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    def partial_results(self) -> List[ToolRecord]:
+        """Tools collected so far by an unfinished fetch(), kept when it is cancelled at its deadline."""
+        return []
+
+    def parse_tool(self, raw_data: Dict[str, Any]) -> ToolRecord:
         """Parse raw data into a standardized tool format."""
         return {
             'name': raw_data.get('name', ''),
@@ -50,13 +68,28 @@ class BaseFetcher:
         }
 
     async def fetch_with_retry(self, url: str, max_retries: int = 3) -> str:
-        """Fetch URL with retry logic."""
+        """Fetch URL with retry logic.
+
+        Sends the cached validators so an unchanged page comes back as a 304
+        and is served from the HTTP cache instead of downloaded again.
+        """
         session = await self.get_session()
+        headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
         for attempt in range(max_retries):
             try:
-                async with session.get(url) as response:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and self.http_cache:
+                        cached = self.http_cache.get(url)
+                        if cached is not None:
+                            return cached
+                        # Cached body vanished; ask for the full page again
+                        headers = {}
+                        continue
                     if response.status == 200:
-                        return await response.text()
+                        html = await response.text()
+                        if self.http_cache:
+                            self.http_cache.store(url, html, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                        return html
                     self.logger.warning(f"Attempt {attempt + 1}: Status {response.status}")
             except Exception as e:
                 self.logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
@@ -67,6 +100,4 @@ class BaseFetcher:
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        if not text:
-            return ""
-        return " ".join(text.split()) 
\ No newline at end of file
+        return normalize_whitespace(text) 
\ No newline at end of file
@@ -1,40 +1,187 @@
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, Browser, Page
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
+import aiohttp
 from .base import BaseFetcher
+from ...utils.browser_pool import BrowserPool
+from ...utils.fetcher_utils import ParsePool
+from ...utils.html_parsing import extract_embedded_json, extract_cards_static
+from ...utils.timeutils import parse_timestamp
+
+# Runs in the page: extracts every card matching `selector` in one round-trip
+EXTRACT_CARDS_JS = """
+({selector, fields}) => Array.from(document.querySelectorAll(selector), card => {
+    const record = {};
+    for (const [key, field] of Object.entries(fields)) {
+        const read = el => field.attr ? el.getAttribute(field.attr) : el.innerText;
+        if (field.all) {
+            record[key] = Array.from(card.querySelectorAll(field.selector), read);
+        } else {
+            const el = card.querySelector(field.selector);
+            record[key] = el ? read(el) : null;
+        }
+    }
+    return record;
+})
+"""
 
 class PlaywrightBaseFetcher(BaseFetcher):
+    # Resource types that never affect the markup being scraped. Stylesheets
+    # and 'other' are kept, since visibility checks and some loaders depend on
+    # them; a site can opt in through `blocked_resource_types`
+    BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'websocket', 'eventsource', 'manifest'}
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
-        self.browser = None
+        self.browser_pool = BrowserPool.shared()
+        self.lease = None
+        self.leases = []
         self.context = None
         self.page = None
+        # Hosts allowed besides the site's own domain (e.g. a CDN serving its scripts)
+        self.allowed_domains = set(self.config.get('allowed_domains', []))
+        self.blocked_resource_types = set(self.config.get('blocked_resource_types', self.BLOCKED_RESOURCE_TYPES))
+        self.block_requests = self.config.get('block_requests', True)
+        # A site remembered as needing the browser is re-probed over plain HTTP after this long
+        self.strategy_ttl = timedelta(days=self.config.get('fetch_strategy_ttl_days', 7))
+
+    def is_first_party(self, url: str) -> bool:
+        """True if the URL belongs to the scraped site or an allowed domain."""
+        host = urlparse(url).hostname
+        if not host:
+            return True  # data:, blob: and similar
+        site = urlparse(getattr(self, 'base_url', '')).hostname or ''
+        domains = {site[4:] if site.startswith('www.') else site} | self.allowed_domains
+        return any(host == domain or host.endswith(f".{domain}") for domain in domains if domain)
+
+    async def _route_request(self, route):
+        request = route.request
+        if request.resource_type in self.blocked_resource_types or not self.is_first_party(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def load(self, url: str, ready_selector: str, timeout: int = 30000, page=None):
+        """Open a URL and wait only until `ready_selector` is in the DOM.
+
+        Waiting for network idle also waits for images, analytics and ads;
+        the cards are usually present long before that.
+        """
+        page = page or self.page
+        await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+        await page.wait_for_selector(ready_selector, state='attached', timeout=timeout)
+
+    async def extract_cards(self, selector: str, fields: Dict[str, Dict[str, Any]], page=None) -> List[Dict[str, Optional[Any]]]:
+        """Extract all cards on the page with a single `page.evaluate` call.
+
+        `fields` maps each output key to a spec: `selector` (relative to the
+        card), optional `attr` to read an attribute instead of the inner text,
+        and `all` to collect every match as a list. Missing elements give None.
+        """
+        return await (page or self.page).evaluate(EXTRACT_CARDS_JS, {'selector': selector, 'fields': fields})
+
+    def fetch_strategy(self) -> str:
+        """'browser' if the site was found to need JavaScript rendering, else 'http'."""
+        entry = self.content_hashes.get('fetch_strategy', self.base_url)
+        if not entry or datetime.now() - parse_timestamp(entry.get('decided_at')) > self.strategy_ttl:
+            return 'http'
+        return entry['strategy']
+
+    def remember_fetch_strategy(self, strategy: str):
+        entry = self.content_hashes.get('fetch_strategy', self.base_url)
+        if entry and entry.get('strategy') == strategy:
+            return
+        self.logger.info(f"Using {strategy} fetching for {self.base_url}")
+        self.content_hashes.set('fetch_strategy', self.base_url, {
+            'strategy': strategy,
+            'decided_at': datetime.now().isoformat()
+        })
+        self.content_hashes.save()
+
+    def cards_from_data(self, data: Any) -> Optional[List[Dict[str, Any]]]:
+        """Card records from a page's embedded JSON (e.g. `__NEXT_DATA__`); sites that embed them override this."""
+        return None
+
+    async def fetch_cards_http(self, url: str, selector: str, fields: Dict[str, Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Card records from the plain HTML of a page, or None if they may only appear after rendering.
+
+        Embedded JSON is tried first, then the same extraction spec the
+        browser uses, applied to the server-rendered markup. A page without
+        cards that embeds its data is really empty and gives []; only a page
+        with neither is a sign of client-side rendering. Raises
+        aiohttp.ClientError if the page could not be fetched at all (a
+        transport error or a non-200 status), which is a failed page rather
+        than a reason to switch to the browser.
+        """
+        html = await self.fetch_with_retry(url)
+        if not html:
+            raise aiohttp.ClientError(f"No content fetched from {url}")
+        data = extract_embedded_json(html)
+        cards = self.cards_from_data(data) if data is not None else None
+        if not cards:
+            cards = await ParsePool.shared().run(extract_cards_static, html, selector, fields)
+        if not cards and data is None:
+            return None
+        return cards
+
+    async def open_pages(self, count: int) -> list:
+        """Set up the main page plus up to `count - 1` extra pages, taking only contexts that are free."""
+        if self.page is None:
+            await self.setup()
+        pages = [self.page]
+        while len(pages) < count:
+            # Only take contexts that are free, so other fetchers are not starved
+            page = await self.open_page(wait=False)
+            if page is None:
+                break
+            pages.append(page)
+        return pages
+
+    async def open_page(self, wait: bool = True):
+        """Check out another context and page from the pool, e.g. for parallel pagination.
+
+        Returns None if `wait` is False and the pool has no free context.
+        """
+        lease = await self.browser_pool.acquire(wait=wait)
+        if lease is None:
+            return None
+        self.leases.append(lease)
+        if self.block_requests:
+            # Routes are per page, so they are removed before the lease goes back to the pool
+            await lease.page.route('**/*', self._route_request)
+        return lease.page
 
     async def setup(self):
+        """Check out a context and page from the shared browser pool."""
         try:
-            self._playwright = await async_playwright().start()
-            self.browser = await self._playwright.chromium.launch(headless=True)
-            self.context = await self.browser.new_context()
-            self.page = await self.context.new_page()
+            self.page = await self.open_page()
+            self.lease = self.leases[-1]
+            self.context = self.lease.context
         except Exception as e:
             self.logger.error(f"Error setting up Playwright: {str(e)}")
             raise
 
     async def cleanup(self):
-        try:
-            if self.page:
-                await self.page.close()
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, '_playwright'):
-                await self._playwright.stop()
-        except Exception as e:
-            self.logger.error(f"Error cleaning up Playwright: {str(e)}")
+        """Return the contexts to the pool; the browser itself keeps running."""
+        for lease in self.leases:
+            try:
+                if self.block_requests and not lease.page.is_closed():
+                    try:
+                        await lease.page.unroute('**/*', self._route_request)
+                    except Exception:
+                        # A page that cannot drop its routes must not be reused
+                        lease.broken = True
+                await self.browser_pool.release(lease)
+            except Exception as e:
+                self.logger.error(f"Error cleaning up Playwright: {str(e)}")
+        self.leases = []
+        self.lease = None
+        self.context = None
+        self.page = None
 
     async def fetch(self) -> List[Dict[str, Any]]:
         raise NotImplementedError("Child classes must implement fetch()")
 
     async def close(self):
         await self.cleanup()
-        await super().close() 
\ No newline at end of file
+        await super().close() 
@@ -0,0 +1,83 @@
+import importlib
+import os
+from typing import List, Dict, Any, Tuple, Type
+
+try:
+    from importlib.metadata import entry_points
+    ENTRY_POINTS_AVAILABLE = True
+except ImportError:
+    ENTRY_POINTS_AVAILABLE = False
+
+# Third-party packages can register fetchers under this entry-point group
+ENTRY_POINT_GROUP = 'ai_tools_monitor.fetchers'
+
+
+class FetcherSpec:
+    """Where a fetcher class lives and when it is enabled, without importing it.
+
+    `target` is 'module:Class', relative to this package. Fetchers whose
+    `requires` config keys are missing are skipped even when enabled.
+    """
+
+    def __init__(self, target: str, requires: Tuple[str, ...] = (), default: bool = False):
+        self.target = target
+        self.requires = requires
+        self.default = default
+
+    def load(self) -> Type:
+        module_name, class_name = self.target.split(':')
+        module = importlib.import_module(module_name, __package__)
+        return getattr(module, class_name)
+
+
+# Modules are imported only when their fetcher is enabled, so disabled
+# sources do not pull in tweepy, playwright or bs4 at startup
+FETCHERS: Dict[str, FetcherSpec] = {
+    'twitter': FetcherSpec('.twitter:TwitterFetcher', default=True),
+    'topaitools': FetcherSpec('.topaitools:TopAIToolsFetcher', default=True),
+    'archon': FetcherSpec('.archon:ArchonFetcher', requires=('ARCHON_API_KEY',), default=True),
+    'futuretools': FetcherSpec('.futuretools:FutureToolsFetcher'),
+    'theresanaiforthat': FetcherSpec('.theresanaiforthat:TheresAnAIFetcher'),
+    'producthunt': FetcherSpec('.product_hunt:ProductHuntFetcher', requires=('producthunt_access_token',)),
+}
+
+
+def available_fetchers() -> Dict[str, Any]:
+    """Built-in fetcher specs plus entry points registered by installed packages.
+
+    Entry points are returned unloaded; they are imported by `load()`.
+    """
+    fetchers: Dict[str, Any] = dict(FETCHERS)
+    if ENTRY_POINTS_AVAILABLE:
+        try:
+            group = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10 returns a dict of groups
+            group = entry_points().get(ENTRY_POINT_GROUP, [])
+        for entry_point in group:
+            fetchers.setdefault(entry_point.name, entry_point)
+    return fetchers
+
+
+def enabled_fetcher_names(config: Dict[str, Any]) -> List[str]:
+    """Names from config `enabled_fetchers` or the FETCHERS env var (comma-separated), else the defaults."""
+    names = config.get('enabled_fetchers') or os.getenv('FETCHERS')
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(',') if name.strip()]
+    if names:
+        return list(names)
+    return [name for name, spec in FETCHERS.items() if spec.default]
+
+
+def create_fetchers(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Import and instantiate the enabled fetchers, keyed by registry name."""
+    fetchers = available_fetchers()
+    instances = {}
+    for name in enabled_fetcher_names(config):
+        spec = fetchers.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown fetcher '{name}'; available: {', '.join(sorted(fetchers))}")
+        if any(not config.get(key) for key in getattr(spec, 'requires', ())):
+            continue
+        instances[name] = spec.load()(config)
+    return instances
@@ -1,6 +1,66 @@
+import logging
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from .base import BaseFetcher
+from ...utils.fetcher_utils import ParsePool
+from ...utils.html_parsing import parse_cards
+from ...utils.text import normalize_whitespace
+
+logger = logging.getLogger(__name__)
+
+
+def parse_theresanai_cards(html: str, base_url: str) -> List[Dict[str, Any]]:
+    """Parse the tool cards of a There's An AI For That page. Runs in a ParsePool worker."""
+    tools = []
+    # Parse only the tool cards, skipping the rest of the page
+    tool_cards = parse_cards(html, 'div', class_='tool-card')  # Adjust selector based on actual HTML
+
+    for card in tool_cards:
+        try:
+            # Extract tool information
+            name_elem = card.find('h3')  # Adjust selector
+            desc_elem = card.find('p', class_='description')  # Adjust selector
+            url_elem = card.find('a', href=True)
+
+            if not all([name_elem, desc_elem, url_elem]):
+                continue
+
+            name = normalize_whitespace(name_elem.text)
+            description = normalize_whitespace(desc_elem.text)
+            url = url_elem['href']
+
+            # Make URL absolute if it's relative
+            if url.startswith('/'):
+                url = f"{base_url}{url}"
+
+            # Extract categories
+            categories = []
+            category_elems = card.find_all('span', class_='category')  # Adjust selector
+            for cat in category_elems:
+                categories.append(normalize_whitespace(cat.text))
+
+            # Extract pricing if available
+            pricing = None
+            pricing_elem = card.find('span', class_='pricing')  # Adjust selector
+            if pricing_elem:
+                pricing = normalize_whitespace(pricing_elem.text)
+
+            tools.append({
+                'name': name,
+                'description': description,
+                'url': url,
+                'raw_data': {
+                    'categories': categories,
+                    'pricing': pricing,
+                    'html': str(card)
+                }
+            })
+
+        except Exception as e:
+            logger.error(f"Error parsing tool card: {str(e)}")
+            continue
+
+    return tools
+
 
 class TheresAnAIFetcher(BaseFetcher):
     def __init__(self, config: Dict[str, Any] = None):
@@ -14,63 +74,21 @@ class TheresAnAIFetcher(BaseFetcher):
             html = await self.fetch_with_retry(self.tools_url)
             if not html:
                 return []
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            tools = []
-            
-            # Find all tool cards
-            tool_cards = soup.find_all('div', class_='tool-card')  # Adjust selector based on actual HTML
-            
-            for card in tool_cards:
-                try:
-                    # Extract tool information
-                    name_elem = card.find('h3')  # Adjust selector
-                    desc_elem = card.find('p', class_='description')  # Adjust selector
-                    url_elem = card.find('a', href=True)
-                    
-                    if not all([name_elem, desc_elem, url_elem]):
-                        continue
-                    
-                    name = self.clean_text(name_elem.text)
-                    description = self.clean_text(desc_elem.text)
-                    url = url_elem['href']
-                    
-                    # Make URL absolute if it's relative
-                    if url.startswith('/'):
-                        url = f"{self.base_url}{url}"
-                    
-                    # Extract categories
-                    categories = []
-                    category_elems = card.find_all('span', class_='category')  # Adjust selector
-                    for cat in category_elems:
-                        categories.append(self.clean_text(cat.text))
-                    
-                    # Extract pricing if available
-                    pricing = None
-                    pricing_elem = card.find('span', class_='pricing')  # Adjust selector
-                    if pricing_elem:
-                        pricing = self.clean_text(pricing_elem.text)
-                    
-                    tool = {
-                        'name': name,
-                        'description': description,
-                        'url': url,
-                        'raw_data': {
-                            'categories': categories,
-                            'pricing': pricing,
-                            'html': str(card)
-                        }
-                    }
-                    
-                    tools.append(self.parse_tool(tool))
-                    
-                except Exception as e:
-                    self.logger.error(f"Error parsing tool card: {str(e)}")
-                    continue
-            
+            if self.content_hashes.page_unchanged(self.tools_url, html):
+                self.logger.info("There's An AI For That page unchanged since last run")
+                return []
+
+            # Parsing is CPU-bound, so it runs in the process pool
+            records = await ParsePool.shared().run(parse_theresanai_cards, html, self.base_url)
+            # Only new or changed cards go down the pipeline
+            records = self.content_hashes.changed_cards(
+                self.tools_url, html, records, markup=lambda record: record['raw_data']['html']
+            )
+            tools = [self.parse_tool(record) for record in records]
+
             self.logger.info(f"Fetched {len(tools)} AI tools from There's An AI For That")
             return tools
-            
+
         except Exception as e:
             self.logger.error(f"Error fetching from There's An AI For That: {str(e)}")
-            return [] 
\ No newline at end of file
+            return []
@@ -1,74 +1,95 @@
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional
 from .playwright_base import PlaywrightBaseFetcher
 from ...utils.fetcher_utils import (
     RateLimiter,
     PaginationHelper,
     deduplicate_tools,
     enrich_tool_data,
-    fetch_with_retry
+    generate_tool_hash
 )
+from ...utils.html_parsing import find_record_list
 
 class TopAIToolsFetcher(PlaywrightBaseFetcher):
+    # Fields read from each `.tool-card`, extracted in one page.evaluate call
+    CARD_FIELDS = {
+        'name': {'selector': 'h3'},
+        'description': {'selector': '.description'},
+        'url': {'selector': 'a', 'attr': 'href'},
+        'categories': {'selector': '.category', 'all': True},
+        'pricing': {'selector': '.pricing'},
+        'views': {'selector': '.views'}
+    }
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.base_url = "https://topai.tools"
         self.tools_url = f"{self.base_url}/tools"
-        self.rate_limiter = RateLimiter(calls_per_second=0.5)  # 2 seconds between requests
+        # Politeness budget for the host: page loads start at most this often
+        # (2 seconds apart by default), with at most `page_concurrency` in flight
+        self.rate_limiter = RateLimiter(calls_per_second=self.config.get('requests_per_second', 0.5))
+        self.page_concurrency = self.config.get('page_concurrency', 3)
         self.pagination = PaginationHelper(max_pages=5)  # Fetch up to 5 pages
+        # Number of known tool hashes remembered for stopping pagination early
+        self.max_known_tools = 5000
+
+    def cards_from_data(self, data: Any) -> Optional[List[Dict[str, Any]]]:
+        """Tool cards from the page's `__NEXT_DATA__`, mapped to the CARD_FIELDS keys."""
+        records = find_record_list(data, required=('name',))  # Adjust to the actual page props
+        if not records:
+            return None
+        return [
+            {
+                'name': record.get('name'),
+                'description': record.get('description'),
+                'url': record.get('url') or (f"/tool/{record['slug']}" if record.get('slug') else None),
+                'categories': [
+                    category.get('name') if isinstance(category, dict) else category
+                    for category in record.get('categories') or []
+                ],
+                'pricing': record.get('pricing'),
+                'views': record.get('views')
+            }
+            for record in records
+        ]
+
+    async def fetch_page(self, page_num: int, page=None) -> Optional[List[Dict[str, Any]]]:
+        """Fetch a single page of tools.
 
-    async def fetch_page(self, page_num: int) -> List[Dict[str, Any]]:
-        """Fetch a single page of tools."""
+        Without a browser `page` the listing is fetched over plain HTTP; None
+        is returned if the server-rendered page has neither cards nor embedded
+        data. A page that fails to load is logged and returns [].
+        """
         tools = []
         page_url = f"{self.tools_url}?page={page_num}"
         
         try:
-            assert self.page is not None
-            await self.page.goto(page_url, wait_until='networkidle', timeout=60000)
-            await self.page.wait_for_selector('.tool-card', timeout=30000)
+            if page is None:
+                cards = await self.fetch_cards_http(page_url, '.tool-card', self.CARD_FIELDS)
+                if cards is None:
+                    return None
+            else:
+                await self.load(page_url, ready_selector='.tool-card', page=page)
+                cards = await self.extract_cards('.tool-card', self.CARD_FIELDS, page=page)
             
-            tool_cards = await self.page.query_selector_all('.tool-card')
-            
-            for card in tool_cards:
+            for card in cards:
                 try:
-                    # Extract tool information
-                    name = await card.query_selector('h3')
-                    name_text = await name.inner_text() if name else "Unknown"
-                    
-                    description = await card.query_selector('.description')
-                    desc_text = await description.inner_text() if description else ""
-                    
-                    url_elem = await card.query_selector('a')
-                    url = await url_elem.get_attribute('href') if url_elem else None
-                    
+                    url = card['url']
                     if url and not url.startswith('http'):
                         url = f"{self.base_url}{url}"
                     
-                    # Extract categories
-                    categories = []
-                    category_elems = await card.query_selector_all('.category')
-                    for cat in category_elems:
-                        cat_text = await cat.inner_text()
-                        categories.append(cat_text)
-                    
-                    # Extract pricing if available
-                    pricing = None
-                    pricing_elem = await card.query_selector('.pricing')
-                    if pricing_elem:
-                        pricing = await pricing_elem.inner_text()
-                    
                     # Extract metrics if available
                     metrics = {}
-                    views_elem = await card.query_selector('.views')
-                    if views_elem:
-                        metrics['views'] = int(await views_elem.inner_text() or 0)
+                    if card['views'] is not None:
+                        metrics['views'] = int(card['views'] or 0)
                     
                     tool = {
-                        'name': name_text.strip(),
-                        'description': desc_text.strip(),
+                        'name': (card['name'] if card['name'] is not None else "Unknown").strip(),
+                        'description': (card['description'] or "").strip(),
                         'url': url,
                         'raw_data': {
-                            'categories': categories,
-                            'pricing': pricing,
+                            'categories': card['categories'],
+                            'pricing': card['pricing'],
                             'metrics': metrics,
                             'source': 'TopAI.tools',
                             'page': page_num
@@ -88,23 +109,77 @@ class TopAIToolsFetcher(PlaywrightBaseFetcher):
             return []
 
     async def fetch(self) -> List[Dict[str, Any]]:
-        """Fetch AI tools from TopAI.tools using Playwright with pagination."""
+        """Fetch AI tools from TopAI.tools with parallel pagination.
+
+        Pages are fetched in batches of up to `page_concurrency`, over plain
+        HTTP while the listings are server-rendered and otherwise each on its
+        own browser page. Pagination stops at the first empty page or at a
+        page whose tools were all seen in earlier runs; pages of the batch
+        that have not started loading by then are skipped.
+        """
         try:
-            await self.setup()
+            strategy = self.fetch_strategy()
+            if strategy == 'browser':
+                pages = await self.open_pages(self.page_concurrency)
+            else:
+                pages = [None] * self.page_concurrency
+
+            # Hashes of tools seen in earlier runs, newest first
+            previous = self.content_hashes.get('known_tools', self.tools_url) or []
+            known = set(previous)
             all_tools = []
-            
-            while self.pagination.has_next_page():
-                page_tools = await fetch_with_retry(
-                    self.fetch_page,
-                    self.pagination.current_page,
-                    rate_limiter=self.rate_limiter
-                )
-                
-                if not page_tools:
-                    break
-                    
-                all_tools.extend(page_tools)
-                self.pagination.next_page()
+            done = False
+            # Lowest page that ended pagination; later pages still waiting on
+            # the rate limiter are skipped instead of loaded
+            stop_at = float('inf')
+
+            async def fetch_listing_page(page_num, page):
+                nonlocal stop_at
+                await self.rate_limiter.acquire()
+                if page_num > stop_at:
+                    return []
+                page_tools = await self.fetch_page(page_num, page)
+                if not page_tools or all(generate_tool_hash(tool) in known for tool in page_tools):
+                    stop_at = min(stop_at, page_num)
+                return page_tools
+
+            while not done and self.pagination.has_next_page():
+                batch = []
+                while len(batch) < len(pages) and self.pagination.has_next_page():
+                    batch.append(self.pagination.current_page)
+                    self.pagination.next_page()
+
+                results = await asyncio.gather(*(
+                    fetch_listing_page(page_num, page) for page_num, page in zip(batch, pages)
+                ))
+
+                if strategy == 'http' and batch[0] == 1:
+                    if results[0] is None:
+                        # The first page rendered without cards or embedded data, so
+                        # they only appear once JavaScript runs; redo this batch in the browser
+                        strategy = 'browser'
+                        self.remember_fetch_strategy(strategy)
+                        pages = await self.open_pages(self.page_concurrency)
+                        self.pagination.current_page = batch[0]
+                        stop_at = float('inf')
+                        continue
+                    if results[0]:
+                        self.remember_fetch_strategy(strategy)
+
+                for page_num, page_tools in zip(batch, results):
+                    if not page_tools:
+                        done = True
+                        break
+                    all_tools.extend(page_tools)
+                    if all(generate_tool_hash(tool) in known for tool in page_tools):
+                        self.logger.info(f"Page {page_num} has only known tools, stopping pagination")
+                        done = True
+                        break
+
+            hashes = [generate_tool_hash(tool) for tool in all_tools]
+            known_tools = list(dict.fromkeys(hashes + previous))
+            # Committed by the caller once these tools are persisted
+            self.content_hashes.stage('known_tools', self.tools_url, known_tools[:self.max_known_tools])
             
             # Deduplicate tools
             unique_tools = deduplicate_tools(all_tools)
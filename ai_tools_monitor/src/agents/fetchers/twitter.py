@@ -1,20 +1,47 @@
+import asyncio
 from typing import List, Dict, Any
 import tweepy
 from .base import BaseFetcher
 import logging
 from ...utils.fetcher_utils import (
+    BlockingCallRunner,
     RateLimiter,
     PaginationHelper,
     deduplicate_tools,
-    enrich_tool_data,
-    fetch_with_retry
+    enrich_tool_data
 )
 
 class TwitterFetcher(BaseFetcher):
+    # Search queries for AI tools
+    SEARCH_QUERIES = [
+        "new AI tool",
+        "AI tool launch",
+        "just launched AI",
+        "check out my AI",
+        "introducing AI",
+        "AI tool that",
+        "built an AI",
+        "created an AI",
+        "AI tool for",
+        "best AI tool",
+        "free AI tool",
+        "AI tool review"
+    ]
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.setup_twitter_client()
         self.rate_limiter = RateLimiter(calls_per_second=0.1)  # 10 seconds between requests
+        # tweepy is synchronous; its calls run in threads so other fetchers keep going
+        self.blocking = BlockingCallRunner(
+            max_workers=self.config.get('blocking_workers', 2),
+            timeout=self.config.get('blocking_timeout', 30.0)
+        )
+        # Queries start 10 seconds apart, so a full run needs the rate limiter's
+        # spacing for every query plus the last call's timeout
+        self.fetch_deadline = len(self.SEARCH_QUERIES) / self.rate_limiter.calls_per_second + self.blocking.timeout
+        # Tools per query index from the fetch in progress
+        self.collected: Dict[int, List[Dict[str, Any]]] = {}
 
     def setup_twitter_client(self):
         """Initialize Twitter API client."""
@@ -38,17 +65,21 @@ class TwitterFetcher(BaseFetcher):
             self.logger.error(f"Error setting up Twitter client: {str(e)}")
             raise
 
+    async def close(self):
+        await super().close()
+        self.blocking.shutdown()
+
     async def fetch_query(self, query: str) -> List[Dict[str, Any]]:
         """Fetch tweets for a specific query."""
         try:
-            tweets = await fetch_with_retry(
+            await self.rate_limiter.acquire()
+            tweets = await self.blocking.run(
                 self.client.search_recent_tweets,
                 query=query,
                 max_results=100,
                 tweet_fields=['created_at', 'public_metrics', 'entities', 'author_id'],
                 expansions=['author_id'],
-                user_fields=['username', 'name', 'public_metrics'],
-                rate_limiter=self.rate_limiter
+                user_fields=['username', 'name', 'public_metrics']
             )
             
             if not tweets.data:
@@ -100,30 +131,26 @@ class TwitterFetcher(BaseFetcher):
             self.logger.error(f"Error processing query '{query}': {str(e)}")
             return []
 
+    def partial_results(self) -> List[Dict[str, Any]]:
+        tools = [tool for index in sorted(self.collected) for tool in self.collected[index]]
+        return deduplicate_tools(tools)
+
+    async def _collect_query(self, index: int, query: str):
+        self.collected[index] = await self.fetch_query(query)
+
     async def fetch(self) -> List[Dict[str, Any]]:
-        """Fetch AI tool-related tweets."""
+        """Fetch AI tool-related tweets.
+
+        The queries run concurrently under the shared rate limiter, so one
+        slow search does not hold back the next; results are collected as
+        each query finishes and are available from `partial_results()`.
+        """
+        self.collected = {}
         try:
-            tools = []
-            
-            # Search queries for AI tools
-            search_queries = [
-                "new AI tool",
-                "AI tool launch",
-                "just launched AI",
-                "check out my AI",
-                "introducing AI",
-                "AI tool that",
-                "built an AI",
-                "created an AI",
-                "AI tool for",
-                "best AI tool",
-                "free AI tool",
-                "AI tool review"
-            ]
-            
-            for query in search_queries:
-                query_tools = await self.fetch_query(query)
-                tools.extend(query_tools)
+            await asyncio.gather(*(
+                self._collect_query(index, query) for index, query in enumerate(self.SEARCH_QUERIES)
+            ))
+            tools = [tool for index in sorted(self.collected) for tool in self.collected[index]]
             
             # Deduplicate tools
             unique_tools = deduplicate_tools(tools)
@@ -136,4 +163,4 @@ class TwitterFetcher(BaseFetcher):
             
         except Exception as e:
             self.logger.error(f"Error fetching from Twitter: {str(e)}")
-            return [] 
\ No newline at end of file
+            return []
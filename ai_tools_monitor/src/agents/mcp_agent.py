@@ -1,58 +1,99 @@
+import asyncio
+import time
 from typing import List, Dict, Any
 from .fetchers.base import BaseFetcher
-from .fetchers.twitter import TwitterFetcher
-from .fetchers.topaitools import TopAIToolsFetcher
-from .fetchers.archon import ArchonFetcher
+from .fetchers.registry import create_fetchers
+from ..utils.http_client import HTTPClientManager
+from ..utils.fetcher_utils import ParsePool
+from ..utils.serialization import ToolRecord
 
 class EnhancedFetcherAgent:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.fetchers: List[BaseFetcher] = []
+        # Enabled fetchers by registry name, e.g. 'topaitools'
+        self.fetchers: Dict[str, BaseFetcher] = {}
+        # Outcome of the last fetch_all, per fetcher name
+        self.last_report: Dict[str, Any] = {}
         self.setup_fetchers()
 
     def setup_fetchers(self):
-        """Initialize fetchers with enhanced capabilities."""
+        """Initialize the fetchers enabled in config (see fetchers.registry)."""
         try:
-            # Initialize Twitter fetcher
-            twitter_fetcher = TwitterFetcher(self.config)
-            self.fetchers.append(twitter_fetcher)
-
-            # Initialize TopAI.tools fetcher
-            topai_fetcher = TopAIToolsFetcher()
-            self.fetchers.append(topai_fetcher)
-
-            # Initialize Archon fetcher
-            if self.config.get('ARCHON_API_KEY'):
-                archon_fetcher = ArchonFetcher(self.config)
-                self.fetchers.append(archon_fetcher)
-
+            self.fetchers = create_fetchers(self.config)
         except Exception as e:
             print(f"Error setting up fetchers: {str(e)}")
             raise
 
-    async def fetch_all(self) -> List[Dict[str, Any]]:
-        """Fetch tools from all sources with enhanced capabilities."""
-        try:
-            all_tools = []
-            for fetcher in self.fetchers:
-                try:
-                    tools = await fetcher.fetch()
-                    all_tools.extend(tools)
-                except Exception as e:
-                    print(f"Error fetching from {fetcher.__class__.__name__}: {str(e)}")
-                    continue
+    async def _fetch_with_deadline(self, name: str, fetcher: BaseFetcher, deadline: float, report: Dict[str, Any]) -> List[ToolRecord]:
+        """Run one fetcher, cancelling it if it has not finished within `deadline` seconds.
 
-            return all_tools
+        A cancelled fetcher still contributes the tools it had collected.
+        """
+        start = time.monotonic()
+        try:
+            tools = await asyncio.wait_for(fetcher.fetch(), deadline)
+            report['succeeded'][name] = len(tools)
+            return tools
+        except asyncio.TimeoutError:
+            tools = fetcher.partial_results()
+            report['timed_out'].append(name)
+            report['partial'][name] = len(tools)
+            print(f"{name} timed out after {deadline}s, keeping {len(tools)} tools")
+            return tools
+        except Exception as e:
+            report['failed'][name] = str(e)
+            print(f"Error fetching from {name}: {str(e)}")
+        finally:
+            report['durations'][name] = round(time.monotonic() - start, 2)
+        return []
+
+    async def fetch_all(self) -> List[ToolRecord]:
+        """Fetch tools from all sources concurrently, each within its own deadline.
+
+        A source that misses its deadline is cancelled; the tools it had
+        collected and those from the others are still returned. Which sources succeeded, failed or timed
+        out is recorded in `self.last_report`.
+
+        Fetchers skip pages and cards seen in earlier runs only once
+        `commit_content_hashes` confirms that those tools were persisted.
+        """
+        report = {'succeeded': {}, 'failed': {}, 'timed_out': [], 'partial': {}, 'durations': {}}
+        self.last_report = report
+        try:
+            # Per-fetcher overrides by registry name, e.g. {'topaitools': 120}; otherwise
+            # a fetcher's own deadline (e.g. Twitter's rate-limited queries), then the default
+            deadlines = self.config.get('fetch_deadlines', {})
+            default_deadline = self.config.get('fetch_deadline', 60)
+            results = await asyncio.gather(*(
+                self._fetch_with_deadline(
+                    name, fetcher, deadlines.get(name) or getattr(fetcher, 'fetch_deadline', None) or default_deadline, report
+                )
+                for name, fetcher in self.fetchers.items()
+            ))
+            return [tool for tools in results for tool in tools]
 
         except Exception as e:
             print(f"Error fetching tools: {str(e)}")
             return []
 
+    def commit_content_hashes(self):
+        """Record this run's page and card hashes; call once its tools are persisted."""
+        for fetcher in self.fetchers.values():
+            if hasattr(fetcher, 'tools_url'):
+                fetcher.content_hashes.commit([fetcher.tools_url])
+
     async def close(self):
         """Clean up resources."""
         try:
-            for fetcher in self.fetchers:
+            for fetcher in self.fetchers.values():
                 await fetcher.close()
+            await HTTPClientManager.shared().close()
+            # Only Playwright-based fetchers hold the browser pool; checking
+            # for it avoids importing playwright when none is enabled
+            browser_pool = next((f.browser_pool for f in self.fetchers.values() if hasattr(f, 'browser_pool')), None)
+            if browser_pool is not None:
+                await browser_pool.close()
+            ParsePool.shared().shutdown()
         except Exception as e:
             print(f"Error during cleanup: {str(e)}")
 
@@ -1,19 +1,59 @@
 import asyncio
 import logging
+import os
 from typing import List, Dict, Any
 import aiohttp
-from bs4 import BeautifulSoup
 import tweepy
 import praw
 from producthunt import ProductHunt
 from datetime import datetime, timedelta
 from ..models import Base, API, APIChange
+from ..storage.columnar import ColumnarArchive
+from ..storage.sqlite_store import TOOL_UPSERT, tool_rows
+from ..utils.fetcher_utils import BlockingCallRunner, ParsePool
+from ..utils.http_client import HTTPClientManager
+from ..utils.content_hash import ContentHashStore
+from ..utils.html_parsing import parse_cards
+from ..utils.serialization import ToolRecord
 from sqlalchemy.orm import Session
 
+def parse_directory_cards(html: str) -> List[Dict[str, Any]]:
+    """Parse the tool cards of a directory page. Runs in a ParsePool worker."""
+    # Extract tools (this will need to be customized per directory)
+    tools = parse_cards(html, 'div', class_='tool-card')  # Example selector
+    return [
+        {
+            'name': tool.find('h2').text.strip(),
+            'description': tool.find('p').text.strip(),
+            'url': tool.find('a')['href'],
+            'raw_data': {
+                'html': str(tool)
+            }
+        }
+        for tool in tools
+    ]
+
+# Directory pages fetched by fetch_ai_directories
+AI_DIRECTORIES = [
+    'https://www.futuretools.io/',
+    'https://www.aitoolkit.org/',
+    'https://www.aitoolguide.com/'
+]
+
 class SourceFetcher:
     def __init__(self, db: Session, config: Dict[str, Any]):
         self.db = db
         self.config = config
+        # Shared with the tweet monitor, which writes tweets to the same archive
+        self.archive = ColumnarArchive(
+            config.get('columnar_dir') or os.getenv('TWEET_COLUMNAR_DIR', os.path.join('data', 'columnar'))
+        )
+        self.content_hashes = ContentHashStore.shared()
+        # The praw, tweepy and Product Hunt SDKs are synchronous
+        self.blocking = BlockingCallRunner(
+            max_workers=config.get('blocking_workers', 4),
+            timeout=config.get('blocking_timeout', 30.0)
+        )
         self.setup_logging()
         self.setup_clients()
 
@@ -52,7 +92,7 @@ class SourceFetcher:
         """Fetch new AI tools from Product Hunt."""
         try:
             # Get today's posts
-            posts = self.ph_client.get_posts()
+            posts = await self.blocking.run(self.ph_client.get_posts)
             ai_tools = []
             
             for post in posts:
@@ -68,35 +108,45 @@ class SourceFetcher:
             
             self.logger.info(f"Fetched {len(ai_tools)} AI tools from Product Hunt")
             return ai_tools
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timed out fetching from Product Hunt after {self.blocking.timeout}s")
+            return []
         except Exception as e:
             self.logger.error(f"Error fetching from Product Hunt: {str(e)}")
             return []
 
+    def _fetch_reddit_sync(self, subreddits: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Read the subreddits as one multireddit listing (runs in the thread pool)."""
+        ai_tools = []
+        multireddit = self.reddit_client.subreddit('+'.join(subreddits))
+        for submission in multireddit.new(limit=limit):
+            if any(keyword in submission.title.lower() for keyword in ['ai tool', 'artificial intelligence', 'machine learning']):
+                ai_tools.append({
+                    'name': submission.title,
+                    'description': submission.selftext,
+                    'url': submission.url,
+                    'source': f'reddit/{submission.subreddit.display_name}',
+                    'discovered_at': datetime.utcnow(),
+                    'raw_data': {
+                        'score': submission.score,
+                        'num_comments': submission.num_comments,
+                        'created_utc': submission.created_utc
+                    }
+                })
+        return ai_tools
+
     async def fetch_reddit(self) -> List[Dict[str, Any]]:
         """Fetch AI tool discussions from Reddit."""
         try:
             subreddits = ['ArtificialIntelligence', 'aiTools', 'MachineLearning']
-            ai_tools = []
-            
-            for subreddit_name in subreddits:
-                subreddit = self.reddit_client.subreddit(subreddit_name)
-                for submission in subreddit.new(limit=50):
-                    if any(keyword in submission.title.lower() for keyword in ['ai tool', 'artificial intelligence', 'machine learning']):
-                        ai_tools.append({
-                            'name': submission.title,
-                            'description': submission.selftext,
-                            'url': submission.url,
-                            'source': f'reddit/{subreddit_name}',
-                            'discovered_at': datetime.utcnow(),
-                            'raw_data': {
-                                'score': submission.score,
-                                'num_comments': submission.num_comments,
-                                'created_utc': submission.created_utc
-                            }
-                        })
+            # One combined listing replaces three requests of 50 posts each
+            ai_tools = await self.blocking.run(self._fetch_reddit_sync, subreddits, 50 * len(subreddits))
             
             self.logger.info(f"Fetched {len(ai_tools)} AI tools from Reddit")
             return ai_tools
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timed out fetching from Reddit after {self.blocking.timeout}s")
+            return []
         except Exception as e:
             self.logger.error(f"Error fetching from Reddit: {str(e)}")
             return []
@@ -105,7 +155,8 @@ class SourceFetcher:
         """Fetch AI tool mentions from Twitter."""
         try:
             query = '(AI tool OR "artificial intelligence" OR "machine learning") -is:retweet'
-            tweets = self.twitter_client.search_recent_tweets(
+            tweets = await self.blocking.run(
+                self.twitter_client.search_recent_tweets,
                 query=query,
                 max_results=100,
                 tweet_fields=['created_at', 'public_metrics']
@@ -127,43 +178,42 @@ class SourceFetcher:
             
             self.logger.info(f"Fetched {len(ai_tools)} AI tools from Twitter")
             return ai_tools
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timed out fetching from Twitter after {self.blocking.timeout}s")
+            return []
         except Exception as e:
             self.logger.error(f"Error fetching from Twitter: {str(e)}")
             return []
 
+    async def fetch_directory(self, session: aiohttp.ClientSession, directory: str) -> List[Dict[str, Any]]:
+        """Fetch one directory and parse its tool cards in the process pool."""
+        ai_tools = []
+        try:
+            async with session.get(directory) as response:
+                if response.status == 200:
+                    html = await response.text()
+                    if self.content_hashes.page_unchanged(directory, html):
+                        return []
+                    records = await ParsePool.shared().run(parse_directory_cards, html)
+                    records = self.content_hashes.changed_cards(
+                        directory, html, records, markup=lambda record: record['raw_data']['html']
+                    )
+                    for record in records:
+                        ai_tools.append({
+                            **record,
+                            'source': directory,
+                            'discovered_at': datetime.utcnow()
+                        })
+        except Exception as e:
+            self.logger.error(f"Error fetching from {directory}: {str(e)}")
+        return ai_tools
+
     async def fetch_ai_directories(self) -> List[Dict[str, Any]]:
-        """Fetch AI tools from various directories."""
+        """Fetch AI tools from various directories concurrently over the shared HTTP session."""
         try:
-            directories = [
-                'https://www.futuretools.io/',
-                'https://www.aitoolkit.org/',
-                'https://www.aitoolguide.com/'
-            ]
-            
-            ai_tools = []
-            async with aiohttp.ClientSession() as session:
-                for directory in directories:
-                    try:
-                        async with session.get(directory) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                soup = BeautifulSoup(html, 'html.parser')
-                                
-                                # Extract tools (this will need to be customized per directory)
-                                tools = soup.find_all('div', class_='tool-card')  # Example selector
-                                for tool in tools:
-                                    ai_tools.append({
-                                        'name': tool.find('h2').text.strip(),
-                                        'description': tool.find('p').text.strip(),
-                                        'url': tool.find('a')['href'],
-                                        'source': directory,
-                                        'discovered_at': datetime.utcnow(),
-                                        'raw_data': {
-                                            'html': str(tool)
-                                        }
-                                    })
-                    except Exception as e:
-                        self.logger.error(f"Error fetching from {directory}: {str(e)}")
+            session = await HTTPClientManager.shared().session()
+            results = await asyncio.gather(*(self.fetch_directory(session, d) for d in AI_DIRECTORIES))
+            ai_tools = [tool for tools in results for tool in tools]
             
             self.logger.info(f"Fetched {len(ai_tools)} AI tools from directories")
             return ai_tools
@@ -171,7 +221,7 @@ class SourceFetcher:
             self.logger.error(f"Error fetching from AI directories: {str(e)}")
             return []
 
-    async def fetch_all_sources(self) -> List[Dict[str, Any]]:
+    async def fetch_all_sources(self) -> List[ToolRecord]:
         """Fetch data from all sources concurrently."""
         tasks = [
             self.fetch_product_hunt(),
@@ -190,23 +240,40 @@ class SourceFetcher:
             else:
                 self.logger.error(f"Error in fetch task: {str(result)}")
         
+        # Keep the full tool history in the columnar archive for analytics
+        try:
+            self.archive.export_tools(all_tools)
+            self.archive.compact('tools')
+        except Exception as e:
+            self.logger.error(f"Error exporting tools to columnar archive: {str(e)}")
+        
         # Save to database
-        for tool in all_tools:
-            try:
-                existing_tool = self.db.query(API).filter_by(url=tool['url']).first()
-                if existing_tool:
-                    # Update existing tool
-                    for key, value in tool.items():
-                        if hasattr(existing_tool, key):
-                            setattr(existing_tool, key, value)
-                else:
-                    # Create new tool
-                    new_tool = API(**tool)
-                    self.db.add(new_tool)
-                
-                self.db.commit()
-            except Exception as e:
-                self.logger.error(f"Error saving tool {tool.get('name', 'unknown')}: {str(e)}")
-                self.db.rollback()
+        self.save_tools(all_tools)
         
-        return all_tools 
\ No newline at end of file
+        return all_tools
+
+    def save_tools(self, tools: List[ToolRecord], chunk_size: int = 500) -> int:
+        """Upsert tools by URL in a single transaction.
+
+        Uses SQLiteStore's prepared INSERT ... ON CONFLICT DO UPDATE, executed
+        as one executemany batch per chunk, so the cost grows with the number
+        of chunks rather than tools. Returns the number of tools saved, or 0
+        if the transaction was rolled back.
+
+        The directory card hashes staged by this run are committed only after
+        the transaction, so rolled-back tools are fetched again next run.
+        """
+        rows = tool_rows(tools)
+
+        try:
+            for start in range(0, len(rows), chunk_size):
+                self.db.execute(TOOL_UPSERT, rows[start:start + chunk_size])
+            self.db.commit()
+        except Exception as e:
+            self.logger.error(f"Error saving {len(rows)} tools: {str(e)}")
+            self.db.rollback()
+            return 0
+        self.content_hashes.commit(AI_DIRECTORIES)
+
+        self.logger.info(f"Saved {len(rows)} tools in {max(1, -(-len(rows) // chunk_size))} batches")
+        return len(rows)
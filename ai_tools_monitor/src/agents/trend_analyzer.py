@@ -1,9 +1,11 @@
 import logging
+import os
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from ..models import API, APIChange
+from ..storage.columnar import ColumnarArchive
 import pandas as pd
 import numpy as np
 from sklearn.cluster import DBSCAN
@@ -17,6 +19,10 @@ class TrendAnalyzer:
         self.config = config
         self.setup_logging()
         self.setup_openai()
+        # Shared with the tweet monitor, which writes tweets to the same archive
+        self.archive = ColumnarArchive(
+            config.get('columnar_dir') or os.getenv('TWEET_COLUMNAR_DIR', os.path.join('data', 'columnar'))
+        )
 
     def setup_logging(self):
         logging.basicConfig(
@@ -102,11 +108,27 @@ class TrendAnalyzer:
             self.logger.error(f"Error clustering tools: {str(e)}")
             return []
 
-    def detect_spikes(self, tools: List[Dict[str, Any]], window_days: int = 3) -> List[Dict[str, Any]]:
-        """Detect sudden spikes in tool launches."""
+    def load_tool_history(self, days: int = 90, columns: List[str] = None) -> pd.DataFrame:
+        """Load tool history from the columnar archive, reading only the needed columns and date partitions."""
+        start = (datetime.now() - timedelta(days=days)).date()
+        return self.archive.read('tools', columns=columns, start=start).to_pandas()
+
+    def detect_historical_spikes(self, days: int = 90, window_days: int = 3) -> List[Dict[str, Any]]:
+        """Detect launch spikes over months of archived history."""
+        history = self.load_tool_history(days, columns=['name', 'url', 'source', 'discovered_at'])
+        if history.empty:
+            return []
+        return self.detect_spikes(history, window_days)
+
+    def detect_spikes(self, tools, window_days: int = 3) -> List[Dict[str, Any]]:
+        """Detect sudden spikes in tool launches.
+
+        Accepts either a list of tool dicts or a DataFrame with a
+        `discovered_at` column.
+        """
         try:
             # Convert to DataFrame for easier analysis
-            df = pd.DataFrame(tools)
+            df = tools if isinstance(tools, pd.DataFrame) else pd.DataFrame(tools)
             df['discovered_at'] = pd.to_datetime(df['discovered_at'])
             
             # Group by date and count
@@ -183,12 +205,14 @@ class TrendAnalyzer:
             category_trends = self.analyze_category_trends(tools)
             clusters = self.cluster_similar_tools(tools)
             spikes = self.detect_spikes(tools)
+            historical_spikes = self.detect_historical_spikes()
             trend_report = self.generate_trend_report(tools)
             
             return {
                 'category_trends': category_trends,
                 'similar_tool_clusters': clusters,
                 'launch_spikes': spikes,
+                'historical_launch_spikes': historical_spikes,
                 'trend_report': trend_report,
                 'analysis_date': datetime.utcnow()
             }
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Dict, Any
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, ForeignKey, Index
+from sqlalchemy.orm import declarative_base, relationship
+
+Base = declarative_base()
+
+
+class API(Base):
+    """An AI tool discovered by one of the fetchers."""
+    __tablename__ = 'apis'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(512), nullable=False, default='')
+    description = Column(Text, default='')
+    url = Column(String(2048), unique=True, index=True)
+    source = Column(String(255), index=True)
+    discovered_at = Column(DateTime, default=datetime.utcnow, index=True)
+    categories = Column(JSON)
+    pricing = Column(JSON)
+    summary = Column(Text)
+    launch_date = Column(String(64))
+    raw_data = Column(JSON)
+
+    changes = relationship('APIChange', back_populates='api', cascade='all, delete-orphan')
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'url': self.url,
+            'source': self.source,
+            'discovered_at': self.discovered_at,
+            'categories': self.categories or [],
+            'pricing': self.pricing,
+            'summary': self.summary,
+            'launch_date': self.launch_date,
+            'raw_data': self.raw_data or {}
+        }
+
+
+class APIChange(Base):
+    """A recorded change to a tool's fields between two fetches."""
+    __tablename__ = 'api_changes'
+
+    id = Column(Integer, primary_key=True)
+    api_id = Column(Integer, ForeignKey('apis.id'), nullable=False, index=True)
+    changes = Column(JSON, nullable=False)
+    changed_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    api = relationship('API', back_populates='changes')
+
+
+class Account(Base):
+    """A monitored Twitter account."""
+    __tablename__ = 'accounts'
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String(255), unique=True, nullable=False)
+    first_seen = Column(DateTime, default=datetime.now)
+    last_seen = Column(DateTime, default=datetime.now, index=True)
+    tweet_count = Column(Integer, default=0)
+
+
+class Tweet(Base):
+    """A tweet collected by the tweet monitor."""
+    __tablename__ = 'tweets'
+
+    id = Column(Integer, primary_key=True)
+    tweet_key = Column(String(1024), unique=True, nullable=False)
+    tweet_id = Column(String(64), index=True)
+    account = Column(String(255), nullable=False, index=True)
+    content = Column(Text, nullable=False)
+    timestamp = Column(DateTime, nullable=False, index=True)
+    engagement = Column(Float, default=0)
+    engagement_score = Column(Float, default=0)
+    engagement_rate = Column(Float, default=0)
+    likes = Column(Integer, default=0)
+    retweets = Column(Integer, default=0)
+    replies = Column(Integer, default=0)
+    quotes = Column(Integer, default=0)
+    collected_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        Index('ix_tweets_account_timestamp', 'account', 'timestamp'),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'account': self.account,
+            'content': self.content,
+            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
+            'engagement': self.engagement,
+            'engagement_score': self.engagement_score,
+            'engagement_rate': self.engagement_rate,
+            'likes': self.likes,
+            'retweets': self.retweets,
+            'replies': self.replies,
+            'quotes': self.quotes,
+            'tweet_id': self.tweet_id
+        }
+
+
+class AnalysisSnapshot(Base):
+    """The trend analysis produced by one monitoring cycle."""
+    __tablename__ = 'analysis_snapshots'
+
+    id = Column(Integer, primary_key=True)
+    analysis_timestamp = Column(DateTime, nullable=False, index=True)
+    total_tweets = Column(Integer, default=0)
+    total_accounts = Column(Integer, default=0)
+    avg_engagement = Column(Float, default=0)
+    data = Column(JSON, nullable=False)
@@ -0,0 +1,84 @@
+import os
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from .snapshot_files import atomic_write_bytes
+from ..utils.serialization import dumps, loads
+from ..utils.timeutils import parse_timestamp
+
+
+class CycleCheckpoint:
+    """Progress of the monitoring cycle in flight, journaled after every step.
+
+    Records which accounts have been fetched (with their tweets) and which
+    rewrites are done, so a cycle interrupted by a crash or restart resumes
+    where it stopped instead of spending rate-limited quota again. The file
+    is an NDJSON journal: a header line with `started_at`, then one line per
+    account or rewrite, so each step appends only its own record and `load`
+    replays them. The file is removed once the cycle's data is saved;
+    checkpoints older than `max_age_hours` are considered stale and ignored.
+    """
+
+    def __init__(self, path: str, max_age_hours: float = 6.0):
+        self.path = path
+        self.max_age = timedelta(hours=max_age_hours)
+        self.state: Optional[Dict[str, Any]] = None
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Replay the interrupted cycle's journal, or return None if there is nothing to resume."""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                lines = f.readlines()
+            header = loads(lines[0]) if lines else {}
+        except (OSError, ValueError):
+            return None
+        if not header.get('started_at') or datetime.now() - parse_timestamp(header['started_at']) > self.max_age:
+            return None
+
+        state = self._new_state(header['started_at'])
+        for line in lines[1:]:
+            if not line.endswith(b'\n'):
+                break  # Partially written line
+            try:
+                entry = loads(line)
+            except ValueError:
+                break
+            if 'account' in entry:
+                state['accounts_done'].append(entry['account'])
+                state['tweets'].extend(entry.get('tweets', []))
+            elif 'rewrite' in entry:
+                state['rewrites'].append(entry['rewrite'])
+        self.state = state
+        return state
+
+    @staticmethod
+    def _new_state(started_at: str) -> Dict[str, Any]:
+        return {'started_at': started_at, 'accounts_done': [], 'tweets': [], 'rewrites': []}
+
+    def start(self) -> Dict[str, Any]:
+        """Resume the interrupted cycle if there is one, otherwise begin a new one."""
+        if self.state is None and self.load() is None:
+            self.state = self._new_state(datetime.now().isoformat())
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # A new journal replaces whatever was left of a stale one
+            atomic_write_bytes(self.path, dumps({'started_at': self.state['started_at']}) + b'\n')
+        return self.state
+
+    def _append(self, entry: Dict[str, Any]):
+        with open(self.path, 'ab') as f:
+            f.write(dumps(entry) + b'\n')
+
+    def record_account(self, account: str, tweets: List[Dict[str, Any]]):
+        self.state['accounts_done'].append(account)
+        self.state['tweets'].extend(tweets)
+        self._append({'account': account, 'tweets': tweets})
+
+    def record_rewrite(self, rewrite: Dict[str, Any]):
+        self.state['rewrites'].append(rewrite)
+        self._append({'rewrite': rewrite})
+
+    def clear(self):
+        self.state = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
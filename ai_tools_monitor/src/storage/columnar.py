@@ -0,0 +1,202 @@
+import os
+import shutil
+import uuid
+from datetime import date
+from typing import List, Dict, Any, Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from ..utils.serialization import dumps, validate, TweetRecord, ToolRecord
+from ..utils.timeutils import parse_timestamp
+
+TWEET_SCHEMA = pa.schema([
+    ('account', pa.dictionary(pa.int32(), pa.string())),
+    ('tweet_id', pa.string()),
+    ('content', pa.string()),
+    ('timestamp', pa.timestamp('us')),
+    ('engagement', pa.float64()),
+    ('engagement_score', pa.float64()),
+    ('engagement_rate', pa.float64()),
+    ('likes', pa.int64()),
+    ('retweets', pa.int64()),
+    ('replies', pa.int64()),
+    ('quotes', pa.int64())
+])
+
+TOOL_SCHEMA = pa.schema([
+    ('source', pa.dictionary(pa.int32(), pa.string())),
+    ('name', pa.string()),
+    ('description', pa.string()),
+    ('url', pa.string()),
+    ('discovered_at', pa.timestamp('us')),
+    ('raw_data', pa.string())
+])
+
+PARTITIONING = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+
+def _tweet_row(tweet: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'account': tweet.get('account', ''),
+        'tweet_id': str(tweet['tweet_id']) if tweet.get('tweet_id') is not None else None,
+        'content': tweet.get('content', ''),
+        'timestamp': parse_timestamp(tweet.get('timestamp')),
+        'engagement': float(tweet.get('engagement', 0) or 0),
+        'engagement_score': float(tweet.get('engagement_score', 0) or 0),
+        'engagement_rate': float(tweet.get('engagement_rate', 0) or 0),
+        'likes': int(tweet.get('likes', 0) or 0),
+        'retweets': int(tweet.get('retweets', 0) or 0),
+        'replies': int(tweet.get('replies', 0) or 0),
+        'quotes': int(tweet.get('quotes', 0) or 0)
+    }
+
+
+def _tool_row(tool: Dict[str, Any]) -> Dict[str, Any]:
+    raw_data = tool.get('raw_data') or {}
+    return {
+        'source': tool.get('source') or raw_data.get('source') or 'unknown',
+        'name': tool.get('name', ''),
+        'description': tool.get('description', ''),
+        'url': tool.get('url'),
+        'discovered_at': parse_timestamp(tool.get('discovered_at') or raw_data.get('fetched_at')),
+        'raw_data': dumps(raw_data).decode('utf-8')
+    }
+
+
+class ColumnarArchive:
+    """Date-partitioned Parquet archive of tweet and tool history.
+
+    Each dataset lives under `<root>/<kind>/date=YYYY-MM-DD/`. Exports append
+    a new part file per partition; `compact` later merges a day's parts into a
+    single file. Account and source columns are dictionary-encoded, and reads
+    prune partitions by date and load only the requested columns.
+    """
+
+    DATASETS = {
+        'tweets': (TWEET_SCHEMA, 'timestamp', _tweet_row),
+        'tools': (TOOL_SCHEMA, 'discovered_at', _tool_row)
+    }
+
+    def __init__(self, root: str = os.path.join('data', 'columnar')):
+        self.root = root
+
+    def dataset_dir(self, kind: str) -> str:
+        return os.path.join(self.root, kind)
+
+    def _export(self, kind: str, records: List[Dict[str, Any]]) -> int:
+        schema, time_column, to_row = self.DATASETS[kind]
+        if not records:
+            return 0
+
+        by_date: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            row = to_row(record)
+            by_date.setdefault(row[time_column].date().isoformat(), []).append(row)
+
+        for day, rows in by_date.items():
+            partition = os.path.join(self.dataset_dir(kind), f"date={day}")
+            os.makedirs(partition, exist_ok=True)
+            table = pa.Table.from_pylist(rows, schema=schema)
+            pq.write_table(table, os.path.join(partition, f"part-{uuid.uuid4().hex}.parquet"))
+
+        return len(records)
+
+    def export_tweets(self, tweets: List[TweetRecord]) -> int:
+        validate(tweets, List[TweetRecord])
+        return self._export('tweets', tweets)
+
+    def export_tools(self, tools: List[ToolRecord]) -> int:
+        validate(tools, List[ToolRecord])
+        return self._export('tools', tools)
+
+    def compact(self, kind: str, before: Optional[date] = None) -> int:
+        """Merge the part files of each closed partition into one file.
+
+        Only partitions strictly before `before` (default: today) are touched,
+        since the current day may still be receiving exports. Returns the
+        number of partitions compacted.
+        """
+        schema = self.DATASETS[kind][0]
+        before = before or date.today()
+        base = self.dataset_dir(kind)
+        if not os.path.isdir(base):
+            return 0
+
+        compacted = 0
+        for name in sorted(os.listdir(base)):
+            if not name.startswith('date=') or name[5:] >= before.isoformat():
+                continue
+            partition = os.path.join(base, name)
+            parts = sorted(p for p in os.listdir(partition) if p.endswith('.parquet'))
+            if len(parts) < 2:
+                continue
+
+            table = pa.concat_tables([
+                pq.read_table(os.path.join(partition, part), schema=schema) for part in parts
+            ])
+            tmp_path = os.path.join(partition, '_compacted.parquet.tmp')
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, os.path.join(partition, f"part-{uuid.uuid4().hex}.parquet"))
+            for part in parts:
+                os.remove(os.path.join(partition, part))
+            compacted += 1
+
+        return compacted
+
+    def partitions(self, kind: str) -> List[str]:
+        """Dates (YYYY-MM-DD) with a partition on disk, oldest first."""
+        base = self.dataset_dir(kind)
+        if not os.path.isdir(base):
+            return []
+        return sorted(name[5:] for name in os.listdir(base) if name.startswith('date='))
+
+    def drop_partitions(self, kind: str, before: date) -> int:
+        """Delete whole partitions dated strictly before `before`. Returns the number removed."""
+        dropped = 0
+        for day in self.partitions(kind):
+            if day >= before.isoformat():
+                break
+            shutil.rmtree(os.path.join(self.dataset_dir(kind), f"date={day}"))
+            dropped += 1
+        return dropped
+
+    def read(
+        self,
+        kind: str,
+        columns: Optional[List[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> pa.Table:
+        """Read selected columns from the partitions between start and end (inclusive)."""
+        schema = self.DATASETS[kind][0]
+        base = self.dataset_dir(kind)
+        if not os.path.isdir(base):
+            return schema.empty_table().select(columns) if columns else schema.empty_table()
+
+        dataset = ds.dataset(base, format='parquet', partitioning=PARTITIONING, schema=schema.append(pa.field('date', pa.string())))
+        condition = None
+        if start is not None:
+            condition = ds.field('date') >= start.isoformat()
+        if end is not None:
+            upper = ds.field('date') <= end.isoformat()
+            condition = upper if condition is None else condition & upper
+
+        return dataset.to_table(columns=columns, filter=condition)
+
+    def account_aggregates(self, start: Optional[date] = None, end: Optional[date] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Per-account tweet count and average score, reading only the two columns needed."""
+        table = self.read('tweets', columns=['account', 'engagement_score'], start=start, end=end)
+        if table.num_rows == 0:
+            return []
+
+        table = table.set_column(0, 'account', pc.cast(table.column('account'), pa.string()))
+        grouped = table.group_by('account').aggregate([
+            ('engagement_score', 'mean'),
+            ('engagement_score', 'count')
+        ])
+        rows = grouped.sort_by([('engagement_score_mean', 'descending')]).slice(0, limit).to_pylist()
+        return [
+            {'account': row['account'], 'avg_score': row['engagement_score_mean'], 'tweets': row['engagement_score_count']}
+            for row in rows
+        ]
@@ -0,0 +1,216 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional
+from .segment_log import SegmentedLog
+from ..utils.timeutils import parse_timestamp, parse_utc_timestamp
+
+ROLLUP_SUMS = ('likes', 'retweets', 'replies', 'quotes', 'engagement_score_sum')
+
+
+def directory_size(path: str) -> int:
+    """Total size in bytes of all files below `path`."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def bucket_start(value: Any, granularity: str) -> datetime:
+    ts = parse_timestamp(value).replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if granularity == 'day' else ts
+
+
+def _tweet_rollup(tweet: Dict[str, Any]) -> Dict[str, Any]:
+    score = float(tweet.get('engagement_score', 0) or 0)
+    return {
+        'bucket': tweet.get('timestamp'),
+        'account': tweet.get('account', ''),
+        'tweets': 1,
+        'likes': tweet.get('likes', 0) or 0,
+        'retweets': tweet.get('retweets', 0) or 0,
+        'replies': tweet.get('replies', 0) or 0,
+        'quotes': tweet.get('quotes', 0) or 0,
+        'engagement_score_sum': score,
+        'engagement_score_max': score
+    }
+
+
+def downsample(rows: List[Dict[str, Any]], granularity: str) -> List[Dict[str, Any]]:
+    """Merge rollup rows into one row per account and hour or day bucket.
+
+    Raw tweets can be passed through `_tweet_rollup` first, so the same
+    merge turns tweets into hourly rollups and hourly rollups into daily ones.
+    """
+    merged: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        bucket = bucket_start(row['bucket'], granularity).isoformat()
+        key = (bucket, row['account'])
+        target = merged.get(key)
+        if target is None:
+            merged[key] = dict(row, bucket=bucket, granularity=granularity)
+            continue
+        target['tweets'] += row['tweets']
+        for field in ROLLUP_SUMS:
+            target[field] += row[field]
+        target['engagement_score_max'] = max(target['engagement_score_max'], row['engagement_score_max'])
+
+    return sorted(merged.values(), key=lambda r: (r['bucket'], r['account']))
+
+
+class RetentionPolicy:
+    """How long each tier of history is kept and how much disk it may use.
+
+    The Parquet archive is the long-term tier for historical analytics, so it
+    has its own window (`archive_days`) rather than the raw one.
+    """
+
+    def __init__(self, raw_days: int = 7, hourly_days: int = 30, disk_budget_mb: int = 512, archive_days: int = 365):
+        self.raw_days = raw_days
+        self.hourly_days = hourly_days
+        self.archive_days = archive_days
+        self.disk_budget_bytes = disk_budget_mb * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> 'RetentionPolicy':
+        return cls(
+            raw_days=int(os.getenv('TWEET_RAW_RETENTION_DAYS', 7)),
+            hourly_days=int(os.getenv('TWEET_HOURLY_RETENTION_DAYS', 30)),
+            disk_budget_mb=int(os.getenv('TWEET_DISK_BUDGET_MB', 512)),
+            archive_days=int(os.getenv('TWEET_ARCHIVE_RETENTION_DAYS', 365))
+        )
+
+    def raw_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.raw_days)
+
+    def hourly_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.hourly_days)
+
+    def archive_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()) - timedelta(days=self.archive_days)
+
+
+class RetentionEngine:
+    """Applies a RetentionPolicy to the history logs, SQLite store and Parquet archive.
+
+    Raw tweets older than `raw_days` are downsampled into hourly rollups
+    before their log segments are removed; hourly rollups older than
+    `hourly_days` are folded into daily rollups, which are kept. Archive
+    day partitions older than `archive_days` are dropped. If the history
+    still exceeds the disk budget, the oldest raw segments and archive
+    partitions are shed until it fits.
+
+    Record times are parsed into aware UTC datetimes before they are
+    compared with a cutoff, since logs mix naive and offset timestamps.
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        history_dir: str,
+        tweet_log: SegmentedLog,
+        other_logs: Optional[List[SegmentedLog]] = None,
+        store=None,
+        archive=None
+    ):
+        self.policy = policy
+        self.history_dir = history_dir
+        self.tweet_log = tweet_log
+        self.other_logs = other_logs or []
+        self.store = store
+        self.archive = archive
+        self.hourly_log = SegmentedLog(os.path.join(history_dir, 'rollups', 'hourly'), time_key='bucket', max_segment_bytes=1024 * 1024)
+        self.daily_log = SegmentedLog(os.path.join(history_dir, 'rollups', 'daily'), time_key='bucket', max_segment_bytes=1024 * 1024)
+
+    def disk_usage(self) -> int:
+        usage = directory_size(self.history_dir)
+        if self.archive is not None:
+            usage += directory_size(self.archive.root)
+        if self.store is not None:
+            for suffix in ('', '-wal', '-shm'):
+                path = f"{self.store.path}{suffix}"
+                if os.path.exists(path):
+                    usage += os.path.getsize(path)
+        return usage
+
+    @staticmethod
+    def _rotate(log: SegmentedLog, now: datetime):
+        """Seal a log's active segment once it holds a day of records.
+
+        `expire` never removes the active segment, so without this a log that
+        grows slowly would keep its old records until the segment fills up.
+        """
+        active = log.segments[-1] if log.segments else None
+        if active and active['first_ts'] and parse_utc_timestamp(active['first_ts']) < parse_utc_timestamp(now - timedelta(days=1)):
+            log.seal()
+
+    def _roll_up_tweets(self, tweets: List[Dict[str, Any]]) -> int:
+        rollups = downsample([_tweet_rollup(t) for t in tweets], 'hour')
+        return self.hourly_log.append(rollups)
+
+    def rollups(self, granularity: str = 'hour', start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Rollups in a time range, with rows for the same bucket merged."""
+        log = self.daily_log if granularity == 'day' else self.hourly_log
+        return downsample(list(log.read(start, end)), granularity)
+
+    def _enforce_budget(self, report: Dict[str, Any]):
+        while self.disk_usage() > self.policy.disk_budget_bytes:
+            # Shed whichever is older: the oldest sealed raw segment or the
+            # oldest closed archive day
+            sealed = self.tweet_log.segments[:-1]
+            # Archive partitions are named by local date, as parse_timestamp returns it
+            oldest_segment = parse_timestamp(sealed[0]['first_ts']).date().isoformat() if sealed else None
+            archive_days = self.archive.partitions('tweets')[:-1] if self.archive is not None else []
+            oldest_day = archive_days[0] if archive_days else None
+
+            if oldest_segment is None and oldest_day is None:
+                report['over_budget'] = True
+                return
+            if oldest_day is not None and (oldest_segment is None or oldest_day <= oldest_segment):
+                report['partitions_dropped'] += self.archive.drop_partitions(
+                    'tweets', date.fromisoformat(oldest_day) + timedelta(days=1)
+                )
+            else:
+                expired = self.tweet_log.expire(count=1)
+                report['raw_expired'] += len(expired)
+                report['hourly_rollups'] += self._roll_up_tweets(expired)
+
+    def run(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Apply the policy once. Returns counts of what was expired, rolled up and dropped."""
+        now = now or datetime.now()
+        raw_cutoff = self.policy.raw_cutoff(now)
+        report = {
+            'raw_expired': 0,
+            'hourly_rollups': 0,
+            'daily_rollups': 0,
+            'rows_pruned': 0,
+            'partitions_dropped': 0,
+            'over_budget': False
+        }
+
+        for log in [self.tweet_log, self.hourly_log, *self.other_logs]:
+            self._rotate(log, now)
+
+        expired = self.tweet_log.expire(before=raw_cutoff)
+        report['raw_expired'] = len(expired)
+        report['hourly_rollups'] = self._roll_up_tweets(expired)
+        for log in self.other_logs:
+            log.expire(before=raw_cutoff)
+
+        old_hourly = self.hourly_log.expire(before=self.policy.hourly_cutoff(now))
+        report['daily_rollups'] = self.daily_log.append(downsample(old_hourly, 'day'))
+
+        if self.store is not None:
+            report['rows_pruned'] = self.store.prune_before(raw_cutoff)
+
+        if self.archive is not None:
+            archive_cutoff = self.policy.archive_cutoff(now).date()
+            for kind in self.archive.DATASETS:
+                report['partitions_dropped'] += self.archive.drop_partitions(kind, archive_cutoff)
+
+        self._enforce_budget(report)
+        report['disk_usage'] = self.disk_usage()
+        return report
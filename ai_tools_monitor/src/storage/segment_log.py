@@ -0,0 +1,217 @@
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Type
+from ..utils.serialization import dumps, loads, validate
+from ..utils.timeutils import parse_utc_timestamp
+
+
+class SegmentedLog:
+    """Append-only NDJSON log split into size-bounded segments.
+
+    Records are appended one JSON document per line to the active segment;
+    once it grows past `max_segment_bytes` a new segment is started. An
+    `index.json` next to the segments records each segment's time range and
+    record count, so range reads only open segments that can match. Records
+    are validated against `record_type`, when one is given, as they are
+    appended; reads decode them without it.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(
+        self,
+        directory: str,
+        time_key: str = 'timestamp',
+        max_segment_bytes: int = 8 * 1024 * 1024,
+        record_type: Type = Any
+    ):
+        self.directory = directory
+        self.time_key = time_key
+        self.record_type = record_type
+        self.max_segment_bytes = max_segment_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Any]:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return loads(f.read())
+        return {'segments': []}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(self.index))
+        os.replace(tmp_path, path)
+
+    def segment_path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        return self.index['segments']
+
+    def _new_segment(self) -> Dict[str, Any]:
+        number = int(self.segments[-1]['name'][8:14]) + 1 if self.segments else 1
+        segment = {
+            'name': f"segment-{number:06d}.ndjson",
+            'first_ts': None,
+            'last_ts': None,
+            'records': 0,
+            'bytes': 0
+        }
+        self.segments.append(segment)
+        return segment
+
+    def _active_segment(self) -> Dict[str, Any]:
+        if not self.segments or self.segments[-1]['bytes'] >= self.max_segment_bytes:
+            return self._new_segment()
+        return self.segments[-1]
+
+    def record_time(self, record: Dict[str, Any]) -> str:
+        value = record.get(self.time_key)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value) if value else datetime.now().isoformat()
+
+    def append(self, records: List[Dict[str, Any]]) -> int:
+        """Append records, rotating segments as they fill up. Returns the count written."""
+        if not records:
+            return 0
+        if self.record_type is not Any:
+            validate(records, List[self.record_type])
+
+        i = 0
+        while i < len(records):
+            segment = self._active_segment()
+            lines = []
+            size = segment['bytes']
+            while i < len(records) and size < self.max_segment_bytes:
+                record = records[i]
+                i += 1
+                line = dumps(record) + b'\n'
+                lines.append((record, line))
+                size += len(line)
+
+            with open(self.segment_path(segment['name']), 'ab') as f:
+                f.write(b''.join(line for _, line in lines))
+
+            for record, line in lines:
+                ts = self.record_time(record)
+                if segment['first_ts'] is None or ts < segment['first_ts']:
+                    segment['first_ts'] = ts
+                if segment['last_ts'] is None or ts > segment['last_ts']:
+                    segment['last_ts'] = ts
+                segment['records'] += 1
+            segment['bytes'] = size
+
+        self._save_index()
+        return len(records)
+
+    def seal(self):
+        """Close the active segment so it can be expired; later appends start a new one."""
+        if self.segments and self.segments[-1]['records']:
+            self._new_segment()
+            self._save_index()
+
+    def size_bytes(self) -> int:
+        return sum(segment['bytes'] for segment in self.segments)
+
+    def _read_segment(self, name: str) -> List[Dict[str, Any]]:
+        path = self.segment_path(name)
+        if not os.path.exists(path):
+            return []
+        with open(path, 'rb') as f:
+            return [loads(line) for line in f if line.endswith(b'\n')]
+
+    def expire(self, before: Optional[datetime] = None, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Remove sealed segments and return the records they held.
+
+        Removes every sealed segment whose newest record is older than
+        `before`, or else the oldest `count` sealed segments. Times are
+        compared as UTC instants, whatever offset the records were written with. The active
+        segment is never removed, so segment numbers keep increasing and
+        tail positions in newer segments stay valid.
+        """
+        sealed = self.segments[:-1]
+        if before is not None:
+            cutoff = parse_utc_timestamp(before)
+            expired = [s for s in sealed if s['last_ts'] is None or parse_utc_timestamp(s['last_ts']) < cutoff]
+        else:
+            expired = sealed[:count or 0]
+        if not expired:
+            return []
+
+        records = []
+        for segment in expired:
+            records.extend(self._read_segment(segment['name']))
+
+        # Drop the segments from the index before deleting their files, so a
+        # concurrent reader never looks up a missing segment
+        names = {segment['name'] for segment in expired}
+        self.index['segments'] = [s for s in self.segments if s['name'] not in names]
+        self._save_index()
+        for name in names:
+            path = self.segment_path(name)
+            if os.path.exists(path):
+                os.remove(path)
+
+        return records
+
+    def read(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield records whose time falls within [start, end], skipping segments outside the range."""
+        for segment in list(self.segments):
+            if start and segment['last_ts'] and segment['last_ts'] < start:
+                continue
+            if end and segment['first_ts'] and segment['first_ts'] > end:
+                continue
+
+            path = self.segment_path(segment['name'])
+            if not os.path.exists(path):
+                continue
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # Partially written line
+                    record = loads(line)
+                    ts = self.record_time(record)
+                    if (start and ts < start) or (end and ts > end):
+                        continue
+                    yield record
+
+    def tail(self, position: Optional[Tuple[str, int]] = None) -> Tuple[List[Dict[str, Any]], Tuple[str, int]]:
+        """Return records appended after `position` and the position to resume from.
+
+        A position is a (segment name, byte offset) pair; pass None to read the
+        whole log. Only complete lines are consumed, so a reader polling while
+        the monitor is writing never sees a partial record.
+        """
+        self.index = self._load_index()
+        if not self.segments:
+            return [], position
+
+        names = [s['name'] for s in self.segments]
+        if position is None or position[0] not in names:
+            # Unknown or compacted-away segment: start from the oldest one
+            position = (names[0], 0)
+
+        records = []
+        segment_name, offset = position
+        for name in names[names.index(segment_name):]:
+            if name != segment_name:
+                offset = 0
+            path = self.segment_path(name)
+            if not os.path.exists(path):
+                continue
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    records.append(loads(line))
+                    offset += len(line)
+            position = (name, offset)
+
+        return records, position
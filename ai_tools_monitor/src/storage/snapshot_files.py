@@ -0,0 +1,127 @@
+import hashlib
+import os
+import tempfile
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple, Type
+from ..utils.serialization import dumps, loads, validate
+
+MANIFEST_FILE = 'data_manifest.json'
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write a file via a temporary file and rename, so readers never see a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        # mkstemp creates files as 0600; keep the permissions a plain open() would give
+        mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def encode_json(obj: Any) -> bytes:
+    return dumps(obj)
+
+
+def decode_json(data: bytes) -> Any:
+    return loads(data)
+
+
+class SnapshotManifest:
+    """Generation counter, checksum and mtime for each snapshot file.
+
+    The manifest is rewritten atomically after the files it describes, so a
+    reader that sees a new generation is guaranteed the file is complete.
+    """
+
+    def __init__(self, directory: str = '.'):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_FILE)
+
+    def read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'rb') as f:
+                return loads(f.read())
+        except (OSError, ValueError):
+            return {'generation': 0, 'files': {}}
+
+    def write_snapshots(self, snapshots: Dict[str, Any], schemas: Optional[Dict[str, Type]] = None) -> int:
+        """Atomically write each {filename: obj} and then publish a new generation.
+
+        Files listed in `schemas` are validated against their record type
+        (e.g. `List[TweetRecord]`) before anything is written.
+        """
+        for filename, schema in (schemas or {}).items():
+            if filename in snapshots:
+                validate(snapshots[filename], schema)
+
+        manifest = self.read()
+        generation = manifest.get('generation', 0) + 1
+
+        for filename, obj in snapshots.items():
+            data = encode_json(obj)
+            path = os.path.join(self.directory, filename)
+            atomic_write_bytes(path, data)
+            manifest['files'][filename] = {
+                'generation': generation,
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'size': len(data),
+                'mtime': os.path.getmtime(path),
+                'written_at': datetime.now().isoformat()
+            }
+
+        manifest['generation'] = generation
+        atomic_write_bytes(self.path, dumps(manifest, pretty=True))
+        return generation
+
+
+class SnapshotLoader:
+    """Loads snapshot files, re-parsing a file only when its generation changes.
+
+    Files that are not in the manifest (e.g. written by an older version)
+    fall back to their mtime and size as the change key.
+    """
+
+    def __init__(self, directory: str = '.'):
+        self.directory = directory
+        self.manifest = SnapshotManifest(directory)
+        self.cache: Dict[str, Tuple[Any, Any]] = {}
+
+    def generation(self) -> int:
+        return self.manifest.read().get('generation', 0)
+
+    def _change_key(self, filename: str, entry: Optional[Dict[str, Any]]) -> Any:
+        if entry:
+            return ('generation', entry['generation'])
+        stat = os.stat(os.path.join(self.directory, filename))
+        return ('stat', stat.st_mtime_ns, stat.st_size)
+
+    def load(self, filename: str, default: Any = None) -> Any:
+        """Return the parsed file, from cache when unchanged. Raises on corrupt files."""
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            return default
+
+        entry = self.manifest.read().get('files', {}).get(filename)
+        key = self._change_key(filename, entry)
+        cached = self.cache.get(filename)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        obj = decode_json(data)
+
+        # A checksum mismatch means the file was replaced after the manifest
+        # was read; return the data but do not cache it under the stale key
+        if entry is None or hashlib.sha256(data).hexdigest() == entry['sha256']:
+            self.cache[filename] = (key, obj)
+        return obj
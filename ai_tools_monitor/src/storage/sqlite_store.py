@@ -0,0 +1,234 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from sqlalchemy import create_engine, event, select, delete, func, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, Session
+from ..models import Base, API, Account, Tweet, AnalysisSnapshot
+from ..utils.ids import tweet_key
+from ..utils.serialization import dumps, loads
+from ..utils.timeutils import parse_timestamp
+
+
+def create_sqlite_engine(path: str) -> Engine:
+    """Create an engine for a SQLite file in WAL mode and make sure the schema exists."""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        # JSON columns hold raw fetcher payloads, which may contain datetimes
+        json_serializer=lambda obj: dumps(obj).decode('utf-8'),
+        json_deserializer=loads
+    )
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # WAL lets dashboards read while the monitor writes
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _upsert(model, conflict_column: str, update_columns: List[str]):
+    """Build a reusable INSERT ... ON CONFLICT DO UPDATE statement."""
+    stmt = sqlite_insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=[conflict_column],
+        set_={column: stmt.excluded[column] for column in update_columns}
+    )
+
+
+# Refreshes a tool's fields on conflict; discovered_at keeps the first sighting
+TOOL_UPSERT = _upsert(API, 'url', ['name', 'description', 'source', 'raw_data'])
+
+
+def tool_rows(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows for TOOL_UPSERT, one per URL; later duplicates win and tools without a URL are skipped."""
+    rows = {}
+    for tool in tools:
+        if not tool.get('url'):
+            continue
+        rows[tool['url']] = {
+            'name': tool.get('name', ''),
+            'description': tool.get('description', ''),
+            'url': tool['url'],
+            'source': tool.get('source') or (tool.get('raw_data') or {}).get('source'),
+            'discovered_at': parse_timestamp(tool.get('discovered_at')),
+            'raw_data': tool.get('raw_data')
+        }
+    return list(rows.values())
+
+
+class SQLiteStore:
+    """Embedded SQLite storage for tweets, accounts, tools and analysis snapshots.
+
+    Upserts are built once and executed as executemany batches inside a single
+    transaction; reads are indexed range queries so callers never have to load
+    the full history into memory.
+    """
+
+    def __init__(self, path: str = 'ai_monitor.db'):
+        self.path = path
+        self.engine = create_sqlite_engine(path)
+        self.Session = sessionmaker(bind=self.engine)
+
+        self.tweet_upsert = _upsert(Tweet, 'tweet_key', [
+            'engagement', 'engagement_score', 'engagement_rate',
+            'likes', 'retweets', 'replies', 'quotes', 'collected_at'
+        ])
+        account_stmt = sqlite_insert(Account)
+        self.account_upsert = account_stmt.on_conflict_do_update(
+            index_elements=['username'],
+            set_={
+                'last_seen': account_stmt.excluded.last_seen,
+                'tweet_count': Account.tweet_count + account_stmt.excluded.tweet_count
+            }
+        )
+
+    def session(self) -> Session:
+        """Open an ORM session, e.g. for the agents that expect one."""
+        return self.Session()
+
+    def upsert_tweets(self, tweets: List[Dict[str, Any]]) -> int:
+        """Insert or refresh tweets and their accounts in one transaction."""
+        if not tweets:
+            return 0
+
+        now = datetime.now()
+        rows = {}
+        account_counts = {}
+        for tweet in tweets:
+            key = tweet_key(tweet)
+            rows[key] = {
+                'tweet_key': key,
+                'tweet_id': str(tweet['tweet_id']) if tweet.get('tweet_id') is not None else None,
+                'account': tweet.get('account', ''),
+                'content': tweet.get('content', ''),
+                'timestamp': parse_timestamp(tweet.get('timestamp')),
+                'engagement': tweet.get('engagement', 0),
+                'engagement_score': tweet.get('engagement_score', 0),
+                'engagement_rate': tweet.get('engagement_rate', 0),
+                'likes': tweet.get('likes', 0),
+                'retweets': tweet.get('retweets', 0),
+                'replies': tweet.get('replies', 0),
+                'quotes': tweet.get('quotes', 0),
+                'collected_at': now
+            }
+            account = tweet.get('account', '')
+            account_counts[account] = account_counts.get(account, 0) + 1
+
+        with self.engine.begin() as conn:
+            conn.execute(self.tweet_upsert, list(rows.values()))
+            conn.execute(self.account_upsert, [
+                {'username': account, 'first_seen': now, 'last_seen': now, 'tweet_count': count}
+                for account, count in account_counts.items()
+            ])
+        return len(rows)
+
+    def upsert_tools(self, tools: List[Dict[str, Any]]) -> int:
+        """Insert or refresh tools keyed by URL in one transaction."""
+        rows = tool_rows(tools)
+        if not rows:
+            return 0
+
+        with self.engine.begin() as conn:
+            conn.execute(TOOL_UPSERT, rows)
+        return len(rows)
+
+    def save_analysis(self, analysis: Dict[str, Any]):
+        """Store the analysis of one cycle as a snapshot."""
+        if not analysis:
+            return
+        with self.Session() as session:
+            session.add(AnalysisSnapshot(
+                analysis_timestamp=parse_timestamp(analysis.get('analysis_timestamp')),
+                total_tweets=analysis.get('total_tweets', 0),
+                total_accounts=analysis.get('total_accounts', 0),
+                avg_engagement=analysis.get('avg_engagement', 0),
+                data=analysis
+            ))
+            session.commit()
+
+    def prune_before(self, before: datetime) -> int:
+        """Delete tweets and analysis snapshots older than `before`. Returns the rows removed.
+
+        Space is reclaimed with VACUUM once free pages make up a quarter of
+        the file, rather than on every prune, and the WAL is checkpointed.
+        """
+        with self.engine.begin() as conn:
+            removed = conn.execute(delete(Tweet).where(Tweet.timestamp < before)).rowcount
+            removed += conn.execute(
+                delete(AnalysisSnapshot).where(AnalysisSnapshot.analysis_timestamp < before)
+            ).rowcount
+
+        if removed:
+            with self.engine.connect() as conn:
+                free_pages = conn.execute(text('PRAGMA freelist_count')).scalar()
+                total_pages = conn.execute(text('PRAGMA page_count')).scalar()
+            with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                if total_pages and free_pages / total_pages > 0.25:
+                    conn.execute(text('VACUUM'))
+                # Fold the WAL back into the database so it does not keep growing
+                conn.execute(text('PRAGMA wal_checkpoint(TRUNCATE)'))
+        return removed
+
+    def tweets_between(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        account: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Tweets in a time range, newest first, optionally for one account."""
+        query = select(Tweet).where(Tweet.timestamp >= start)
+        if end is not None:
+            query = query.where(Tweet.timestamp < end)
+        if account is not None:
+            query = query.where(Tweet.account == account)
+        query = query.order_by(Tweet.timestamp.desc())
+        if limit is not None:
+            query = query.limit(limit)
+
+        with self.Session() as session:
+            return [tweet.to_dict() for tweet in session.scalars(query)]
+
+    def top_tweets_between(self, start: datetime, end: Optional[datetime] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Highest-scoring tweets in a time range."""
+        query = select(Tweet).where(Tweet.timestamp >= start)
+        if end is not None:
+            query = query.where(Tweet.timestamp < end)
+        query = query.order_by(Tweet.engagement_score.desc()).limit(limit)
+
+        with self.Session() as session:
+            return [tweet.to_dict() for tweet in session.scalars(query)]
+
+    def account_aggregates(self, start: datetime, end: Optional[datetime] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Per-account tweet count and average score over a time range, best first."""
+        avg_score = func.avg(Tweet.engagement_score)
+        query = (
+            select(Tweet.account, func.count(Tweet.id), avg_score)
+            .where(Tweet.timestamp >= start)
+        )
+        if end is not None:
+            query = query.where(Tweet.timestamp < end)
+        query = query.group_by(Tweet.account).order_by(avg_score.desc()).limit(limit)
+
+        with self.Session() as session:
+            return [
+                {'account': account, 'tweets': count, 'avg_score': score or 0}
+                for account, count, score in session.execute(query)
+            ]
+
+    def latest_analysis(self) -> Optional[Dict[str, Any]]:
+        query = select(AnalysisSnapshot).order_by(AnalysisSnapshot.analysis_timestamp.desc()).limit(1)
+        with self.Session() as session:
+            snapshot = session.scalars(query).first()
+            return snapshot.data if snapshot else None
+
+    def recent_tools(self, since: datetime) -> List[Dict[str, Any]]:
+        query = select(API).where(API.discovered_at >= since).order_by(API.discovered_at.desc())
+        with self.Session() as session:
+            return [tool.to_dict() for tool in session.scalars(query)]
@@ -61,6 +61,8 @@ if st.sidebar.button("Fetch Tools"):
             st.session_state.analysis = analysis
             
             st.success(f"Successfully fetched {len(tools)} tools!")
+            if agent.last_report.get('timed_out'):
+                st.warning(f"Timed out: {', '.join(agent.last_report['timed_out'])}")
         except Exception as e:
             st.error(f"Error fetching tools: {str(e)}")
         finally:
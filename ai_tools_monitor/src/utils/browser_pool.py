@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import os
+from typing import List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+
+class BrowserLease:
+    """A browser context and page checked out of the pool."""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.broken = False
+
+
+class BrowserPool:
+    """Long-lived Chromium shared by all Playwright-based fetchers.
+
+    Launching a browser costs seconds and hundreds of MB, so one browser is
+    kept running and fetchers check out isolated contexts from it. A returned
+    context has its cookies cleared and is reused until it has served
+    `max_uses` leases, then closed and replaced. Before a context is handed
+    out the browser and page are health-checked; a crashed or disconnected
+    browser is relaunched. Playwright objects are bound to the event loop
+    that created them, so a new loop gets a fresh browser.
+    """
+
+    _shared: Optional['BrowserPool'] = None
+
+    def __init__(self, max_contexts: int = 4, max_uses: int = 20, headless: bool = True):
+        self.max_contexts = max_contexts
+        self.max_uses = max_uses
+        self.headless = headless
+        self.logger = logging.getLogger('BrowserPool')
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[BrowserLease] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def shared(cls) -> 'BrowserPool':
+        if cls._shared is None:
+            cls._shared = cls(
+                int(os.getenv('BROWSER_POOL_SIZE', 4)),
+                int(os.getenv('BROWSER_CONTEXT_MAX_USES', 20))
+            )
+        return cls._shared
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Objects from a previous loop cannot be used (or closed) from this one
+            self._playwright = None
+            self._browser = None
+            self._idle = []
+            self._slots = asyncio.Semaphore(self.max_contexts)
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+    def _healthy(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._lock:
+            if self._healthy():
+                return self._browser
+            if self._browser is not None:
+                self.logger.warning("Browser disconnected, relaunching")
+            await self._shutdown_browser()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            return self._browser
+
+    async def acquire(self, wait: bool = True) -> Optional[BrowserLease]:
+        """Check out a context and page, waiting while all `max_contexts` are in use.
+
+        With `wait=False`, returns None instead of waiting, so a fetcher that
+        already holds a lease can ask for extra pages without deadlocking
+        against other fetchers.
+        """
+        self._bind_loop()
+        if not wait and self._slots.locked():
+            return None
+        await self._slots.acquire()
+        try:
+            browser = await self._ensure_browser()
+            while self._idle:
+                lease = self._idle.pop()
+                if not lease.page.is_closed():
+                    return lease
+                await self._discard(lease)
+            context = await browser.new_context()
+            return BrowserLease(context, await context.new_page())
+        except Exception:
+            self._slots.release()
+            raise
+
+    async def release(self, lease: BrowserLease):
+        """Return a lease to the pool; broken or worn-out contexts are closed instead."""
+        try:
+            lease.uses += 1
+            if lease.broken or lease.uses >= self.max_uses or lease.page.is_closed() or not self._healthy():
+                await self._discard(lease)
+                return
+            try:
+                await lease.context.clear_cookies()
+                self._idle.append(lease)
+            except Exception:
+                await self._discard(lease)
+        finally:
+            self._slots.release()
+
+    async def _discard(self, lease: BrowserLease):
+        try:
+            await lease.context.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing browser context: {str(e)}")
+
+    async def _shutdown_browser(self):
+        for lease in self._idle:
+            await self._discard(lease)
+        self._idle = []
+        try:
+            if self._browser is not None and self._browser.is_connected():
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        except Exception as e:
+            self.logger.error(f"Error shutting down browser: {str(e)}")
+        self._browser = None
+        self._playwright = None
+
+    async def close(self):
+        """Close the browser; the next `acquire` launches a new one."""
+        if self._loop is asyncio.get_running_loop():
+            await self._shutdown_browser()
+        self._loop = None
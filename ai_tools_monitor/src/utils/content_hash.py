@@ -0,0 +1,85 @@
+import hashlib
+import os
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
+from .serialization import dumps, loads
+from ..storage.snapshot_files import atomic_write_bytes
+
+
+class ContentHashStore:
+    """Content hashes from the last run, grouped by namespace and key.
+
+    Fetchers record a hash per page and per card so unchanged content can be
+    skipped before parsing; ContentExtractor records a hash per tool so
+    unchanged tools are not sent to the LLM again.
+
+    Hashes that mark content as already handled are staged and only take
+    effect on `commit`, once the caller has persisted that content; a failed
+    save leaves them out, so the content is fetched again next run.
+    """
+
+    _shared: Optional['ContentHashStore'] = None
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data: Dict[str, Dict[str, Any]] = self._load()
+        # (namespace, key) -> value, waiting for `commit`
+        self.pending: Dict[Tuple[str, str], Any] = {}
+
+    @classmethod
+    def shared(cls) -> 'ContentHashStore':
+        if cls._shared is None:
+            cls._shared = cls(os.getenv('CONTENT_HASH_PATH', os.path.join('data', 'content_hashes.json')))
+        return cls._shared
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'rb') as f:
+                return loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, namespace: str, key: str) -> Any:
+        return self.data.get(namespace, {}).get(key)
+
+    def set(self, namespace: str, key: str, value: Any):
+        self.data.setdefault(namespace, {})[key] = value
+
+    def stage(self, namespace: str, key: str, value: Any):
+        """Record a value that only takes effect once `commit` is called."""
+        self.pending[(namespace, key)] = value
+
+    def commit(self, keys: Optional[Iterable[str]] = None):
+        """Apply the staged values, all of them or only those for `keys`, and save."""
+        keys = None if keys is None else set(keys)
+        for namespace, key in list(self.pending):
+            if keys is None or key in keys:
+                self.set(namespace, key, self.pending.pop((namespace, key)))
+        self.save()
+
+    def page_unchanged(self, url: str, html: str) -> bool:
+        """True if the page is identical to the last run, so parsing can be skipped."""
+        entry = self.get('pages', url)
+        return bool(entry) and entry.get('page') == self.digest(html)
+
+    def changed_cards(self, url: str, html: str, cards: list, markup: Callable[[Any], str] = str) -> list:
+        """Keep only the cards of a page that are new or changed since its last run.
+
+        Cards are hashed by their markup (`markup(card)`, by default `str(card)`).
+        The page hash and the hashes of all its cards are staged for the next
+        run; call `commit` once the returned cards have been persisted.
+        """
+        previous = set((self.get('pages', url) or {}).get('cards', []))
+        hashes = [self.digest(markup(card)) for card in cards]
+        changed = [card for card, digest in zip(cards, hashes) if digest not in previous]
+
+        self.stage('pages', url, {'page': self.digest(html), 'cards': hashes})
+        return changed
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        atomic_write_bytes(self.path, dumps(self.data))
@@ -0,0 +1,151 @@
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterable, Optional
+from .serialization import dumps, loads
+from ..storage.snapshot_files import atomic_write_bytes
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys, using double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, bits: Optional[bytearray] = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class SeenTweets:
+    """Persistent record of tweet ids already ingested.
+
+    The most recent ids are kept in an exact set; every id is also added to
+    a Bloom filter that covers older history. When the filter reaches
+    capacity it becomes the previous generation and a fresh one is started,
+    so memory stays bounded and ids are remembered for roughly two
+    generations. A Bloom hit can be a false positive (about `error_rate` of
+    ids not seen recently), in which case a new tweet is dropped.
+    """
+
+    STATE_FILE = 'seen_tweets.json'
+    CURRENT_FILE = 'seen_tweets.bloom'
+    PREVIOUS_FILE = 'seen_tweets.prev.bloom'
+
+    def __init__(self, directory: str, recent_size: int = 50000, bloom_capacity: int = 1000000, error_rate: float = 0.001):
+        self.directory = directory
+        self.recent_size = recent_size
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+        self.recent: 'OrderedDict[str, None]' = OrderedDict()
+        self.current = BloomFilter(bloom_capacity, error_rate)
+        self.previous: Optional[BloomFilter] = None
+        self.load()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def load(self):
+        state_path = self._path(self.STATE_FILE)
+        if not os.path.exists(state_path):
+            return
+        with open(state_path, 'rb') as f:
+            state = loads(f.read())
+        self.recent = OrderedDict.fromkeys(state.get('recent', [])[-self.recent_size:])
+        if state.get('bloom_capacity') != self.bloom_capacity or state.get('error_rate') != self.error_rate:
+            # Filter geometry changed, so the stored bit arrays cannot be reused
+            return
+
+        with open(self._path(self.CURRENT_FILE), 'rb') as f:
+            self.current = BloomFilter(self.bloom_capacity, self.error_rate, bytearray(f.read()), state.get('current_count', 0))
+        if state.get('has_previous') and os.path.exists(self._path(self.PREVIOUS_FILE)):
+            with open(self._path(self.PREVIOUS_FILE), 'rb') as f:
+                self.previous = BloomFilter(self.bloom_capacity, self.error_rate, bytearray(f.read()), self.bloom_capacity)
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write_bytes(self._path(self.CURRENT_FILE), bytes(self.current.bits))
+        if self.previous is not None:
+            atomic_write_bytes(self._path(self.PREVIOUS_FILE), bytes(self.previous.bits))
+        # The state file is written last, so it never refers to missing filters
+        atomic_write_bytes(self._path(self.STATE_FILE), dumps({
+            'bloom_capacity': self.bloom_capacity,
+            'error_rate': self.error_rate,
+            'current_count': self.current.count,
+            'has_previous': self.previous is not None,
+            'recent': list(self.recent)
+        }))
+
+    def __contains__(self, tweet_id: str) -> bool:
+        if tweet_id in self.recent:
+            return True
+        return tweet_id in self.current or (self.previous is not None and tweet_id in self.previous)
+
+    def add(self, tweet_id: str):
+        self.recent[tweet_id] = None
+        if len(self.recent) > self.recent_size:
+            self.recent.popitem(last=False)
+
+        if self.current.full:
+            self.previous = self.current
+            self.current = BloomFilter(self.bloom_capacity, self.error_rate)
+        self.current.add(tweet_id)
+
+    def mark(self, tweets: List[Dict[str, Any]]):
+        """Mark tweets as seen without filtering them, e.g. when restoring a checkpoint."""
+        for tweet in tweets:
+            if tweet.get('tweet_id') is not None:
+                self.add(str(tweet['tweet_id']))
+
+    def unseen(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Like `filter_new`, but without marking the tweets as seen."""
+        fresh = []
+        batch = set()
+        for tweet in tweets:
+            if tweet.get('tweet_id') is None:
+                fresh.append(tweet)
+                continue
+            tweet_id = str(tweet['tweet_id'])
+            if tweet_id in batch or tweet_id in self:
+                continue
+            batch.add(tweet_id)
+            fresh.append(tweet)
+        return fresh
+
+    def filter_new(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the tweets whose id has not been seen, marking them as seen.
+
+        Tweets without an id (e.g. simulated ones) are always kept.
+        """
+        fresh = []
+        for tweet in tweets:
+            if tweet.get('tweet_id') is None:
+                fresh.append(tweet)
+                continue
+            tweet_id = str(tweet['tweet_id'])
+            if tweet_id in self:
+                continue
+            self.add(tweet_id)
+            fresh.append(tweet)
+        return fresh
@@ -1,6 +1,9 @@
 import asyncio
+import functools
 import hashlib
-from typing import List, Dict, Any, Callable
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Optional
 from datetime import datetime, timedelta
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -18,6 +21,72 @@ class RateLimiter:
                 await asyncio.sleep(1.0 / self.calls_per_second - time_since_last_call)
             self.last_call = datetime.now()
 
+class BlockingCallRunner:
+    """Runs blocking SDK calls (praw, tweepy, ...) in a bounded thread pool.
+
+    Each call is awaited with a timeout so one slow API cannot stall a
+    gather. A timed-out call keeps its worker thread until the SDK returns,
+    so the pool size also bounds how many stuck calls can pile up.
+    """
+
+    def __init__(self, max_workers: int = 4, timeout: float = 30.0):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='blocking-call')
+        self.timeout = timeout
+
+    async def run(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run func(*args, **kwargs) in the pool; raises asyncio.TimeoutError after the timeout."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout or self.timeout)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class ParsePool:
+    """Process pool that turns raw HTML into tool records off the event loop.
+
+    Fetchers only do I/O and hand each page to a module-level parse function
+    run here, so a large page no longer stalls other in-flight fetches and
+    parsing spreads across cores. At most `max_pending` pages are queued or
+    being parsed at once; further submitters wait, which bounds the memory
+    held by pages waiting for a worker.
+    """
+
+    _shared: Optional['ParsePool'] = None
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending or self.max_workers * 2
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def shared(cls) -> 'ParsePool':
+        if cls._shared is None:
+            cls._shared = cls(
+                int(os.getenv('PARSE_WORKERS', 0)) or None,
+                int(os.getenv('PARSE_MAX_PENDING', 0)) or None
+            )
+        return cls._shared
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) in a worker process; func must be a picklable module-level function."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            # Semaphores are bound to the loop they are first used on
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._loop = loop
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        async with self._slots:
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
 def generate_tool_hash(tool: Dict[str, Any]) -> str:
     """Generate a unique hash for a tool based on its name and URL."""
     key = f"{tool['name']}:{tool['url']}"
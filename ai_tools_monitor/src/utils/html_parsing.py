@@ -0,0 +1,92 @@
+import html as html_lib
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+from .serialization import loads
+from .text import normalize_whitespace
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Fastest tree builder available to BeautifulSoup; html.parser is the slow pure-Python fallback
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+_TAG_RE = re.compile(r'<!--.*?-->|<[^>]*>', re.DOTALL)
+
+
+def parse_cards(html: str, name: str = 'div', class_: Optional[str] = None, parser: Optional[str] = None) -> List[Tag]:
+    """Parse only the card containers of a page and return them.
+
+    A SoupStrainer keeps BeautifulSoup from building tree nodes for anything
+    outside the matching `name`/`class_` elements, so navigation, scripts and
+    footers cost no more than tokenizing. The returned cards support the usual
+    `find`/`find_all` API.
+    """
+    strainer = SoupStrainer(name, class_=class_)
+    soup = BeautifulSoup(html, parser or HTML_PARSER, parse_only=strainer)
+    return soup.find_all(name, class_=class_)
+
+
+def strip_tags(text: str) -> str:
+    """Remove markup from a short text fragment without building a DOM."""
+    if '<' not in text and '&' not in text:
+        return text
+    return html_lib.unescape(_TAG_RE.sub('', text))
+
+
+_NEXT_DATA_RE = re.compile(r'<script[^>]*id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL)
+
+
+def extract_embedded_json(html: str) -> Optional[Any]:
+    """The `__NEXT_DATA__` JSON blob that Next.js sites embed for hydration, if any."""
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        return loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def find_record_list(data: Any, required: Iterable[str]) -> Optional[List[Dict[str, Any]]]:
+    """First non-empty list of objects that all have the `required` keys, searched depth-first."""
+    required = tuple(required)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            if node and all(isinstance(item, dict) and all(key in item for key in required) for item in node):
+                return node
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            stack.extend(reversed(list(node.values())))
+    return None
+
+
+def _read_field(el: Tag, field: Dict[str, Any]) -> Optional[str]:
+    return el.get(field['attr']) if field.get('attr') else normalize_whitespace(el.get_text(' '))
+
+
+def extract_cards_static(html: str, selector: str, fields: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Server-side counterpart of the browser card extraction spec.
+
+    Takes the same `fields` spec as `PlaywrightBaseFetcher.extract_cards` and
+    applies it to static HTML with CSS selectors. Module-level so it can run
+    in a ParsePool worker.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    cards = []
+    for card in soup.select(selector):
+        record = {}
+        for key, field in fields.items():
+            if field.get('all'):
+                record[key] = [_read_field(el, field) for el in card.select(field['selector'])]
+            else:
+                el = card.select_one(field['selector'])
+                record[key] = _read_field(el, field) if el is not None else None
+        cards.append(record)
+    return cards
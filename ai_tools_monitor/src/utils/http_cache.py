@@ -0,0 +1,120 @@
+import hashlib
+import os
+import time
+from typing import Dict, Any, Optional
+from .serialization import dumps, loads
+from ..storage.snapshot_files import atomic_write_bytes
+
+
+class HTTPCache:
+    """Disk-backed cache of response bodies and their validators, per URL.
+
+    Stored ETag / Last-Modified values are sent back as If-None-Match /
+    If-Modified-Since so unchanged pages come back as a bodyless 304 and are
+    served from disk. Bodies are evicted least-recently-used once the cache
+    exceeds `max_bytes`.
+
+    Hits only update the recency order in memory; the index is written when
+    an entry is stored or evicted, and by `flush` at the end of a run.
+    """
+
+    INDEX_FILE = 'index.json'
+    _shared: Optional['HTTPCache'] = None
+
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.index: Dict[str, Dict[str, Any]] = self._load_index()
+        # Set when the in-memory index differs from the one on disk
+        self.dirty = False
+
+    @classmethod
+    def shared(cls) -> 'HTTPCache':
+        if cls._shared is None:
+            cls._shared = cls(
+                os.getenv('HTTP_CACHE_DIR', os.path.join('data', 'http_cache')),
+                int(os.getenv('HTTP_CACHE_MAX_MB', 64)) * 1024 * 1024
+            )
+        return cls._shared
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        try:
+            with open(path, 'rb') as f:
+                return loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        atomic_write_bytes(os.path.join(self.directory, self.INDEX_FILE), dumps(self.index))
+        self.dirty = False
+
+    def flush(self):
+        """Write the index if hits have changed it since it was last saved."""
+        if self.dirty:
+            self._save_index()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Validator headers for a conditional GET, empty if the URL is not cached."""
+        entry = self.index.get(self.key(url))
+        if not entry or not os.path.exists(self._body_path(self.key(url))):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached body for a URL (e.g. after a 304), marking it recently used."""
+        key = self.key(url)
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                body = f.read().decode('utf-8')
+        except OSError:
+            del self.index[key]
+            self.dirty = True
+            return None
+        entry['last_used'] = time.time()
+        self.dirty = True
+        return body
+
+    def store(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Cache a 200 response. Responses without validators cannot be revalidated and are skipped."""
+        if not etag and not last_modified:
+            return
+        key = self.key(url)
+        data = body.encode('utf-8')
+        atomic_write_bytes(self._body_path(key), data)
+        self.index[key] = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': len(data),
+            'last_used': time.time()
+        }
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        total = sum(entry['size'] for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['size']
+            del self.index[key]
+            path = self._body_path(key)
+            if os.path.exists(path):
+                os.remove(path)
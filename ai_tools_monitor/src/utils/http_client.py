@@ -0,0 +1,61 @@
+import asyncio
+from typing import Optional
+import aiohttp
+
+
+class HTTPClientManager:
+    """Process-wide pooled aiohttp session shared by all fetchers.
+
+    One connector keeps connections alive between requests, caches DNS
+    lookups and caps connections per host, so fetchers reuse TLS sessions
+    instead of each opening their own. aiohttp sessions are bound to an
+    event loop; when called from a new loop (e.g. a later `asyncio.run`) a
+    fresh session is created for it.
+    """
+
+    _shared: Optional['HTTPClientManager'] = None
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 30.0
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def shared(cls) -> 'HTTPClientManager':
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+        self._loop = None
@@ -0,0 +1,8 @@
+from typing import Dict, Any
+
+
+def tweet_key(tweet: Dict[str, Any]) -> str:
+    """Stable key for a tweet: its id when known, otherwise account and content."""
+    if tweet.get('tweet_id') is not None:
+        return str(tweet['tweet_id'])
+    return f"{tweet.get('account', '')}:{tweet.get('content', '')}"
@@ -0,0 +1,204 @@
+import heapq
+import math
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from .timeutils import parse_timestamp
+from .ids import tweet_key
+
+
+def _median(values: List[float]) -> float:
+    return values[len(values) // 2] if values else 0.0
+
+
+def _remove_sorted(values: List[float], value: float):
+    index = bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        del values[index]
+
+
+class RewriteQueue:
+    """Priority queue of rewrite candidates ranked by opportunity.
+
+    A tweet's opportunity is how far it falls below the median engagement of
+    its account (or of all tweets, while the account has too few tweets for a
+    useful median), decayed by age. The age decay is the same factor for
+    every tweet at a given moment, so the heap is keyed by a time-invariant
+    priority, log(gap) + created / half_life * ln 2, and only needs re-keying
+    when a median moves. When it does, only that account's tweets below the
+    old or new median are re-keyed; tweets at or above it stay out of the
+    heap until a median rises past them. Tweets older than the retention
+    cutoff are dropped by `trim`.
+    """
+
+    def __init__(
+        self,
+        score_func: Callable[[Dict[str, Any]], float],
+        half_life_hours: float = 24.0,
+        min_account_tweets: int = 3
+    ):
+        self.score_func = score_func
+        self.half_life_hours = half_life_hours
+        self.min_account_tweets = min_account_tweets
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.rewrites: Dict[str, Dict[str, Any]] = {}
+        self.account_scores: Dict[str, List[float]] = defaultdict(list)
+        self.all_scores: List[float] = []
+        # Per tweet key: (account, score) counted in the medians, and creation time for trimming
+        self.scores: Dict[str, Tuple[str, float]] = {}
+        self.created: Dict[str, datetime] = {}
+        # Queued tweets per account as sorted (score, key), to find those below a median
+        self.account_entries: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        # Heap of (-priority, seq, key); an item is live only while `live[key] == seq`
+        self.heap: List[Tuple[float, int, str]] = []
+        self.live: Dict[str, int] = {}
+        self.seq = 0
+        # Reference median each account was last keyed against, accounts to re-key,
+        # and tweets pushed since their account was keyed
+        self.keyed_reference: Dict[str, float] = {}
+        self.dirty: set = set()
+        self.unkeyed: Dict[str, List[str]] = defaultdict(list)
+        self.epoch = datetime.now()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def reference_score(self, account: str) -> float:
+        """Median engagement a tweet from this account is compared against."""
+        scores = self.account_scores.get(account, [])
+        if len(scores) >= self.min_account_tweets:
+            return _median(scores)
+        return _median(self.all_scores)
+
+    def opportunity(self, tweet: Dict[str, Any], now: Optional[datetime] = None) -> float:
+        """Engagement gap to the reference median, decayed by tweet age."""
+        gap = self.reference_score(tweet.get('account', '')) - self.score_func(tweet)
+        if gap <= 0:
+            return 0.0
+
+        now = now or datetime.now()
+        created = parse_timestamp(tweet.get('timestamp'))
+        age_hours = max((now - created).total_seconds() / 3600, 0.0)
+
+        return gap * math.pow(0.5, age_hours / self.half_life_hours)
+
+    def _priority(self, key: str, gap: float) -> float:
+        """log of gap * 2^(created / half_life), which orders tweets like `opportunity` at any time."""
+        hours = (self.created[key] - self.epoch).total_seconds() / 3600
+        return math.log(gap) + hours / self.half_life_hours * math.log(2)
+
+    def _key(self, key: str, gap: float):
+        if gap <= 0:
+            self.live.pop(key, None)
+            return
+        self.seq += 1
+        self.live[key] = self.seq
+        heapq.heappush(self.heap, (-self._priority(key, gap), self.seq, key))
+
+    def _rekey(self, account: str):
+        """Re-key the account's queued tweets whose gap may have changed with its reference median."""
+        reference = self.reference_score(account)
+        unkeyed = self.unkeyed.pop(account, [])
+        previous = self.keyed_reference.get(account)
+        self.keyed_reference[account] = reference
+        if previous == reference:
+            # Same median, so only the newly pushed tweets need keys
+            for key in unkeyed:
+                if key in self.entries:
+                    self._key(key, reference - self.scores[key][1])
+            return
+
+        entries = self.account_entries.get(account, [])
+        # Tweets below either median are the only ones whose gap is or was positive
+        end = bisect_left(entries, (max(reference, previous if previous is not None else reference),))
+        for score, key in entries[:end]:
+            self._key(key, reference - score)
+
+    def push(self, tweet: Dict[str, Any]):
+        """Add a newly arrived tweet, ignoring ones already queued or rewritten."""
+        key = tweet_key(tweet)
+        if key in self.entries or key in self.rewrites:
+            return
+
+        account = tweet.get('account', '')
+        score = self.score_func(tweet)
+        insort(self.account_scores[account], score)
+        insort(self.all_scores, score)
+        self.scores[key] = (account, score)
+        self.created[key] = parse_timestamp(tweet.get('timestamp'))
+        self.entries[key] = tweet
+        insort(self.account_entries[account], (score, key))
+        self.unkeyed[account].append(key)
+        self.dirty.add(account)
+
+    def push_many(self, tweets: List[Dict[str, Any]]):
+        for tweet in tweets:
+            self.push(tweet)
+
+    def _refresh(self):
+        """Re-key accounts whose reference median moved since they were last keyed."""
+        for account in self.account_entries:
+            if account not in self.dirty and self.keyed_reference.get(account) != self.reference_score(account):
+                # Accounts still compared against the median of all tweets
+                self.dirty.add(account)
+        for account in self.dirty:
+            self._rekey(account)
+        self.dirty.clear()
+        if len(self.heap) > 2 * len(self.live) + 64:
+            self.heap = [item for item in self.heap if self.live.get(item[2]) == item[1]]
+            heapq.heapify(self.heap)
+
+    def _dequeue(self, key: str) -> Optional[Dict[str, Any]]:
+        tweet = self.entries.pop(key, None)
+        self.live.pop(key, None)
+        if tweet is not None:
+            account, score = self.scores[key]
+            entries = self.account_entries[account]
+            index = bisect_left(entries, (score, key))
+            if index < len(entries) and entries[index] == (score, key):
+                del entries[index]
+            if not entries:
+                del self.account_entries[account]
+                self.keyed_reference.pop(account, None)
+                self.unkeyed.pop(account, None)
+        return tweet
+
+    def pop_top(self, budget: int) -> List[Dict[str, Any]]:
+        """Remove and return up to `budget` tweets with the highest opportunity.
+
+        Priorities follow the current medians, so tweets queued while the
+        medians were different are ranked correctly.
+        """
+        self._refresh()
+        top = []
+        while self.heap and len(top) < budget:
+            _, seq, key = heapq.heappop(self.heap)
+            if self.live.get(key) == seq:
+                top.append(self._dequeue(key))
+        return top
+
+    def mark_rewritten(self, tweet: Dict[str, Any], rewrite: Dict[str, Any]):
+        """Cache a rewrite so the tweet is never queued again."""
+        key = tweet_key(tweet)
+        self.rewrites[key] = rewrite
+        self._dequeue(key)
+        self.created.setdefault(key, parse_timestamp(tweet.get('timestamp')))
+
+    def cached_rewrite(self, tweet: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.rewrites.get(tweet_key(tweet))
+
+    def trim(self, cutoff: datetime):
+        """Forget tweets created before `cutoff`: queued entries, rewrites and their scores."""
+        for key in [key for key, created in self.created.items() if created < cutoff]:
+            self._dequeue(key)
+            del self.created[key]
+            self.rewrites.pop(key, None)
+            if key in self.scores:
+                account, score = self.scores.pop(key)
+                _remove_sorted(self.account_scores[account], score)
+                if not self.account_scores[account]:
+                    del self.account_scores[account]
+                _remove_sorted(self.all_scores, score)
+                self.dirty.add(account)
+        self.dirty &= set(self.account_entries)
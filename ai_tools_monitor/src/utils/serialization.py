@@ -0,0 +1,112 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Type, TypedDict, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+
+# Keeps integer counts as ints instead of widening them to floats
+Number = Union[int, float]
+
+
+class TweetRecord(TypedDict, total=False):
+    account: str
+    tweet_id: Optional[Union[int, str]]
+    content: str
+    timestamp: str
+    engagement: Number
+    engagement_score: Number
+    engagement_rate: Number
+    likes: Number
+    retweets: Number
+    replies: Number
+    quotes: Number
+
+
+class RewriteRecord(TypedDict, total=False):
+    original: str
+    rewritten: str
+    style_reference: str
+    improvement_potential: str
+    rewrite_method: str
+    original_account: str
+    reference_account: str
+    original_engagement: Number
+    reference_engagement: Number
+    generated_at: str
+
+
+class ToolRecord(TypedDict, total=False):
+    name: str
+    description: str
+    url: Optional[str]
+    source: str
+    discovered_at: datetime
+    raw_data: Dict[str, Any]
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Fallback for types neither encoder handles natively."""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, 'item'):
+        # numpy scalars
+        return obj.item()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return _enc_hook(obj)
+
+
+if MSGSPEC_AVAILABLE:
+    _encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+    _decoder = msgspec.json.Decoder()
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode to compact UTF-8 JSON; datetimes become ISO 8601 strings."""
+    if MSGSPEC_AVAILABLE:
+        data = _encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if pretty else None,
+        separators=None if pretty else (',', ':'),
+        default=_json_default
+    ).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON in a single pass. Invalid input raises ValueError.
+
+    Records are validated when written (see `validate`), so reads skip it
+    and datetimes come back as ISO 8601 strings.
+    """
+    if MSGSPEC_AVAILABLE:
+        return _decoder.decode(data)
+    return json.loads(data)
+
+
+def validate(obj: Any, schema: Type) -> None:
+    """Check `obj` against a record type (e.g. List[TweetRecord]) before it is written.
+
+    Raises ValueError on a mismatch. Keys a record type does not declare are
+    allowed. A no-op without msgspec.
+    """
+    if MSGSPEC_AVAILABLE and schema is not Any:
+        # Non-strict, so ISO strings are accepted where a datetime is declared
+        msgspec.convert(obj, schema, strict=False)
@@ -0,0 +1,121 @@
+import hashlib
+import re
+from typing import List, Dict, Any, Iterable, Optional
+import numpy as np
+from .ids import tweet_key
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[^\sa-z0-9]", re.IGNORECASE)
+
+
+class StyleIndex:
+    """Nearest-neighbour index over top-performing tweets.
+
+    Tweets are embedded as L2-normalised hashed n-gram vectors (word unigrams,
+    word bigrams and character trigrams), so no vocabulary has to be fitted and
+    the index can be updated one tweet at a time. Similarity is a plain dot
+    product against the stored matrix.
+    """
+
+    def __init__(self, dim: int = 2 ** 12, char_ngram: int = 3):
+        self.dim = dim
+        self.char_ngram = char_ngram
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.tweets: List[Dict[str, Any]] = []
+        self.keys: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.tweets)
+
+    def _features(self, text: str) -> Iterable[str]:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        for token in tokens:
+            yield f"w:{token}"
+        for left, right in zip(tokens, tokens[1:]):
+            yield f"b:{left} {right}"
+        compact = " ".join(tokens)
+        for i in range(len(compact) - self.char_ngram + 1):
+            yield f"c:{compact[i:i + self.char_ngram]}"
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text as a normalised hashed n-gram vector."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in self._features(text or ""):
+            digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+            bucket = int.from_bytes(digest, 'little')
+            # Signed hashing keeps collisions from only ever adding up
+            sign = 1.0 if bucket >> 63 else -1.0
+            vector[bucket % self.dim] += sign
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+    def embed_many(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(text) for text in texts])
+
+    def add(self, tweets: List[Dict[str, Any]]):
+        """Add tweets to the index, skipping ones that are already present."""
+        new_tweets = []
+        for tweet in tweets:
+            key = tweet_key(tweet)
+            if key in self.keys:
+                continue
+            self.keys[key] = len(self.tweets) + len(new_tweets)
+            new_tweets.append(tweet)
+
+        if not new_tweets:
+            return
+
+        vectors = self.embed_many([t.get('content', '') for t in new_tweets])
+        self.vectors = np.vstack([self.vectors, vectors])
+        self.tweets.extend(new_tweets)
+
+    def remove(self, tweets: List[Dict[str, Any]]):
+        """Remove tweets from the index."""
+        drop = {self.keys[k] for k in (tweet_key(t) for t in tweets) if k in self.keys}
+        if not drop:
+            return
+
+        keep = [i for i in range(len(self.tweets)) if i not in drop]
+        self.vectors = self.vectors[keep]
+        self.tweets = [self.tweets[i] for i in keep]
+        self.keys = {tweet_key(t): i for i, t in enumerate(self.tweets)}
+
+    def sync(self, top_tweets: List[Dict[str, Any]]):
+        """Bring the index in line with the current top set, touching only the difference."""
+        current = {tweet_key(t) for t in top_tweets}
+        stale = [t for t in self.tweets if tweet_key(t) not in current]
+        self.remove(stale)
+        self.add(top_tweets)
+
+    def query(self, tweet: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the most similar indexed tweet for a single tweet."""
+        matches = self.query_batch([tweet])
+        return matches[0] if matches else None
+
+    def query_batch(self, tweets: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Return the most similar indexed tweet for each tweet in one matrix product.
+
+        A tweet is never matched with itself; if it is the only indexed tweet
+        the result for it is None.
+        """
+        if not tweets:
+            return []
+        if not self.tweets:
+            return [None] * len(tweets)
+
+        queries = self.embed_many([t.get('content', '') for t in tweets])
+        scores = queries @ self.vectors.T
+
+        for row, tweet in enumerate(tweets):
+            own = self.keys.get(tweet_key(tweet))
+            if own is not None:
+                scores[row, own] = -np.inf
+
+        best = scores.argmax(axis=1)
+        return [
+            self.tweets[col] if np.isfinite(scores[row, col]) else None
+            for row, col in enumerate(best)
+        ]
@@ -0,0 +1,5 @@
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace. Dependency-free, so fetchers can use it without bs4."""
+    if not text:
+        return ""
+    return " ".join(text.split())
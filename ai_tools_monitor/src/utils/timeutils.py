@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from typing import Any
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp into a naive local datetime, defaulting to now."""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except (TypeError, ValueError):
+            return datetime.now()
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def parse_utc_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp into an aware UTC datetime, defaulting to now.
+
+    Naive values are taken to be local time, as `parse_timestamp` returns
+    them, so naive and offset timestamps compare correctly.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except (TypeError, ValueError):
+            return datetime.now(timezone.utc)
+    return parsed.astimezone(timezone.utc)
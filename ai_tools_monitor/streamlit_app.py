@@ -1,7 +1,6 @@
 import streamlit as st
-import json
 import os
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import asyncio
 import sys
 import subprocess
@@ -15,6 +14,19 @@ except ImportError:
     st.error("Could not import AITweetMonitor. Please check the installation.")
     st.stop()
 
+from src.storage.snapshot_files import SnapshotLoader
+from src.storage.retention import RetentionPolicy
+
+try:
+    from src.storage.sqlite_store import SQLiteStore
+except ImportError:
+    SQLiteStore = None
+
+try:
+    from src.storage.columnar import ColumnarArchive
+except ImportError:
+    ColumnarArchive = None
+
 # Page configuration
 st.set_page_config(
     page_title="🐦 Enhanced AI Tweet Monitor",
@@ -71,7 +83,11 @@ st.markdown("""
 st.sidebar.title("🔧 Control Panel")
 
 # Load existing data
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource
+def get_snapshot_loader():
+    """Shared loader that keeps parsed files until the monitor publishes a new generation."""
+    return SnapshotLoader('.')
+
 def load_data():
     data = {}
     files = {
@@ -81,19 +97,82 @@ def load_data():
         'top_tweets': 'ai_top_tweets.json'
     }
     
+    loader = get_snapshot_loader()
     for key, filename in files.items():
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data[key] = json.load(f)
-            except Exception as e:
-                st.sidebar.error(f"Error loading {filename}: {str(e)}")
-                data[key] = None
-        else:
+        try:
+            data[key] = loader.load(filename)
+        except Exception as e:
+            st.sidebar.error(f"Error loading {filename}: {str(e)}")
             data[key] = None
     
     return data
 
+@st.cache_resource
+def get_store():
+    """Open the monitor's SQLite store if it has been created."""
+    db_path = os.getenv('TWEET_DB_PATH', 'ai_monitor.db')
+    if SQLiteStore is None or not os.path.exists(db_path):
+        return None
+    return SQLiteStore(db_path)
+
+@st.cache_resource
+def get_archive():
+    """Open the monitor's Parquet archive if pyarrow is installed."""
+    if ColumnarArchive is None:
+        return None
+    return ColumnarArchive(os.getenv('TWEET_COLUMNAR_DIR', os.path.join('data', 'columnar')))
+
+def get_monitor():
+    """Keep one in-process monitor per session so its rewrite cache survives reruns."""
+    if 'monitor' not in st.session_state:
+        st.session_state.monitor = AITweetMonitor()
+    return st.session_state.monitor
+
+def rewrite_card_html(i, rewrite):
+    """Render a rewrite as an HTML card."""
+    method_color = "#4CAF50" if "AI-powered" in rewrite.get('rewrite_method', '') else "#2196F3"
+    potential_emoji = {"High": "🚀", "Medium": "📈", "Low": "📊"}.get(rewrite.get('improvement_potential', 'Medium'), "📊")
+    
+    return f"""
+    <div class="rewrite-card">
+        <h4>#{i} @{rewrite.get('original_account', 'Unknown')} → @{rewrite.get('reference_account', 'Unknown')}</h4>
+        <div style="margin: 10px 0;">
+            <strong>Original:</strong><br>
+            <em>{rewrite['original'][:150]}{'...' if len(rewrite['original']) > 150 else ''}</em>
+        </div>
+        <div style="margin: 10px 0;">
+            <strong>Rewritten:</strong><br>
+            <strong>{rewrite['rewritten'][:150]}{'...' if len(rewrite['rewritten']) > 150 else ''}</strong>
+        </div>
+        <div style="display: flex; gap: 15px; margin-top: 10px;">
+            <span style="color: {method_color};">🔧 {rewrite.get('rewrite_method', 'Unknown')}</span>
+            <span>{potential_emoji} {rewrite.get('improvement_potential', 'Medium')} Potential</span>
+        </div>
+    </div>
+    """
+
+def stream_rewrites(container, tweets, top_tweets):
+    """Generate rewrites in-process and render each card as soon as it completes."""
+    monitor = get_monitor()
+    placeholders = {}
+    drafts = {}
+    rewrites = []
+    
+    def on_token(index, text):
+        drafts[index] = drafts.get(index, '') + text
+        placeholder = placeholders.setdefault(index, container.empty())
+        placeholder.markdown(f"**#{index + 1}** ✍️ {drafts[index]}▌")
+    
+    async def consume():
+        async for rewrite in monitor.stream_tweet_rewrites(tweets, top_tweets, on_token=on_token):
+            index = len(rewrites)
+            rewrites.append(rewrite)
+            placeholder = placeholders.setdefault(index, container.empty())
+            placeholder.markdown(rewrite_card_html(index + 1, rewrite), unsafe_allow_html=True)
+    
+    asyncio.run(consume())
+    return rewrites
+
 # Monitor controls
 if st.sidebar.button("🔄 Run Monitoring Cycle", type="primary"):
     with st.spinner("Running monitoring cycle..."):
@@ -113,6 +192,8 @@ if st.sidebar.button("🔄 Run Monitoring Cycle", type="primary"):
         except Exception as e:
             st.sidebar.error(f"❌ Error: {str(e)}")
 
+stream_rewrites_clicked = st.sidebar.button("⚡ Stream Rewrites")
+
 if st.sidebar.button("📊 Generate Dashboard"):
     try:
         subprocess.run([sys.executable, "create_dashboard.py"], check=True)
@@ -214,6 +295,40 @@ with tab1:
                     Average Score: {account['avg_score']:.1f} | Tweets: {account['tweets']}
                 </div>
                 """, unsafe_allow_html=True)
+        
+        # Account history comes from indexed range queries, not the JSON snapshot:
+        # SQLite within the raw retention window, the Parquet archive beyond it
+        store = get_store()
+        archive = get_archive()
+        archived_days = archive.partitions('tweets') if archive else []
+        if not archived_days:
+            archive = None
+        if store or archive:
+            st.subheader("📅 Account History")
+            raw_days = RetentionPolicy.from_env().raw_days
+            max_days = raw_days if store else 1
+            if archive:
+                max_days = max(max_days, (date.today() - date.fromisoformat(archived_days[0])).days + 1)
+            if max_days > 1:
+                days = st.slider("Days of history", min_value=1, max_value=max_days, value=min(7, max_days))
+            else:
+                days = 1
+            if store and (days <= raw_days or not archive):
+                history = store.account_aggregates(datetime.now() - timedelta(days=days))
+            else:
+                # Archive partitions are whole days, so the range starts at midnight
+                history = archive.account_aggregates(start=date.today() - timedelta(days=days))
+            if archive:
+                st.caption(f"Per-tweet history is kept for {raw_days} days; longer ranges are read from the Parquet archive.")
+            else:
+                st.caption(f"Per-tweet history is kept for {raw_days} days; older tweets are kept as hourly and daily rollups.")
+            for i, account in enumerate(history, 1):
+                st.markdown(f"""
+                <div class="metric-card">
+                    <strong>#{i} @{account['account']}</strong><br>
+                    Average Score: {account['avg_score']:.1f} | Tweets: {account['tweets']}
+                </div>
+                """, unsafe_allow_html=True)
     else:
         st.info("📊 No analytics data available. Run a monitoring cycle to generate data.")
 
@@ -245,6 +360,32 @@ with tab2:
 with tab3:
     st.subheader("✍️ Tweet Rewrites")
     
+    if stream_rewrites_clicked:
+        st.markdown("#### ⚡ Live Rewrites")
+        tweets = data['tweets']
+        top_tweets = data['top_tweets']
+        if not tweets or not top_tweets:
+            # No collected data yet, so fetch in-process instead of via subprocess
+            monitor = get_monitor()
+            with st.spinner("Fetching tweets..."):
+                tweets = asyncio.run(monitor.fetch_ai_tweets(limit=20))
+                top_tweets = monitor.identify_top_performing_tweets(tweets)
+        
+        streamed = stream_rewrites(st.container(), tweets, top_tweets)
+        if streamed:
+            st.session_state.streamed_rewrites = streamed
+            # Their tweets are now marked rewritten, so the rewrites must outlive the session
+            try:
+                get_monitor().save_rewrites(streamed)
+            except Exception as e:
+                st.error(f"Error saving rewrites: {str(e)}")
+        else:
+            st.info("✍️ No new rewrite candidates - every eligible tweet already has a rewrite.")
+    elif st.session_state.get('streamed_rewrites'):
+        st.markdown("#### ⚡ Live Rewrites")
+        for i, rewrite in enumerate(st.session_state.streamed_rewrites, 1):
+            st.markdown(rewrite_card_html(i, rewrite), unsafe_allow_html=True)
+    
     if data['rewrites']:
         # Rewrite statistics
         total_rewrites = len(data['rewrites'])
@@ -262,27 +403,8 @@ with tab3:
         
         # Show rewrites
         for i, rewrite in enumerate(data['rewrites'][:10], 1):
-            method_color = "#4CAF50" if "AI-powered" in rewrite.get('rewrite_method', '') else "#2196F3"
-            potential_emoji = {"High": "🚀", "Medium": "📈", "Low": "📊"}.get(rewrite.get('improvement_potential', 'Medium'), "📊")
-            
-            st.markdown(f"""
-            <div class="rewrite-card">
-                <h4>#{i} @{rewrite.get('original_account', 'Unknown')} → @{rewrite.get('reference_account', 'Unknown')}</h4>
-                <div style="margin: 10px 0;">
-                    <strong>Original:</strong><br>
-                    <em>{rewrite['original'][:150]}{'...' if len(rewrite['original']) > 150 else ''}</em>
-                </div>
-                <div style="margin: 10px 0;">
-                    <strong>Rewritten:</strong><br>
-                    <strong>{rewrite['rewritten'][:150]}{'...' if len(rewrite['rewritten']) > 150 else ''}</strong>
-                </div>
-                <div style="display: flex; gap: 15px; margin-top: 10px;">
-                    <span style="color: {method_color};">🔧 {rewrite.get('rewrite_method', 'Unknown')}</span>
-                    <span>{potential_emoji} {rewrite.get('improvement_potential', 'Medium')} Potential</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
+            st.markdown(rewrite_card_html(i, rewrite), unsafe_allow_html=True)
+    elif not stream_rewrites_clicked and not st.session_state.get('streamed_rewrites'):
         st.info("✍️ No rewrite data available. Run a monitoring cycle with rewrites enabled.")
 
 with tab4:
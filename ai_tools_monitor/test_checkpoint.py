@@ -0,0 +1,70 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from src.storage.checkpoint import CycleCheckpoint
+from src.utils.serialization import dumps
+
+
+def make_path():
+    return os.path.join(tempfile.mkdtemp(), 'cycle_checkpoint.ndjson')
+
+
+def test_interrupted_cycle_is_replayed():
+    path = make_path()
+    checkpoint = CycleCheckpoint(path)
+    checkpoint.start()
+    checkpoint.record_account('alice', [{'tweet_id': 1}, {'tweet_id': 2}])
+    checkpoint.record_account('bob', [])
+    checkpoint.record_rewrite({'original_tweet': {'tweet_id': 1}, 'rewrite': 'better'})
+
+    state = CycleCheckpoint(path).start()
+    assert state['accounts_done'] == ['alice', 'bob']
+    assert [t['tweet_id'] for t in state['tweets']] == [1, 2]
+    assert state['rewrites'][0]['rewrite'] == 'better'
+
+
+def test_each_step_appends_one_line():
+    path = make_path()
+    checkpoint = CycleCheckpoint(path)
+    checkpoint.start()
+    sizes = []
+    for i in range(5):
+        checkpoint.record_account(f"account{i}", [{'tweet_id': i}])
+        sizes.append(os.path.getsize(path))
+
+    steps = [b - a for a, b in zip(sizes, sizes[1:])]
+    assert max(steps) - min(steps) <= 1
+    with open(path, 'rb') as f:
+        assert len(f.readlines()) == 6
+
+
+def test_partial_last_line_is_ignored():
+    path = make_path()
+    checkpoint = CycleCheckpoint(path)
+    checkpoint.start()
+    checkpoint.record_account('alice', [{'tweet_id': 1}])
+    with open(path, 'ab') as f:
+        f.write(b'{"account": "bo')
+
+    assert CycleCheckpoint(path).load()['accounts_done'] == ['alice']
+
+
+def test_stale_journal_starts_a_new_cycle():
+    path = make_path()
+    with open(path, 'wb') as f:
+        f.write(dumps({'started_at': (datetime.now() - timedelta(hours=12)).isoformat()}) + b'\n')
+        f.write(dumps({'account': 'alice', 'tweets': []}) + b'\n')
+
+    checkpoint = CycleCheckpoint(path)
+    assert checkpoint.start()['accounts_done'] == []
+    assert CycleCheckpoint(path).load()['accounts_done'] == []
+
+    checkpoint.clear()
+    assert not os.path.exists(path)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
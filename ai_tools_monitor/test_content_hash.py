@@ -0,0 +1,70 @@
+import os
+import tempfile
+from src.utils.content_hash import ContentHashStore
+
+
+def make_store():
+    return ContentHashStore(os.path.join(tempfile.mkdtemp(), 'content_hashes.json'))
+
+
+def test_unchanged_page_is_detected_after_reload():
+    store = make_store()
+    assert not store.page_unchanged('https://example.com', '<html>1</html>')
+    store.changed_cards('https://example.com', '<html>1</html>', [])
+    store.commit()
+
+    reloaded = ContentHashStore(store.path)
+    assert reloaded.page_unchanged('https://example.com', '<html>1</html>')
+    assert not reloaded.page_unchanged('https://example.com', '<html>2</html>')
+
+
+def test_only_new_or_changed_cards_are_returned():
+    store = make_store()
+    first = store.changed_cards('https://example.com', 'page 1', ['<div>a</div>', '<div>b</div>'])
+    store.commit(['https://example.com'])
+    second = store.changed_cards('https://example.com', 'page 2', ['<div>a</div>', '<div>b2</div>', '<div>c</div>'])
+
+    assert first == ['<div>a</div>', '<div>b</div>']
+    assert second == ['<div>b2</div>', '<div>c</div>']
+
+
+def test_cards_are_hashed_by_their_markup():
+    store = make_store()
+    cards = [{'name': 'A', 'html': '<div>a</div>'}]
+    store.changed_cards('https://example.com', 'page', cards, markup=lambda card: card['html'])
+    store.commit()
+    again = [{'name': 'A (renamed)', 'html': '<div>a</div>'}]
+
+    assert store.changed_cards('https://example.com', 'page', again, markup=lambda card: card['html']) == []
+
+
+def test_cards_are_returned_again_until_committed():
+    store = make_store()
+    store.changed_cards('https://example.com', 'page', ['<div>a</div>'])
+    store.changed_cards('https://other.com', 'page', ['<div>x</div>'])
+    # The tools of the first page were not persisted, so nothing is recorded for it
+    store.commit(['https://other.com'])
+
+    reloaded = ContentHashStore(store.path)
+    assert not reloaded.page_unchanged('https://example.com', 'page')
+    assert reloaded.changed_cards('https://example.com', 'page', ['<div>a</div>']) == ['<div>a</div>']
+    assert reloaded.page_unchanged('https://other.com', 'page')
+
+
+def test_namespaces_are_independent():
+    store = make_store()
+    store.set('tools', 'https://a.ai', 'hash-1')
+    store.set('fetch_strategy', 'https://a.ai', {'strategy': 'http'})
+    store.save()
+
+    reloaded = ContentHashStore(store.path)
+    assert reloaded.get('tools', 'https://a.ai') == 'hash-1'
+    assert reloaded.get('fetch_strategy', 'https://a.ai') == {'strategy': 'http'}
+    assert reloaded.get('pages', 'https://a.ai') is None
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
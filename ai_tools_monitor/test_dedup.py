@@ -0,0 +1,72 @@
+import tempfile
+from src.utils.dedup import BloomFilter, SeenTweets
+
+
+def test_filter_new_drops_seen_ids_and_keeps_idless_tweets():
+    seen = SeenTweets(tempfile.mkdtemp())
+    first = seen.filter_new([{'tweet_id': 1}, {'tweet_id': 2}, {'content': 'simulated'}])
+    second = seen.filter_new([{'tweet_id': 2}, {'tweet_id': 3}, {'content': 'simulated'}])
+
+    assert len(first) == 3
+    assert [t.get('tweet_id') for t in second] == [3, None]
+
+
+def test_unseen_does_not_mark():
+    seen = SeenTweets(tempfile.mkdtemp())
+    seen.filter_new([{'tweet_id': 1}])
+    tweets = [{'tweet_id': 1}, {'tweet_id': 2}, {'tweet_id': 2}]
+
+    assert seen.unseen(tweets) == [{'tweet_id': 2}]
+    assert seen.unseen(tweets) == [{'tweet_id': 2}]
+    assert '2' not in seen
+
+
+def test_state_survives_a_restart():
+    directory = tempfile.mkdtemp()
+    seen = SeenTweets(directory, recent_size=10, bloom_capacity=1000)
+    seen.mark([{'tweet_id': i} for i in range(100)])
+    seen.save()
+
+    reloaded = SeenTweets(directory, recent_size=10, bloom_capacity=1000)
+    assert len(reloaded.recent) == 10
+    # Ids evicted from the exact set are still found through the Bloom filter
+    assert all(str(i) in reloaded for i in range(100))
+
+
+def test_changed_geometry_keeps_only_recent_ids():
+    directory = tempfile.mkdtemp()
+    seen = SeenTweets(directory, recent_size=10, bloom_capacity=1000)
+    seen.mark([{'tweet_id': i} for i in range(100)])
+    seen.save()
+
+    reloaded = SeenTweets(directory, recent_size=10, bloom_capacity=2000)
+    assert '99' in reloaded
+    assert reloaded.current.count == 0
+
+
+def test_generations_rotate_and_bound_memory():
+    seen = SeenTweets(tempfile.mkdtemp(), recent_size=5, bloom_capacity=100)
+    for i in range(250):
+        seen.add(str(i))
+
+    assert seen.previous is not None and seen.previous.full
+    assert len(seen.current.bits) == len(seen.previous.bits)
+    # The last two generations are remembered
+    assert all(str(i) in seen for i in range(100, 250))
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(10000, error_rate=0.01)
+    for i in range(10000):
+        bloom.add(f"in-{i}")
+    false_positives = sum(f"out-{i}" in bloom for i in range(10000))
+
+    assert all(f"in-{i}" in bloom for i in range(10000))
+    assert false_positives < 200
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
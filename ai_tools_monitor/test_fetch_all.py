@@ -0,0 +1,112 @@
+import asyncio
+import time
+from src.agents.mcp_agent import EnhancedFetcherAgent
+from src.utils.fetcher_utils import BlockingCallRunner
+
+
+class FakeFetcher:
+    def __init__(self, delay, tools=None, error=None, blocking=False):
+        self.delay = delay
+        self.tools = tools or []
+        self.error = error
+        self.blocking = BlockingCallRunner(max_workers=1) if blocking else None
+        self.cancelled = False
+        self.finished_at = None
+        self.fetch_deadline = None
+        self.collected = []
+
+    async def fetch(self):
+        try:
+            if self.blocking:
+                # A synchronous SDK call, offloaded the way TwitterFetcher runs tweepy
+                await self.blocking.run(time.sleep, self.delay)
+            else:
+                await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        self.finished_at = time.monotonic()
+        return self.tools
+
+    def partial_results(self):
+        return self.collected
+
+    async def close(self):
+        pass
+
+
+def make_agent(fetchers, **config):
+    agent = EnhancedFetcherAgent({'enabled_fetchers': ['archon'], **config})  # archon is skipped without its API key
+    agent.fetchers = fetchers
+    return agent
+
+
+def test_slow_fetcher_is_cancelled_at_its_deadline():
+    slow = FakeFetcher(10, [{'name': 'slow'}])
+    fast = FakeFetcher(0.01, [{'name': 'fast'}])
+    agent = make_agent({'slow': slow, 'fast': fast}, fetch_deadline=5, fetch_deadlines={'slow': 0.2})
+
+    start = time.monotonic()
+    tools = asyncio.run(agent.fetch_all())
+
+    assert time.monotonic() - start < 2
+    assert slow.cancelled
+    assert tools == [{'name': 'fast'}]
+    assert agent.last_report['timed_out'] == ['slow']
+    assert agent.last_report['succeeded'] == {'fast': 1}
+    assert set(agent.last_report['durations']) == {'slow', 'fast'}
+
+
+def test_timed_out_fetcher_keeps_what_it_collected():
+    slow = FakeFetcher(10)
+    slow.collected = [{'name': 'first query'}]
+    agent = make_agent({'slow': slow}, fetch_deadline=0.1)
+
+    tools = asyncio.run(agent.fetch_all())
+
+    assert tools == [{'name': 'first query'}]
+    assert agent.last_report['partial'] == {'slow': 1}
+
+
+def test_fetcher_deadline_overrides_the_default():
+    # Like TwitterFetcher, whose rate-limited queries need longer than the default
+    patient = FakeFetcher(0.3, [{'name': 'tweet'}])
+    patient.fetch_deadline = 5
+    agent = make_agent({'twitter': patient}, fetch_deadline=0.1)
+
+    assert asyncio.run(agent.fetch_all()) == [{'name': 'tweet'}]
+    assert agent.last_report['timed_out'] == []
+
+    agent = make_agent({'twitter': patient}, fetch_deadline=0.1, fetch_deadlines={'twitter': 0.1})
+    asyncio.run(agent.fetch_all())
+    assert agent.last_report['timed_out'] == ['twitter']
+
+
+def test_failures_are_reported_by_registry_name():
+    broken = FakeFetcher(0.01, error=RuntimeError('boom'))
+    agent = make_agent({'topaitools': broken, 'archon': FakeFetcher(0.01, [{'name': 'a'}])})
+
+    tools = asyncio.run(agent.fetch_all())
+
+    assert tools == [{'name': 'a'}]
+    assert agent.last_report['failed'] == {'topaitools': 'boom'}
+
+
+def test_blocking_calls_do_not_hold_up_other_fetchers():
+    blocking = FakeFetcher(0.5, [{'name': 'sdk'}], blocking=True)
+    fast = FakeFetcher(0.01, [{'name': 'fast'}])
+    agent = make_agent({'twitter': blocking, 'fast': fast})
+
+    tools = asyncio.run(agent.fetch_all())
+
+    assert {t['name'] for t in tools} == {'sdk', 'fast'}
+    assert fast.finished_at < blocking.finished_at - 0.3
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,71 @@
+import os
+import tempfile
+from src.utils.http_cache import HTTPCache
+
+
+def test_validators_round_trip_through_disk():
+    directory = tempfile.mkdtemp()
+    cache = HTTPCache(directory)
+    cache.store('https://example.com/a', '<html>a</html>', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+
+    reloaded = HTTPCache(directory)
+    assert reloaded.conditional_headers('https://example.com/a') == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+    }
+    assert reloaded.get('https://example.com/a') == '<html>a</html>'
+
+
+def test_responses_without_validators_are_not_cached():
+    cache = HTTPCache(tempfile.mkdtemp())
+    cache.store('https://example.com/a', 'body')
+
+    assert cache.conditional_headers('https://example.com/a') == {}
+    assert cache.get('https://example.com/a') is None
+
+
+def test_missing_body_drops_the_entry():
+    cache = HTTPCache(tempfile.mkdtemp())
+    cache.store('https://example.com/a', 'body', etag='"v1"')
+    os.remove(cache._body_path(cache.key('https://example.com/a')))
+
+    assert cache.conditional_headers('https://example.com/a') == {}
+    assert cache.get('https://example.com/a') is None
+    assert cache.key('https://example.com/a') not in cache.index
+
+
+def test_least_recently_used_bodies_are_evicted():
+    cache = HTTPCache(tempfile.mkdtemp(), max_bytes=25)
+    cache.store('https://example.com/a', 'a' * 10, etag='"a"')
+    cache.store('https://example.com/b', 'b' * 10, etag='"b"')
+    cache.get('https://example.com/a')
+    cache.store('https://example.com/c', 'c' * 10, etag='"c"')
+
+    assert cache.get('https://example.com/b') is None
+    assert cache.get('https://example.com/a') == 'a' * 10
+    assert cache.get('https://example.com/c') == 'c' * 10
+
+
+def test_hits_do_not_rewrite_the_index_until_flushed():
+    directory = tempfile.mkdtemp()
+    cache = HTTPCache(directory)
+    cache.store('https://example.com/a', 'body', etag='"a"')
+    stored_at = cache.index[cache.key('https://example.com/a')]['last_used']
+    index_path = os.path.join(directory, HTTPCache.INDEX_FILE)
+    mtime = os.stat(index_path).st_mtime_ns
+
+    for _ in range(3):
+        assert cache.get('https://example.com/a') == 'body'
+    bumped = cache.index[cache.key('https://example.com/a')]['last_used']
+    assert os.stat(index_path).st_mtime_ns == mtime
+    assert HTTPCache(directory).index[cache.key('https://example.com/a')]['last_used'] == stored_at
+
+    cache.flush()
+    assert HTTPCache(directory).index[cache.key('https://example.com/a')]['last_used'] == bumped
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from src.utils.serialization import loads
+
+
+def make_monitor(directory):
+    """A monitor that writes everything under `directory` and fetches `monitor.feed` per account."""
+    os.chdir(directory)
+    os.environ['TWEET_HISTORY_DIR'] = os.path.join(directory, 'history')
+    os.environ['TWEET_DB_PATH'] = os.path.join(directory, 'ai_monitor.db')
+    os.environ['TWEET_COLUMNAR_DIR'] = os.path.join(directory, 'columnar')
+    for key in ('TWITTER_API_KEY', 'OPENAI_API_KEY'):
+        os.environ.pop(key, None)
+    from ai_tweet_monitor import AITweetMonitor
+
+    monitor = AITweetMonitor()
+    monitor.ai_accounts = ['alice', 'bob']
+    monitor.feed = {}
+
+    async def fetch(account):
+        return list(monitor.feed.get(account, []))
+
+    monitor.simulate_tweet_fetch = fetch
+    return monitor
+
+
+def make_tweet(i, account, likes):
+    return {
+        'tweet_id': i, 'account': account, 'content': f"{account} tweet {i} about AI",
+        'likes': likes, 'retweets': 0, 'replies': 0, 'engagement': likes,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def test_seen_tweets_are_analysed_but_stored_once():
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        monitor = make_monitor(directory)
+        monitor.feed = {'alice': [make_tweet(1, 'alice', 10)], 'bob': [make_tweet(2, 'bob', 20)]}
+        asyncio.run(monitor.run_monitoring_cycle(include_rewrites=False))
+
+        monitor.feed['bob'].append(make_tweet(3, 'bob', 30))
+        result = asyncio.run(monitor.run_monitoring_cycle(include_rewrites=False))
+
+        assert result['analysis']['total_tweets'] == 3
+        assert sorted(t['tweet_id'] for t in monitor.tweet_log.read()) == [1, 2, 3]
+        assert sorted(t['tweet_id'] for t in monitor.monitored_data) == [1, 2, 3]
+        assert len(monitor.snapshot_manifest.read()['files']) >= 2
+    finally:
+        os.chdir(cwd)
+
+
+def test_quiet_cycle_keeps_the_previous_snapshots():
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        monitor = make_monitor(directory)
+        monitor.feed = {'alice': [make_tweet(1, 'alice', 10)]}
+        asyncio.run(monitor.run_monitoring_cycle(include_rewrites=False))
+        with open('ai_tweets_data.json', 'rb') as f:
+            before = f.read()
+        generation = monitor.snapshot_manifest.read()['generation']
+
+        monitor.feed = {}
+        asyncio.run(monitor.run_monitoring_cycle(include_rewrites=False))
+
+        with open('ai_tweets_data.json', 'rb') as f:
+            assert f.read() == before
+        assert monitor.snapshot_manifest.read()['generation'] == generation
+    finally:
+        os.chdir(cwd)
+
+
+def test_streamed_rewrites_are_persisted():
+    directory = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        monitor = make_monitor(directory)
+        tweets = [make_tweet(i, 'alice', likes) for i, likes in enumerate([1, 2, 3, 500])]
+
+        async def stream():
+            return [r async for r in monitor.stream_tweet_rewrites(tweets, tweets[-1:], budget=2)]
+
+        streamed = asyncio.run(stream())
+        monitor.save_rewrites(streamed)
+
+        assert len(streamed) == 2
+        assert [r['rewritten'] for r in monitor.rewrite_log.read()] == [r['rewritten'] for r in streamed]
+        with open('ai_tweet_rewrites.json', 'rb') as f:
+            assert len(loads(f.read())) == 2
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,81 @@
+import os
+import sys
+import subprocess
+from src.agents.fetchers import registry
+from src.agents.fetchers.registry import FetcherSpec, create_fetchers, enabled_fetcher_names
+
+
+class RecordingSpec(FetcherSpec):
+    """Spec that records when its fetcher class is imported."""
+
+    loaded = []
+
+    def load(self):
+        RecordingSpec.loaded.append(self.target)
+        return lambda config: ('fetcher', self.target)
+
+
+def with_specs(specs, test):
+    original = registry.FETCHERS
+    registry.FETCHERS = specs
+    RecordingSpec.loaded = []
+    try:
+        test()
+    finally:
+        registry.FETCHERS = original
+
+
+def test_enabled_names_from_config_env_and_defaults():
+    os.environ.pop('FETCHERS', None)
+    assert enabled_fetcher_names({'enabled_fetchers': 'twitter, archon'}) == ['twitter', 'archon']
+    assert enabled_fetcher_names({}) == ['twitter', 'topaitools', 'archon']
+
+    os.environ['FETCHERS'] = 'futuretools'
+    try:
+        assert enabled_fetcher_names({}) == ['futuretools']
+        assert enabled_fetcher_names({'enabled_fetchers': ['twitter']}) == ['twitter']
+    finally:
+        del os.environ['FETCHERS']
+
+
+def test_only_enabled_fetchers_are_imported():
+    def test():
+        fetchers = create_fetchers({'enabled_fetchers': ['b'], 'B_KEY': 'x'})
+        assert fetchers == {'b': ('fetcher', '.b:B')}
+        assert RecordingSpec.loaded == ['.b:B']
+
+    with_specs({'a': RecordingSpec('.a:A', default=True), 'b': RecordingSpec('.b:B', requires=('B_KEY',))}, test)
+
+
+def test_fetchers_missing_required_config_are_skipped():
+    def test():
+        assert create_fetchers({'enabled_fetchers': ['b']}) == {}
+        assert RecordingSpec.loaded == []
+
+    with_specs({'b': RecordingSpec('.b:B', requires=('B_KEY',))}, test)
+
+
+def test_unknown_fetcher_is_an_error():
+    try:
+        create_fetchers({'enabled_fetchers': ['nope']})
+        assert False, "an unknown fetcher name must raise"
+    except ValueError as e:
+        assert 'nope' in str(e) and 'twitter' in str(e)
+
+
+def test_registry_import_pulls_in_no_fetcher_dependencies():
+    code = (
+        "import sys, src.agents.fetchers.registry; "
+        "print(','.join(m for m in ('tweepy', 'playwright', 'bs4') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ''
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
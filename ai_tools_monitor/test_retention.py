@@ -0,0 +1,109 @@
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from src.storage.segment_log import SegmentedLog
+from src.storage.columnar import ColumnarArchive
+from src.storage.retention import RetentionPolicy, RetentionEngine, downsample, _tweet_rollup
+
+
+def make_tweet(account, ts, likes=1):
+    return {'account': account, 'timestamp': ts.isoformat(), 'likes': likes, 'engagement_score': float(likes)}
+
+
+def test_segmented_log_append_read_tail_and_expire():
+    log = SegmentedLog(tempfile.mkdtemp(), max_segment_bytes=200)
+    start = datetime(2024, 1, 1)
+    log.append([make_tweet('a', start + timedelta(hours=i)) for i in range(10)])
+
+    assert len(log.segments) > 1
+    assert len(list(log.read())) == 10
+    window = list(log.read((start + timedelta(hours=3)).isoformat(), (start + timedelta(hours=5)).isoformat()))
+    assert [r['timestamp'] for r in window] == [(start + timedelta(hours=h)).isoformat() for h in (3, 4, 5)]
+
+    records, position = log.tail()
+    log.append([make_tweet('a', start + timedelta(hours=10))])
+    more, _ = log.tail(position)
+    assert len(records) == 10 and len(more) == 1
+
+    expired = log.expire(count=1)
+    assert expired and len(list(log.read())) == 11 - len(expired)
+
+
+def test_seal_makes_the_active_segment_expirable():
+    log = SegmentedLog(tempfile.mkdtemp())
+    log.append([make_tweet('a', datetime(2024, 1, 1))])
+    assert log.expire(before=datetime(2025, 1, 1)) == []
+
+    log.seal()
+    assert len(log.expire(before=datetime(2025, 1, 1))) == 1
+    assert list(log.read()) == []
+
+
+def test_retention_tiers_keep_every_tweet_counted():
+    history = tempfile.mkdtemp()
+    tweet_log = SegmentedLog(os.path.join(history, 'tweets'))
+    engine = RetentionEngine(RetentionPolicy(raw_days=7, hourly_days=30), history, tweet_log)
+
+    # One cycle every 6 hours for 45 days, retention applied once a day
+    start = datetime(2024, 1, 1)
+    total = 0
+    for step in range(45 * 4):
+        now = start + timedelta(hours=6 * step)
+        tweet_log.append([make_tweet('a', now), make_tweet('b', now, likes=3)])
+        total += 2
+        if step % 4 == 3:
+            engine.run(now)
+    now = start + timedelta(hours=6 * (45 * 4 - 1))
+
+    raw = list(tweet_log.read())
+    hourly = engine.rollups('hour')
+    daily = engine.rollups('day')
+
+    assert daily, "hourly rollups older than hourly_days must be folded into daily ones"
+    assert min(r['timestamp'] for r in raw) >= (now - timedelta(days=7 + 2)).isoformat()
+    assert min(r['bucket'] for r in hourly) >= (now - timedelta(days=30 + 2)).isoformat()
+    assert len(raw) + sum(r['tweets'] for r in hourly) + sum(r['tweets'] for r in daily) == total
+
+
+def test_expiry_compares_instants_not_strings():
+    log = SegmentedLog(tempfile.mkdtemp())
+    # 04:30 UTC, but earlier than the cutoff as a string
+    log.append([{'account': 'a', 'timestamp': '2024-01-01T23:30:00-05:00'}])
+    log.seal()
+    cutoff = datetime(2024, 1, 2, 4, 0, tzinfo=timezone.utc)
+
+    assert log.expire(before=cutoff) == []
+    assert len(log.expire(before=cutoff + timedelta(hours=1))) == 1
+
+
+def test_archive_days_outside_the_archive_window_are_dropped():
+    history = tempfile.mkdtemp()
+    archive = ColumnarArchive(os.path.join(history, 'columnar'))
+    now = datetime.now()
+    archive.export_tweets([
+        {'account': 'a', 'tweet_id': '1', 'content': 'old', 'timestamp': (now - timedelta(days=40)).isoformat()},
+        {'account': 'a', 'tweet_id': '2', 'content': 'kept', 'timestamp': (now - timedelta(days=10)).isoformat()}
+    ])
+    archive.export_tools([{'name': 'T', 'url': 'https://t.ai', 'discovered_at': (now - timedelta(days=40)).isoformat()}])
+    policy = RetentionPolicy(raw_days=7, archive_days=30)
+    engine = RetentionEngine(policy, history, SegmentedLog(os.path.join(history, 'tweets')), archive=archive)
+
+    report = engine.run(now)
+
+    assert report['partitions_dropped'] == 2
+    assert archive.partitions('tweets') == [(now - timedelta(days=10)).date().isoformat()]
+    assert archive.partitions('tools') == []
+
+
+def test_downsample_merges_buckets():
+    ts = datetime(2024, 1, 1, 10, 15)
+    hourly = downsample([_tweet_rollup(make_tweet('a', ts, 2)), _tweet_rollup(make_tweet('a', ts + timedelta(minutes=30), 5))], 'hour')
+    assert len(hourly) == 1 and hourly[0]['tweets'] == 2 and hourly[0]['likes'] == 7
+    assert hourly[0]['engagement_score_max'] == 5.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,112 @@
+import random
+from datetime import datetime, timedelta
+from src.utils.rewrite_queue import RewriteQueue
+
+
+def make_tweet(i, score, account='acme', hours_ago=0.0):
+    return {
+        'tweet_id': i,
+        'account': account,
+        'content': f"tweet {i}",
+        'score': score,
+        'timestamp': (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+    }
+
+
+def test_ranking_follows_current_medians():
+    # Tweets queued while the medians were low must still rank by the final medians
+    random.seed(7)
+    queue = RewriteQueue(lambda tweet: tweet['score'])
+    early = [make_tweet(i, random.uniform(0, 5)) for i in range(10)]
+    late = [make_tweet(100 + i, random.uniform(40, 100)) for i in range(200)]
+    queue.push_many(early)
+    queue.push_many(late)
+
+    expected = sorted(early + late, key=lambda t: queue.opportunity(t), reverse=True)[:15]
+    selected = queue.pop_top(15)
+
+    assert [t['tweet_id'] for t in selected] == [t['tweet_id'] for t in expected]
+    assert {t['tweet_id'] for t in early} <= {t['tweet_id'] for t in selected}
+    assert len(queue) == 210 - 15
+
+
+def test_rewritten_tweets_are_not_queued_again():
+    queue = RewriteQueue(lambda tweet: tweet['score'])
+    tweets = [make_tweet(i, score) for i, score in enumerate([10, 50, 60, 70])]
+    queue.push_many(tweets)
+    top = queue.pop_top(1)
+    queue.mark_rewritten(top[0], {'rewritten': 'x'})
+    queue.push(top[0])
+
+    assert queue.cached_rewrite(top[0]) == {'rewritten': 'x'}
+    assert top[0]['tweet_id'] not in [t['tweet_id'] for t in queue.pop_top(10)]
+
+
+def test_trim_drops_old_entries_rewrites_and_scores():
+    queue = RewriteQueue(lambda tweet: tweet['score'])
+    old = [make_tweet(i, 10 * i, hours_ago=24 * 10) for i in range(5)]
+    recent = [make_tweet(100 + i, 10 * i) for i in range(5)]
+    queue.push_many(old + recent)
+    queue.mark_rewritten(old[0], {'rewritten': 'x'})
+
+    queue.trim(datetime.now() - timedelta(days=7))
+
+    assert len(queue) == 5
+    assert queue.cached_rewrite(old[0]) is None
+    assert len(queue.all_scores) == 5
+    assert len(queue.account_scores['acme']) == 5
+    assert set(queue.created) == {str(t['tweet_id']) for t in recent}
+
+
+def test_ranking_matches_a_full_rescan_across_cycles():
+    # Medians rise and fall between cycles; the heap must agree with brute force every time
+    random.seed(11)
+    queue = RewriteQueue(lambda tweet: tweet['score'])
+    accounts = ['a', 'b', 'c', 'd']
+    next_id = 0
+    for cycle in range(30):
+        level = random.choice([5, 50, 500])
+        batch = []
+        for _ in range(random.randint(0, 20)):
+            batch.append(make_tweet(next_id, random.uniform(0, level), random.choice(accounts), hours_ago=random.uniform(0, 48)))
+            next_id += 1
+        queue.push_many(batch)
+        if cycle % 7 == 6:
+            queue.trim(datetime.now() - timedelta(hours=40))
+
+        now = datetime.now()
+        expected = sorted(
+            (t for t in queue.entries.values() if queue.opportunity(t, now) > 0),
+            key=lambda t: queue.opportunity(t, now), reverse=True
+        )[:5]
+        assert [t['tweet_id'] for t in queue.pop_top(5)] == [t['tweet_id'] for t in expected]
+
+
+def test_tweets_above_the_median_stay_out_of_the_heap():
+    queue = RewriteQueue(lambda tweet: tweet['score'])
+    queue.push_many([make_tweet(i, score) for i, score in enumerate([10, 20, 30, 40, 50])])
+    queue.pop_top(0)
+
+    assert len(queue.live) == 2
+
+    # An unchanged median only keys the new tweet
+    calls = []
+    priority = queue._priority
+    queue._priority = lambda key, gap: calls.append(key) or priority(key, gap)
+    queue.push(make_tweet(5, 29))
+    queue.pop_top(0)
+    assert calls == ['5']
+
+    # A moved median re-keys only the tweets below it
+    calls.clear()
+    queue.push(make_tweet(6, 1))
+    queue.pop_top(0)
+    assert sorted(calls) == ['0', '1', '6']
+    assert len(queue.live) == 3
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
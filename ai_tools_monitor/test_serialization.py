@@ -0,0 +1,84 @@
+import os
+import tempfile
+from datetime import datetime
+from typing import List
+from src.utils.serialization import dumps, loads, validate, TweetRecord, RewriteRecord, ToolRecord
+from src.storage.snapshot_files import SnapshotManifest, SnapshotLoader
+from src.storage.segment_log import SegmentedLog
+
+
+def test_round_trip_keeps_undeclared_keys():
+    tool = {'name': 'Tool', 'discovered_at': datetime(2024, 5, 1, 12, 0), 'raw_data': {'pricing': 'free'}, 'extra': [1, 2]}
+    validate([tool], List[ToolRecord])
+    decoded = loads(dumps(tool))
+
+    assert decoded['discovered_at'] == '2024-05-01T12:00:00'
+    assert decoded['extra'] == [1, 2]
+    assert decoded['raw_data'] == {'pricing': 'free'}
+
+
+def test_rewrite_fields_added_later_survive_decoding():
+    rewrites = [{'original': 'a', 'rewritten': 'b', 'new_metric': 0.5, 'original_engagement': 12}]
+    validate(rewrites, List[RewriteRecord])
+    decoded = loads(dumps(rewrites))
+
+    assert decoded == rewrites
+    assert isinstance(decoded[0]['original_engagement'], int)
+
+
+def test_invalid_records_are_rejected_before_writing():
+    for bad in ([{'likes': 'many'}], [{'tweet_id': 1, 'content': 5}]):
+        try:
+            validate(bad, List[TweetRecord])
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {bad}")
+    try:
+        loads(b'{"broken": ')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_invalid_snapshot_is_not_published():
+    directory = tempfile.mkdtemp()
+    manifest = SnapshotManifest(directory)
+    try:
+        manifest.write_snapshots({'ai_tweets_data.json': [{'likes': 'many'}]}, schemas={'ai_tweets_data.json': List[TweetRecord]})
+    except ValueError:
+        pass
+    assert manifest.read()['generation'] == 0
+    assert not os.path.exists(os.path.join(directory, 'ai_tweets_data.json'))
+
+
+def test_segmented_log_validates_on_append():
+    log = SegmentedLog(tempfile.mkdtemp(), record_type=TweetRecord)
+    log.append([{'account': 'a', 'timestamp': '2024-01-01T00:00:00', 'likes': 1, 'note': 'kept'}])
+    try:
+        log.append([{'account': 'a', 'timestamp': '2024-01-01T01:00:00', 'likes': 'many'}])
+    except ValueError:
+        pass
+    assert list(log.read()) == [{'account': 'a', 'timestamp': '2024-01-01T00:00:00', 'likes': 1, 'note': 'kept'}]
+
+
+def test_snapshot_loader_reloads_only_new_generations():
+    directory = tempfile.mkdtemp()
+    manifest = SnapshotManifest(directory)
+    loader = SnapshotLoader(directory)
+    manifest.write_snapshots({'ai_tweets_data.json': [{'account': 'a', 'likes': 1, 'note': 'kept'}]})
+
+    first = loader.load('ai_tweets_data.json')
+    assert first == [{'account': 'a', 'likes': 1, 'note': 'kept'}]
+    assert loader.load('ai_tweets_data.json') is first
+
+    manifest.write_snapshots({'ai_tweets_data.json': [{'account': 'b', 'likes': 2}]})
+    assert loader.load('ai_tweets_data.json') == [{'account': 'b', 'likes': 2}]
+    assert loader.load('missing.json', default=[]) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
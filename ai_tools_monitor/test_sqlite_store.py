@@ -0,0 +1,53 @@
+import os
+import tempfile
+from src.models import API
+from src.storage.sqlite_store import SQLiteStore, TOOL_UPSERT, tool_rows
+
+
+def make_store():
+    return SQLiteStore(os.path.join(tempfile.mkdtemp(), 'ai_monitor.db'))
+
+
+def test_tools_are_upserted_by_url():
+    store = make_store()
+    store.upsert_tools([
+        {'name': 'A', 'description': 'first', 'url': 'https://a.ai', 'source': 'x', 'discovered_at': '2024-01-01T00:00:00'},
+        {'name': 'B', 'url': 'https://b.ai', 'source': 'x', 'discovered_at': '2024-01-01T00:00:00'},
+        {'name': 'No URL'}
+    ])
+    saved = store.upsert_tools([
+        {'name': 'A2', 'description': 'second', 'url': 'https://a.ai', 'source': 'y', 'discovered_at': '2024-02-01T00:00:00'}
+    ])
+
+    with store.session() as session:
+        tools = {api.url: api for api in session.query(API)}
+    assert saved == 1
+    assert set(tools) == {'https://a.ai', 'https://b.ai'}
+    assert (tools['https://a.ai'].name, tools['https://a.ai'].source) == ('A2', 'y')
+    # The first sighting is kept
+    assert tools['https://a.ai'].discovered_at.month == 1
+
+
+def test_later_duplicates_win_within_a_batch():
+    rows = tool_rows([
+        {'name': 'old', 'url': 'https://a.ai'},
+        {'name': 'new', 'url': 'https://a.ai'}
+    ])
+    assert [row['name'] for row in rows] == ['new']
+
+
+def test_upsert_runs_in_an_orm_session():
+    # SourceFetcher.save_tools executes the same statement on its session
+    store = make_store()
+    with store.session() as session:
+        for _ in range(2):
+            session.execute(TOOL_UPSERT, tool_rows([{'name': 'A', 'url': 'https://a.ai'}]))
+        session.commit()
+        assert session.query(API).count() == 1
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
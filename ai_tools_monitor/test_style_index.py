@@ -0,0 +1,67 @@
+import numpy as np
+from src.utils.style_index import StyleIndex
+from src.utils.ids import tweet_key
+
+
+def make_tweet(i, content, account='acme'):
+    return {'tweet_id': i, 'account': account, 'content': content}
+
+
+TOP = [
+    make_tweet(1, "Just launched our open source vector database for RAG pipelines"),
+    make_tweet(2, "GPT agents can now browse the web and book your flights"),
+    make_tweet(3, "New diffusion model generates photorealistic images in one second"),
+]
+
+
+def test_nearest_neighbour_is_the_most_similar_tweet():
+    index = StyleIndex()
+    index.add(TOP)
+
+    queries = [
+        make_tweet(10, "We launched an open source vector database for RAG"),
+        make_tweet(11, "This diffusion model generates images in under a second"),
+    ]
+    assert [t['tweet_id'] for t in index.query_batch(queries)] == [1, 3]
+
+
+def test_a_tweet_is_never_matched_with_itself():
+    index = StyleIndex()
+    index.add(TOP[:1])
+    assert index.query(TOP[0]) is None
+
+    index.add(TOP[1:])
+    assert index.query(TOP[0])['tweet_id'] != 1
+
+
+def test_sync_only_touches_the_difference():
+    index = StyleIndex()
+    index.add(TOP)
+    kept = index.vectors[index.keys[tweet_key(TOP[1])]].copy()
+
+    new_top = TOP[1:] + [make_tweet(4, "Voice cloning startup raises a seed round")]
+    index.sync(new_top)
+
+    assert len(index) == 3
+    assert set(index.keys) == {tweet_key(t) for t in new_top}
+    assert np.array_equal(index.vectors[index.keys[tweet_key(TOP[1])]], kept)
+    assert all(index.tweets[index.keys[tweet_key(t)]] is t for t in new_top)
+
+
+def test_tweets_without_ids_are_keyed_by_account_and_content():
+    index = StyleIndex()
+    index.add([{'account': 'a', 'content': 'hello'}, {'account': 'a', 'content': 'hello'}, {'account': 'b', 'content': 'hello'}])
+    assert len(index) == 2
+
+
+def test_embeddings_are_normalised():
+    index = StyleIndex()
+    assert abs(np.linalg.norm(index.embed("some tweet text")) - 1.0) < 1e-5
+    assert not index.embed("").any()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import tempfile
+import aiohttp
+from src.agents.fetchers.topaitools import TopAIToolsFetcher
+from src.utils.content_hash import ContentHashStore
+from src.utils.fetcher_utils import generate_tool_hash
+
+
+def make_tool(page_num, i):
+    return {'name': f"Tool {page_num}-{i}", 'description': '', 'url': f"https://topai.tools/t/{page_num}-{i}", 'raw_data': {}}
+
+
+def make_fetcher(pages, strategy='http', **config):
+    """A fetcher whose listing pages come from `pages` instead of the network."""
+    fetcher = TopAIToolsFetcher({'http_cache': False, **config})
+    fetcher.content_hashes = ContentHashStore(os.path.join(tempfile.mkdtemp(), 'content_hashes.json'))
+    fetcher.fetched = []
+
+    async def fetch_page(page_num, page=None):
+        fetcher.fetched.append(page_num)
+        return pages.get(page_num, [])
+
+    async def no_op(*args):
+        return None
+
+    fetcher.fetch_page = fetch_page
+    fetcher.fetch_strategy = lambda: strategy
+    fetcher.remember_fetch_strategy = lambda strategy: None
+    fetcher.cleanup = no_op
+    return fetcher
+
+
+def test_default_budget_is_one_page_every_two_seconds():
+    assert TopAIToolsFetcher({'http_cache': False}).rate_limiter.calls_per_second == 0.5
+
+
+def test_early_stop_skips_the_rest_of_the_batch():
+    pages = {n: [make_tool(n, i) for i in range(3)] for n in range(1, 5)}
+    fetcher = make_fetcher(pages, requests_per_second=50, page_concurrency=3)
+    fetcher.content_hashes.set('known_tools', fetcher.tools_url, [generate_tool_hash(t) for t in pages[2]])
+
+    tools = asyncio.run(fetcher.fetch())
+
+    assert fetcher.fetched == [1, 2]
+    assert {t['name'] for t in tools} == {t['name'] for t in pages[1] + pages[2]}
+
+
+def test_empty_page_ends_pagination():
+    pages = {1: [make_tool(1, 0)], 2: [], 3: [make_tool(3, 0)]}
+    fetcher = make_fetcher(pages, requests_per_second=50, page_concurrency=3)
+
+    tools = asyncio.run(fetcher.fetch())
+
+    assert fetcher.fetched == [1, 2]
+    assert [t['name'] for t in tools] == ['Tool 1-0']
+
+
+def card_html(*names):
+    cards = ''.join(f'<div class="tool-card"><h3>{n}</h3><a href="/tool/{n}">{n}</a></div>' for n in names)
+    return f"<html><body>{cards}</body></html>"
+
+
+NEXT_DATA_EMPTY = '<html><script id="__NEXT_DATA__" type="application/json">{"props": {"tools": []}}</script></html>'
+
+
+def make_site_fetcher(http_pages, browser_pages=None):
+    """A fetcher that serves `http_pages` (page number -> HTML) over HTTP and `browser_pages` in the browser."""
+    fetcher = TopAIToolsFetcher({'http_cache': False, 'requests_per_second': 50, 'page_concurrency': 3})
+    fetcher.content_hashes = ContentHashStore(os.path.join(tempfile.mkdtemp(), 'content_hashes.json'))
+    fetcher.requested = []
+    fetcher.opened_browser = False
+    loaded = {}
+
+    async def fetch_with_retry(url, max_retries=3):
+        page_num = int(url.rsplit('=', 1)[1])
+        fetcher.requested.append(page_num)
+        return http_pages.get(page_num, card_html())
+
+    async def open_pages(count):
+        fetcher.opened_browser = True
+        return [f"page-{i}" for i in range(count)]
+
+    async def load(url, ready_selector, timeout=30000, page=None):
+        loaded[page] = int(url.rsplit('=', 1)[1])
+
+    async def extract_cards(selector, fields, page=None):
+        names = (browser_pages or {}).get(loaded[page], [])
+        return [{'name': n, 'description': '', 'url': f"/tool/{n}", 'categories': [], 'pricing': None, 'views': None} for n in names]
+
+    async def no_op(*args):
+        return None
+
+    fetcher.fetch_with_retry = fetch_with_retry
+    fetcher.open_pages = open_pages
+    fetcher.load = load
+    fetcher.extract_cards = extract_cards
+    fetcher.cleanup = no_op
+    return fetcher
+
+
+def test_fetch_cards_http_outcomes():
+    fetcher = make_site_fetcher({1: card_html('a', 'b'), 2: '<html><body>loading</body></html>', 3: NEXT_DATA_EMPTY, 4: ''})
+    fields = TopAIToolsFetcher.CARD_FIELDS
+
+    async def run(page_num):
+        return await fetcher.fetch_cards_http(f"{fetcher.tools_url}?page={page_num}", '.tool-card', fields)
+
+    assert [card['name'] for card in asyncio.run(run(1))] == ['a', 'b']
+    assert asyncio.run(run(2)) is None
+    assert asyncio.run(run(3)) == []
+    try:
+        asyncio.run(run(4))
+        assert False, "a failed fetch must raise"
+    except aiohttp.ClientError:
+        pass
+
+
+def test_client_rendered_first_page_escalates_to_browser():
+    fetcher = make_site_fetcher({1: '<html><body><div id="root"></div></body></html>'}, {1: ['a', 'b'], 2: ['c']})
+
+    tools = asyncio.run(fetcher.fetch())
+
+    assert fetcher.opened_browser
+    assert fetcher.requested == [1]
+    assert [t['name'] for t in tools] == ['a', 'b', 'c']
+    assert fetcher.fetch_strategy() == 'browser'
+
+
+def test_empty_later_page_ends_pagination_over_http():
+    fetcher = make_site_fetcher({1: card_html('a'), 2: '<html><body>no more tools</body></html>', 3: card_html('z')})
+
+    tools = asyncio.run(fetcher.fetch())
+
+    assert not fetcher.opened_browser
+    assert [t['name'] for t in tools] == ['a']
+    assert fetcher.fetch_strategy() == 'http'
+    assert fetcher.content_hashes.get('fetch_strategy', fetcher.base_url)['strategy'] == 'http'
+
+
+def test_failed_first_page_does_not_escalate():
+    fetcher = make_site_fetcher({1: ''})
+
+    tools = asyncio.run(fetcher.fetch())
+
+    assert tools == []
+    assert not fetcher.opened_browser
+    assert fetcher.content_hashes.get('fetch_strategy', fetcher.base_url) is None
+
+
+def test_embedded_data_without_tools_does_not_escalate():
+    fetcher = make_site_fetcher({1: NEXT_DATA_EMPTY})
+
+    assert asyncio.run(fetcher.fetch()) == []
+    assert not fetcher.opened_browser
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")